@@ -6,9 +6,15 @@ from game.common.map.tile import Tile
 from game.utils.vector import Vector
 from game.common.map.game_board import GameBoard
 from game.common.avatar import Avatar
+from game.utils.landmarks import LandmarkTable
 import heapq
 
 
+# the techs shop_for_tech buys
+UPGRADES = frozenset({'Improved Drivetrain', 'Improved Mining', 'Superior Drivetrain', 'Superior Mining',
+                      'Overdrive Drivetrain', 'Overdrive Mining'})
+
+
 class State(Enum):
     START = auto()
     MINING = auto()
@@ -35,6 +41,7 @@ class Client(UserClient):
         super().__init__()
         self.not_in_middle = True
         self.prev_position = None
+        self.landmarks = None
 
     def team_name(self):
         """
@@ -55,6 +62,8 @@ class Client(UserClient):
         self.cur_mine_index = 0
         self.max = 14
         self.min = -1
+        # the walls never move, so the landmark distances for the A* heuristic are worked out once
+        self.landmarks = LandmarkTable.from_game_map(world.game_map)
 
 
     # This is where your AI will decide what to do
@@ -85,9 +94,11 @@ class Client(UserClient):
                     actions = [ActionType.MINE]
                 else:
                     near = self.find_around(mobbot.position, world)
-                    actions = self.a_star_search(world.game_map, mobbot.position, near)
+                    actions = self.a_star_search(world.game_map, mobbot.position, near,
+                                                 self.danger_grid(world), self.landmarks)
         elif State.SELLING == self.current_state:
-                actions = self.a_star_search(world.game_map, mobbot.position, self.base_position)
+                actions = self.a_star_search(world.game_map, mobbot.position, self.base_position,
+                                             self.danger_grid(world), self.landmarks)
         elif State.UPGRADING == self.current_state:
             actions = self.shop_for_tech(mobbot)
             self.current_state = State.MINING
@@ -98,7 +109,8 @@ class Client(UserClient):
             
         if turn >= 190:
             self.current_state = State.SELLING
-            actions = self.a_star_search(world.game_map, mobbot.position, self.base_position)
+            actions = self.a_star_search(world.game_map, mobbot.position, self.base_position,
+                                         self.danger_grid(world), self.landmarks)
 
         self.prev_position = mobbot.position
         if actions == None or isinstance(actions, ActionType) or len(actions) == 0:
@@ -108,17 +120,8 @@ class Client(UserClient):
         return actions
     
     def can_purchase(self, mobbot: Avatar, world: GameBoard):
-        total_potential_sp = mobbot.science_points
-        if total_potential_sp >= mobbot.get_tech_info('Improved Drivetrain').cost and not mobbot.is_researched('Improved Drivetrain')\
-        or total_potential_sp >= mobbot.get_tech_info('Improved Mining').cost and not mobbot.is_researched('Improved Mining')\
-        or total_potential_sp >= mobbot.get_tech_info('Superior Drivetrain').cost and not mobbot.is_researched('Superior Drivetrain')\
-        or total_potential_sp >= mobbot.get_tech_info('Superior Mining').cost and not mobbot.is_researched('Superior Mining')\
-        or total_potential_sp >= mobbot.get_tech_info('Overdrive Drivetrain').cost and not mobbot.is_researched('Overdrive Drivetrain')\
-        or total_potential_sp >= mobbot.get_tech_info('Overdrive Mining').cost and not mobbot.is_researched('Overdrive Mining')\
-            :
-            return True
-        return False
-        
+        # one query over the tech tree's researched bitmask instead of looking every upgrade up by name
+        return any(tech_name in UPGRADES for tech_name in mobbot.get_affordable_techs())
 
     def shop_for_tech(self, mobbot: Avatar):
         if not mobbot.is_researched('Improved Mining'):
@@ -147,10 +150,22 @@ class Client(UserClient):
                                 if world.game_map[new_y][new_x].occupied_by != None and world.game_map[new_y][new_x].occupied_by.object_type == ObjectType.ORE_OCCUPIABLE_STATION and world.game_map[new_y][new_x].get_occupied_by(ObjectType.ORE_OCCUPIABLE_STATION).held_item:
                                     return Vector(new_x, new_y)
 
+    def danger_grid(self, world: GameBoard):
+        # older engines don't have a danger field; traps are still avoided as obstacles either way
+        danger_field = getattr(world, 'danger_field', None)
+        return None if danger_field is None else danger_field.grid(self.company)
+
     def get_my_inventory(self, world: GameBoard):
         return world.inventory_manager.get_inventory(self.company)
 
-    def a_star_search(self, map, start, end):
+    def a_star_search(self, map, start, end, danger=None, landmarks=None):
+        # the danger grid is added to the cost of each step, so paths also keep away from the range of hazards
+        # with a LandmarkTable, the heuristic is the larger of the Manhattan and landmark bounds
+        def heuristic(next):
+            if landmarks is None:
+                return abs(end[0] - next[0]) + abs(end[1] - next[1])
+            return landmarks.heuristic(next[1], next[0], end[1], end[0])
+
         def is_valid_tile(next):
             invalid_objects = {
                 ObjectType.WALL, ObjectType.TRAP, ObjectType.AVATAR}
@@ -201,10 +216,11 @@ class Client(UserClient):
                     continue
 
                 new_cost = cost_so_far[current] + 1
+                if danger is not None:
+                    new_cost += danger[next[0]][next[1]]
                 if next not in cost_so_far or new_cost < cost_so_far[next]:
                     cost_so_far[next] = new_cost
-                    priority = new_cost + \
-                        abs(end[0] - next[0]) + abs(end[1] - next[1])
+                    priority = new_cost + heuristic(next)
                     heapq.heappush(open_list, (priority, next))
                     came_from[next] = (action, current)
 
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import random
+import time
+from typing import Any
+
+from game.common.enums import *
+
+# the launcher's game.config.MAX_SECONDS_PER_TURN; game.config only comes with the launcher, which doesn't ship this
+# module, so it can't be imported from here
+SECONDS_PER_TURN: float = 0.2
+
+# well under the turn's budget, so the engine's own work on the turn and a slow machine still fit in it
+DEFAULT_TIME_LIMIT: float = SECONDS_PER_TURN / 2
+
+
+class MCTSNode:
+    """
+    A node of the search tree. ``total`` is the sum of the rewards of every rollout through the node.
+    """
+    __slots__ = ('state', 'parent', 'action', 'children', 'untried', 'visits', 'total')
+
+    def __init__(self, state: Any, parent: MCTSNode | None, action: ActionType | None, untried: list[ActionType]):
+        self.state: Any = state
+        self.parent: MCTSNode | None = parent
+        self.action: ActionType | None = action
+        self.children: dict[ActionType, MCTSNode] = {}
+        self.untried: list[ActionType] = untried
+        self.visits: int = 0
+        self.total: float = 0.0
+
+
+class MCTSClient:
+    """
+    `MCTSClient Class Notes:`
+
+        The MCTSClient is a client that picks its actions with Monte Carlo tree search. It keeps searching until
+        a wall-clock deadline a safety margin before the end of the turn, then returns the most visited actions, so
+        the time limit is used without ever running over it.
+
+        This is an offline tool. A client submitted to the engine can only import the modules in ALLOWED_MODULES,
+        and launcher.pyz doesn't ship this one, so the MCTSClient is for playing matches locally (e.g., with
+        MatchPool) and tuning a search before copying it into a client file. It has the methods the engine calls on
+        a client (``team_name()`` and ``take_turn()``) but doesn't subclass UserClient, which imports game.config.
+
+        -----
+
+        Simulator:
+            A subclass describes the game to search by implementing these methods on its own state objects (e.g.,
+            copies of the GameBoard and Avatar, or a smaller model of them):
+
+                - ``root_state(turn, world, avatar)``: the state to search from
+                - ``legal_actions(state)``: the ActionTypes that can be taken from a state
+                - ``apply(state, action)``: the state after taking the action; must not modify the given state
+                - ``evaluate(state)``: the reward of a state for this client, where more is better
+
+            ``is_terminal()``, ``rollout_action()`` and ``actions_per_turn()`` can be overridden as well.
+
+        -----
+
+        Timing:
+            The deadline is taken as the first thing in ``take_turn()``: ``time_limit - safety_margin`` seconds
+            later. ``time_limit`` defaults to half of the launcher's MAX_SECONDS_PER_TURN (SECONDS_PER_TURN). The
+            clock is checked before every rollout and every rollout step, so the margin only has to cover one step
+            plus returning the actions.
+
+        -----
+
+        Root parallelization:
+            With ``workers`` > 0, that many processes each search their own tree from the same root with a
+            different seed, next to the search in this process. The visit counts and rewards of the root's children
+            are added together to pick the first action. The processes are started with the client and reused on
+            every turn, so starting them doesn't take from any turn's time limit; results that miss the deadline
+            are ignored. Call ``close()`` (or use the client in a with block) when the game is over to stop them.
+            The client and its states must be picklable.
+    """
+
+    def __init__(self, time_limit: float = DEFAULT_TIME_LIMIT, safety_margin: float = 0.03,
+                 exploration: float = math.sqrt(2), rollout_depth: int = 20, workers: int = 0, seed: int | None = None):
+        if time_limit <= safety_margin:
+            raise ValueError(f'{self.__class__.__name__}.time_limit must be greater than the safety_margin.')
+        self.time_limit: float = time_limit
+        self.safety_margin: float = safety_margin
+        self.exploration: float = exploration
+        self.rollout_depth: int = rollout_depth
+        self.workers: int = workers
+        self.random: random.Random = random.Random(seed)
+        # started with the client instead of on the first turn, which would lose that turn's search to the startup
+        self.__pool: Any = multiprocessing.Pool(workers) if workers > 0 else None
+
+    def __getstate__(self) -> dict:
+        state: dict = self.__dict__.copy()
+        state['_MCTSClient__pool'] = None  # the pool stays in the process that made it
+        return state
+
+    def __enter__(self) -> MCTSClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes, waiting for any search still running in them
+        """
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
+
+    def team_name(self) -> str:
+        return self.__class__.__name__
+
+    # Simulator ------------------------------------------------------------------------------------------------------
+
+    def root_state(self, turn, world, avatar) -> Any:
+        raise NotImplementedError("Implement this in subclass")
+
+    def legal_actions(self, state: Any) -> list[ActionType]:
+        raise NotImplementedError("Implement this in subclass")
+
+    def apply(self, state: Any, action: ActionType) -> Any:
+        raise NotImplementedError("Implement this in subclass")
+
+    def evaluate(self, state: Any) -> float:
+        raise NotImplementedError("Implement this in subclass")
+
+    def is_terminal(self, state: Any) -> bool:
+        return False
+
+    def rollout_action(self, state: Any, actions: list[ActionType]) -> ActionType:
+        return self.random.choice(actions)
+
+    def actions_per_turn(self, world, avatar) -> int:
+        return 1
+
+    # Search ---------------------------------------------------------------------------------------------------------
+
+    def take_turn(self, turn, actions, world, avatar):
+        deadline: float = time.perf_counter() + self.time_limit - self.safety_margin
+        state: Any = self.root_state(turn, world, avatar)
+        return self.search(state, deadline, self.actions_per_turn(world, avatar))
+
+    def search(self, state: Any, deadline: float, action_count: int = 1) -> list[ActionType]:
+        """
+        Searches from the given state until the deadline (a time.perf_counter() value) and returns up to
+        action_count actions: the most visited path from the root
+        """
+        pending: list = []
+        if self.workers > 0:
+            if self.__pool is None:
+                self.__pool = multiprocessing.Pool(self.workers)
+            remaining: float = deadline - time.perf_counter() - self.safety_margin
+            pending = [self.__pool.apply_async(_search_root, (self, state, remaining, self.random.getrandbits(32)))
+                       for _ in range(self.workers)]
+
+        root: MCTSNode = self.build_tree(state, deadline)
+        statistics: dict[ActionType, list[float]] = {action: [child.visits, child.total]
+                                                     for action, child in root.children.items()}
+        for result in pending:
+            try:
+                for action, (visits, total) in result.get(max(deadline - time.perf_counter(), 0)).items():
+                    merged: list[float] = statistics.setdefault(action, [0, 0.0])
+                    merged[0] += visits
+                    merged[1] += total
+            except multiprocessing.TimeoutError:
+                continue  # the worker missed the deadline; use what the others found
+
+        if len(statistics) == 0:
+            return []
+
+        first: ActionType = max(statistics, key=lambda action: (statistics[action][0], statistics[action][1]))
+        chosen: list[ActionType] = [first]
+        node: MCTSNode | None = root.children.get(first)
+        while node is not None and len(chosen) < action_count and len(node.children) > 0:
+            node = max(node.children.values(), key=lambda child: (child.visits, child.total))
+            chosen.append(node.action)
+        return chosen
+
+    def build_tree(self, state: Any, deadline: float) -> MCTSNode:
+        """
+        Runs select, expand, rollout and backpropagate until the deadline and returns the root of the tree
+        """
+        root: MCTSNode = MCTSNode(state, None, None, self.__actions_of(state))
+        while time.perf_counter() < deadline:
+            node: MCTSNode = root
+
+            # select
+            while len(node.untried) == 0 and len(node.children) > 0:
+                node = self.__best_child(node)
+
+            # expand
+            if len(node.untried) > 0:
+                action: ActionType = node.untried.pop(self.random.randrange(len(node.untried)))
+                child_state: Any = self.apply(node.state, action)
+                child: MCTSNode = MCTSNode(child_state, node, action, self.__actions_of(child_state))
+                node.children[action] = child
+                node = child
+
+            # rollout
+            reward: float | None = self.__rollout(node.state, deadline)
+            if reward is None:
+                break  # the deadline passed during the rollout
+
+            # backpropagate
+            while node is not None:
+                node.visits += 1
+                node.total += reward
+                node = node.parent
+
+        return root
+
+    def __actions_of(self, state: Any) -> list[ActionType]:
+        return [] if self.is_terminal(state) else list(self.legal_actions(state))
+
+    def __best_child(self, node: MCTSNode) -> MCTSNode:
+        log_visits: float = math.log(max(node.visits, 1))
+        return max(node.children.values(),
+                   key=lambda child: child.total / child.visits
+                   + self.exploration * math.sqrt(log_visits / child.visits))
+
+    def __rollout(self, state: Any, deadline: float) -> float | None:
+        for _ in range(self.rollout_depth):
+            if time.perf_counter() >= deadline:
+                return None
+            if self.is_terminal(state):
+                break
+            actions: list[ActionType] = self.legal_actions(state)
+            if len(actions) == 0:
+                break
+            state = self.apply(state, self.rollout_action(state, actions))
+        return self.evaluate(state)
+
+
+def _search_root(client: MCTSClient, state: Any, remaining: float, seed: int) -> dict[ActionType, tuple[int, float]]:
+    """
+    Runs in a worker process: searches for the remaining seconds and returns the visits and rewards of the root's
+    children
+    """
+    client.random.seed(seed)
+    root: MCTSNode = client.build_tree(state, time.perf_counter() + remaining)
+    return {action: (child.visits, child.total) for action, child in root.children.items()}
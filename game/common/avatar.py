@@ -1,15 +1,15 @@
-from typing import Self
+from __future__ import annotations
+
+from typing import Self, TYPE_CHECKING
 
 from game.common.enums import ObjectType, Company, Tech
 from game.common.game_object import GameObject
-from game.quarry_rush.ability.emp_active_ability import EMPActiveAbility
-from game.quarry_rush.ability.landmine_active_ability import LandmineActiveAbility
-from game.quarry_rush.ability.trap_defusal_active_ability import TrapDefusalActiveAbility
-from game.quarry_rush.tech.tech import TechInfo
 from game.utils.vector import Vector
-from game.quarry_rush.tech.tech_tree import TechTree
-from game.quarry_rush.avatar.avatar_functions import AvatarFunctions
-from game.quarry_rush.ability.dynamite_active_ability import DynamiteActiveAbility
+
+if TYPE_CHECKING:
+    from game.quarry_rush.tech.tech import TechInfo
+    from game.quarry_rush.tech.tech_tree import TechTree
+    from game.quarry_rush.avatar.avatar_functions import AvatarFunctions
 
 
 class Avatar(GameObject):
@@ -142,6 +142,12 @@ class Avatar(GameObject):
     """
 
     def __init__(self, company: Company = Company.CHURCH, position: Vector | None = None):
+        # the abilities are imported here so that importing Avatar (mostly done for type hints) stays cheap
+        from game.quarry_rush.ability.dynamite_active_ability import DynamiteActiveAbility
+        from game.quarry_rush.ability.emp_active_ability import EMPActiveAbility
+        from game.quarry_rush.ability.landmine_active_ability import LandmineActiveAbility
+        from game.quarry_rush.ability.trap_defusal_active_ability import TrapDefusalActiveAbility
+
         super().__init__()
         self.object_type: ObjectType = ObjectType.AVATAR
         self.score: int = 0
@@ -258,6 +264,19 @@ class Avatar(GameObject):
     def get_tech_info(self, tech_name: str | Tech) -> TechInfo | None:
         ...
 
+    def get_affordable_techs(self) -> list[str]:
+        """
+        Returns the names of the techs that can be bought right now: their prerequisite is researched and they cost
+        at most the avatar's science points.
+        """
+        return self.__tech_tree.affordable_techs(self.science_points)
+
+    def get_researched_mask(self) -> int:
+        """
+        Returns the researched techs as a bitmask; see TECH_IDS in tech_tree.py for which bit is which tech.
+        """
+        return self.__tech_tree.researched_mask
+
     # Dynamite placing functionality ----------------------------------------------------------------------------------
     # if avatar calls place dynamite, set to true, i.e. they want to place dynamite
     def can_place_dynamite(self) -> bool:
@@ -274,4 +293,4 @@ class Avatar(GameObject):
 
     # method to return the opposing team based on the avatar's company
     def get_opposing_team(self) -> Company:
-        ...
\ No newline at end of file
+        return Company.CHURCH if self.company is Company.TURING else Company.TURING
\ No newline at end of file
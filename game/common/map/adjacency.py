@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+from game.common.enums import ObjectType
+from game.common.game_object import GameObject
+
+NOT_WALKABLE: int = -1
+
+
+def is_walkable(tile: GameObject) -> bool:
+    """
+    Returns True if an avatar could stand on the tile when nothing else is moving, i.e. the top of the tile's
+    occupied_by stack is either empty or an Avatar
+    """
+    temp: GameObject = tile
+    while hasattr(temp.occupied_by, 'occupied_by'):
+        temp = temp.occupied_by
+    return temp.occupied_by is None or temp.occupied_by.object_type is ObjectType.AVATAR
+
+
+class Adjacency:
+    """
+    `Adjacency Class Notes:`
+
+        The Adjacency class is a precomputed graph of the walkable tiles on the game_map. Walls and stations don't
+        move during a game, so the neighbours of every tile only have to be found once instead of in every search.
+
+        -----
+
+        Nodes:
+            Every walkable tile is a node with an integer id. ``node(x, y)`` returns the id of a tile (or
+            NOT_WALKABLE), and ``position(node)`` turns an id back into (x, y).
+
+        -----
+
+        Neighbours (CSR):
+            The neighbours of every node are stored in one flat array. The neighbours of ``node`` are
+            ``neighbours[offsets[node]:offsets[node + 1]]``; ``neighbour_nodes(node)`` returns that slice. Only the
+            4 directions an avatar can move in are used.
+
+        -----
+
+        K-step neighbours:
+            ``within_steps(node, k)`` returns every node that can be reached in at most k moves, e.g., with
+            ``Avatar.movement_speed`` as k. The results are cached until the Adjacency is rebuilt.
+
+        Avatars are treated as walkable since they move every turn; check for them separately if needed.
+    """
+
+    def __init__(self, game_map: list[list[GameObject]]):
+        self.height: int = len(game_map)
+        self.width: int = len(game_map[0]) if self.height > 0 else 0
+
+        self.nodes: array = array('i', [NOT_WALKABLE]) * (self.width * self.height)  # indexed by y * width + x
+        self.positions: array = array('i')  # node -> y * width + x
+        for y, row in enumerate(game_map):
+            for x, tile in enumerate(row):
+                if is_walkable(tile):
+                    self.nodes[y * self.width + x] = len(self.positions)
+                    self.positions.append(y * self.width + x)
+
+        self.offsets: array = array('i', [0])
+        self.neighbours: array = array('i')
+        for index in self.positions:
+            x: int = index % self.width
+            for neighbour_index, in_bounds in ((index - self.width, index >= self.width),
+                                               (index + 1, x < self.width - 1),
+                                               (index + self.width, index < self.width * (self.height - 1)),
+                                               (index - 1, x > 0)):
+                if in_bounds and self.nodes[neighbour_index] != NOT_WALKABLE:
+                    self.neighbours.append(self.nodes[neighbour_index])
+            self.offsets.append(len(self.neighbours))
+
+        self.__within_steps: dict[tuple[int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def node(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return NOT_WALKABLE
+        return self.nodes[y * self.width + x]
+
+    def position(self, node: int) -> tuple[int, int]:
+        index: int = self.positions[node]
+        return index % self.width, index // self.width
+
+    def neighbour_nodes(self, node: int) -> array:
+        return self.neighbours[self.offsets[node]:self.offsets[node + 1]]
+
+    def within_steps(self, node: int, steps: int) -> list[int]:
+        """
+        Returns every node that can be reached from the given node in at most the given amount of moves,
+        including the node itself
+        """
+        key: tuple[int, int] = (node, steps)
+        cached: list[int] | None = self.__within_steps.get(key)
+        if cached is not None:
+            return cached
+
+        offsets: array = self.offsets
+        neighbours: array = self.neighbours
+        distances: dict[int, int] = {node: 0}
+        queue: deque[int] = deque([node])
+        while queue:
+            current: int = queue.popleft()
+            distance: int = distances[current]
+            if distance == steps:
+                continue
+            for neighbour in neighbours[offsets[current]:offsets[current + 1]]:
+                if neighbour not in distances:
+                    distances[neighbour] = distance + 1
+                    queue.append(neighbour)
+
+        reached: list[int] = list(distances)
+        self.__within_steps[key] = reached
+        return reached
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+
+
+class Bitboards:
+    """
+    `Bitboards Class Notes:`
+
+        Bitboards store one layer of the game_map as a single Python int, with bit ``y * width + x`` set for every
+        tile that has something of the layer's ObjectType. Questions about sets of tiles then become bitwise
+        operations on ints instead of loops over Tiles.
+
+        -----
+
+        Layers:
+            There is a layer for every ObjectType found in a tile's occupied_by stack (e.g., WALL, DYNAMITE, AVATAR,
+            LANDMINE, EMP, CHURCH_STATION) and for the ObjectType of every held item (e.g., COPIUM, LAMBDIUM,
+            TURITE, ANCIENT_TECH). ``traps(company)`` holds the traps owned by a company, and ``walkable`` has the
+            tiles whose occupied_by stack ends in nothing or an Avatar.
+
+        -----
+
+        Queries:
+            ``reachable()`` floods outwards from a tile one move at a time with shifts, and ``within_range()``
+            grows a layer by a Manhattan distance, like ``Trap.in_range()``. For example, the tiles that can be
+            reached in 2 moves, have Lambdium, and are out of range of the other company's landmines:
+            ::
+                boards.reachable(x, y, 2) & boards.layer(ObjectType.LAMBDIUM) \\
+                    & ~boards.within_range(boards.traps(Company.TURING), 1)
+
+        -----
+
+        Updates:
+            The Bitboards are a snapshot of the game_map when they were built. ``set()`` and ``clear()`` change a
+            single bit when something is placed or removed, so they can be kept up to date without rebuilding.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width: int = width
+        self.height: int = height
+        self.full: int = (1 << (width * height)) - 1
+
+        first_column: int = 0
+        for y in range(height):
+            first_column |= 1 << (y * width)
+        self.__not_first_column: int = self.full & ~first_column
+        self.__not_last_column: int = self.full & ~(first_column << (width - 1))
+
+        self.walkable: int = self.full
+        self.__layers: dict[ObjectType, int] = {}
+        self.__traps: dict[Company, int] = {company: 0 for company in Company}
+
+    @classmethod
+    def from_game_map(cls, game_map: list[list[GameObject]]) -> Bitboards:
+        height: int = len(game_map)
+        width: int = len(game_map[0]) if height > 0 else 0
+        boards: Bitboards = cls(width, height)
+        layers: dict[ObjectType, int] = boards.__layers
+        blocked: int = 0
+
+        for y, row in enumerate(game_map):
+            for x, tile in enumerate(row):
+                bit: int = 1 << (y * width + x)
+                temp: GameObject | None = tile.occupied_by
+                while temp is not None:
+                    layers[temp.object_type] = layers.get(temp.object_type, 0) | bit
+
+                    held_item: GameObject | None = getattr(temp, 'held_item', None)
+                    if held_item is not None:
+                        layers[held_item.object_type] = layers.get(held_item.object_type, 0) | bit
+
+                    owner_company: Company | None = getattr(temp, 'owner_company', None)
+                    if owner_company is not None:
+                        boards.__traps[owner_company] |= bit
+
+                    if not hasattr(temp, 'occupied_by'):
+                        if temp.object_type is not ObjectType.AVATAR:
+                            blocked |= bit
+                        break
+                    temp = temp.occupied_by
+
+        boards.walkable = boards.full & ~blocked
+        return boards
+
+    def bit(self, x: int, y: int) -> int:
+        return 1 << (y * self.width + x)
+
+    def layer(self, object_type: ObjectType) -> int:
+        return self.__layers.get(object_type, 0)
+
+    def traps(self, company: Company) -> int:
+        """
+        Returns the bits of the traps owned by the given company
+        """
+        return self.__traps[company]
+
+    def set(self, object_type: ObjectType, x: int, y: int) -> None:
+        self.__layers[object_type] = self.layer(object_type) | self.bit(x, y)
+
+    def clear(self, object_type: ObjectType, x: int, y: int) -> None:
+        self.__layers[object_type] = self.layer(object_type) & ~self.bit(x, y)
+
+    def expand(self, bits: int, allowed: int | None = None) -> int:
+        """
+        Returns the given bits plus every tile one move away from them, limited to the allowed bits
+        """
+        grown: int = bits | (bits << self.width) | (bits >> self.width) \
+            | ((bits << 1) & self.__not_first_column) | ((bits >> 1) & self.__not_last_column)
+        return grown & (self.full if allowed is None else allowed)
+
+    def reachable(self, x: int, y: int, steps: int, allowed: int | None = None) -> int:
+        """
+        Returns the tiles that can be reached from (x, y) in at most the given amount of moves, only moving through
+        allowed tiles (walkable tiles by default)
+        """
+        allowed = self.walkable if allowed is None else allowed
+        frontier: int = self.bit(x, y)
+        for _ in range(steps):
+            grown: int = self.expand(frontier, allowed) | frontier
+            if grown == frontier:
+                break
+            frontier = grown
+        return frontier
+
+    def within_range(self, bits: int, distance: int) -> int:
+        """
+        Returns every tile within the given Manhattan distance of the given bits, ignoring walls
+        """
+        for _ in range(distance):
+            bits = self.expand(bits)
+        return bits
+
+    def positions(self, bits: int) -> list[tuple[int, int]]:
+        """
+        Returns the (x, y) of every set bit
+        """
+        result: list[tuple[int, int]] = []
+        while bits:
+            lowest: int = bits & -bits
+            index: int = lowest.bit_length() - 1
+            result.append((index % self.width, index // self.width))
+            bits ^= lowest
+        return result
+
+    @staticmethod
+    def count(bits: int) -> int:
+        return bits.bit_count()
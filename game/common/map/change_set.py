@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from itertools import zip_longest
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+from game.utils.vector import Vector
+
+
+class ChangeSet:
+    """
+    `ChangeSet Class Notes:`
+
+        A ChangeSet is what changed on the GameBoard since the previous turn, so a client can update its own
+        structures (distance maps, ore indexes, an ObservationEncoder) instead of scanning the whole board:
+
+            - ``tiles``: the (x, y) of every tile whose occupied_by stack changed, including held items (e.g., an
+              ore that was mined, a trap that was placed or set off)
+            - ``inventory_slots``: for each company, the indexes of the inventory slots that changed
+            - ``avatar_positions``: for each company whose avatar moved, its new position
+
+        If ``full`` is True there is nothing to compare against (e.g., the first turn), and everything should be
+        treated as changed.
+    """
+
+    def __init__(self, turn: int, full: bool = False, tiles: list[tuple[int, int]] | None = None,
+                 inventory_slots: dict[Company, list[int]] | None = None,
+                 avatar_positions: dict[Company, Vector | None] | None = None):
+        self.turn: int = turn
+        self.full: bool = full
+        self.tiles: list[tuple[int, int]] = [] if tiles is None else tiles
+        self.inventory_slots: dict[Company, list[int]] = {} if inventory_slots is None else inventory_slots
+        self.avatar_positions: dict[Company, Vector | None] = {} if avatar_positions is None else avatar_positions
+
+    def __len__(self) -> int:
+        return len(self.tiles) + sum(len(slots) for slots in self.inventory_slots.values()) \
+            + len(self.avatar_positions)
+
+    def moved(self, company: Company) -> bool:
+        return company in self.avatar_positions
+
+    def to_json(self) -> dict:
+        return {
+            'turn': self.turn,
+            'full': self.full,
+            'tiles': [list(position) for position in self.tiles],
+            'inventory_slots': {company.name: slots for company, slots in self.inventory_slots.items()},
+            'avatar_positions': {company.name: None if position is None else [position.x, position.y]
+                                 for company, position in self.avatar_positions.items()},
+        }
+
+
+class ChangeTracker:
+    """
+    `ChangeTracker Class Notes:`
+
+        The ChangeTracker builds a ChangeSet once per turn by comparing the board against what it saw on the previous
+        call. Every tile is summarized by the ids of the objects in its occupied_by stack and their held items, and
+        every inventory slot by the id of its item, so the scan is done once on the server instead of once per client.
+        Nothing is cached between the mutations and the scan, so it is right however the board was changed.
+    """
+
+    def __init__(self):
+        self.__tiles: list[tuple] | None = None
+        self.__inventories: dict[Company, list[str | None]] = {}
+        self.__avatar_positions: dict[Company, tuple[int, int] | None] = {}
+
+    def reset(self) -> None:
+        self.__tiles = None
+        self.__inventories = {}
+        self.__avatar_positions = {}
+
+    def collect(self, turn: int, game_map: list[list[GameObject]],
+                inventories: dict[Company, list[GameObject | None]]) -> ChangeSet:
+        """
+        Compares the game_map and the given inventories against the previous call. A company missing from
+        inventories is treated as having an empty inventory.
+        """
+        full: bool = self.__tiles is None
+        tiles: list[tuple] = []
+        changed_tiles: list[tuple[int, int]] = []
+        avatar_positions: dict[Company, tuple[int, int] | None] = {company: None for company in Company}
+
+        width: int = 0
+        for y, row in enumerate(game_map):
+            width = len(row)
+            for x, tile in enumerate(row):
+                signature: list[str | None] = []
+                temp: GameObject | None = tile.occupied_by
+                while temp is not None:
+                    if temp.object_type is ObjectType.AVATAR:
+                        avatar_positions[temp.company] = (x, y)  # avatars are reported by position, not as tiles
+                    else:
+                        signature.append(temp.id)
+                        held_item: GameObject | None = getattr(temp, 'held_item', None)
+                        if held_item is not None:
+                            signature.append(held_item.id)
+                    temp = getattr(temp, 'occupied_by', None)
+                tiles.append(tuple(signature))
+
+        if not full:
+            changed_tiles = [(index % width, index // width)
+                             for index, (old, new) in enumerate(zip(self.__tiles, tiles)) if old != new]
+        self.__tiles = tiles
+
+        inventory_slots: dict[Company, list[int]] = {}
+        for company in Company:
+            inventory: list[str | None] = [None if item is None else item.id
+                                           for item in inventories.get(company, [])]
+            previous: list[str | None] | None = self.__inventories.get(company)
+            if previous is not None:
+                slots: list[int] = [slot for slot, (old, new) in enumerate(zip_longest(previous, inventory))
+                                    if old != new]
+                if len(slots) > 0:
+                    inventory_slots[company] = slots
+            self.__inventories[company] = inventory
+
+        moved: dict[Company, Vector | None] = {}
+        for company, position in avatar_positions.items():
+            if full or self.__avatar_positions.get(company) != position:
+                moved[company] = None if position is None else Vector(*position)
+        self.__avatar_positions = avatar_positions
+
+        return ChangeSet(turn, full, changed_tiles, inventory_slots, moved)
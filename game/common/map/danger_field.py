@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+from game.utils.vector import Vector
+
+if TYPE_CHECKING:
+    from game.quarry_rush.entity.placeable.dynamite import Dynamite
+    from game.quarry_rush.entity.placeable.traps import Trap
+
+# extra movement cost added to every tile in range of a hazard
+DANGER_WEIGHTS: dict[ObjectType, int] = {
+    ObjectType.LANDMINE: 5,
+    ObjectType.EMP: 8,
+    ObjectType.DYNAMITE: 2,
+}
+
+
+class DangerField:
+    """
+    `DangerField Class Notes:`
+
+        The DangerField keeps a grid of extra movement costs for each Company. A tile's cost is the sum of the weights
+        of every hazard that could affect that Company on that tile:
+
+            - Traps add their weight to every tile within their range for the trap's target company
+            - Dynamite adds its weight to every tile in its blast for the company that doesn't own it, since the ores
+              there will go to the dynamite's owner
+
+        Ranges use the same Manhattan distance as ``Trap.in_range()``.
+
+        -----
+
+        Incremental updates:
+            When a hazard is added, its footprint is remembered by the hazard's id. Removing it (after it is defused
+            or detonates) subtracts the same footprint, so only the tiles around that hazard are touched.
+
+            ``sync_tile()`` makes the hazards at a coordinate match the ones in that tile's occupied_by stack, so
+            ``GameBoard.collect_changes()`` keeps the field right however the traps and dynamite were placed or
+            taken off the board, by only looking at the tiles that changed.
+
+        -----
+
+        Pathfinding:
+            ``grid(company)`` returns a list[list[int]] indexed like ``GameBoard.game_map`` (``[y][x]``). Adding its
+            value to the cost of stepping onto a tile gives risk-aware paths from a single search.
+    """
+
+    def __init__(self, map_size: Vector = Vector()):
+        self.map_size: Vector = map_size
+        self.__grids: dict[Company, list[list[int]]] = {
+            company: [[0] * map_size.x for _ in range(map_size.y)] for company in Company}
+        self.__hazards: dict[str, tuple[Company, int, int, int, int]] = {}
+        self.__tile_hazards: dict[tuple[int, int], set[str]] = {}  # the ids of the hazards added at each coordinate
+
+    def grid(self, company: Company) -> list[list[int]]:
+        """
+        Returns the danger grid for the given company. It is indexed with ``[y][x]`` and shouldn't be modified.
+        """
+        return self.__grids[company]
+
+    def cost(self, company: Company, position: Vector) -> int:
+        return self.__grids[company][position.y][position.x]
+
+    def add(self, hazard: Trap | Dynamite) -> None:
+        """
+        Adds the given trap or dynamite to the field. Adding a hazard that's already in the field does nothing.
+        """
+        # imported here so a GameBoard, which makes a DangerField, doesn't load the placeables when imported
+        from game.quarry_rush.entity.placeable.dynamite import Dynamite
+        from game.quarry_rush.entity.placeable.traps import Trap
+
+        if hazard.id in self.__hazards:
+            return
+
+        if isinstance(hazard, Trap):
+            company: Company = hazard.target_company
+            radius: int = hazard.range
+        elif isinstance(hazard, Dynamite):
+            company = Company.CHURCH if hazard.company is Company.TURING else Company.TURING
+            radius = max(hazard.blast_radius, 1)
+        else:
+            raise ValueError(f'{self.__class__.__name__} can only add a Trap or Dynamite.')
+
+        weight: int = DANGER_WEIGHTS.get(hazard.object_type, DANGER_WEIGHTS[ObjectType.LANDMINE])
+        self.__hazards[hazard.id] = (company, hazard.position.x, hazard.position.y, radius, weight)
+        self.__tile_hazards.setdefault((hazard.position.x, hazard.position.y), set()).add(hazard.id)
+        self.__apply(company, hazard.position.x, hazard.position.y, radius, weight)
+
+    def remove(self, hazard: GameObject) -> bool:
+        """
+        Removes the given trap or dynamite from the field. Returns False if it was never added.
+        """
+        return self.__remove_id(hazard.id)
+
+    def sync_tile(self, x: int, y: int, tile: GameObject) -> None:
+        """
+        Adds the traps and unexploded dynamite in the tile's occupied_by stack, and removes the hazards that were
+        added at this coordinate but aren't in the stack anymore.
+        """
+        from game.quarry_rush.entity.placeable.dynamite import Dynamite
+        from game.quarry_rush.entity.placeable.traps import Trap
+
+        found: list[GameObject] = []
+        temp: GameObject | None = tile.occupied_by
+        while temp is not None:
+            # dynamite that can explode is taken out by GameBoard.advance_timers, and stays out until it's removed
+            if isinstance(temp, Trap) or isinstance(temp, Dynamite) and not temp.can_explode:
+                found.append(temp)
+            temp = getattr(temp, 'occupied_by', None)
+
+        ids: set[str] = {hazard.id for hazard in found}
+        for hazard_id in [hazard_id for hazard_id in self.__tile_hazards.get((x, y), ()) if hazard_id not in ids]:
+            self.__remove_id(hazard_id)
+        for hazard in found:
+            self.add(hazard)
+
+    def __remove_id(self, hazard_id: str) -> bool:
+        footprint: tuple[Company, int, int, int, int] | None = self.__hazards.pop(hazard_id, None)
+        if footprint is None:
+            return False
+
+        company, x, y, radius, weight = footprint
+        at: set[str] = self.__tile_hazards[(x, y)]
+        at.discard(hazard_id)
+        if len(at) == 0:
+            del self.__tile_hazards[(x, y)]
+        self.__apply(company, x, y, radius, -weight)
+        return True
+
+    def __apply(self, company: Company, center_x: int, center_y: int, radius: int, weight: int) -> None:
+        grid: list[list[int]] = self.__grids[company]
+        for y in range(max(center_y - radius, 0), min(center_y + radius + 1, self.map_size.y)):
+            reach: int = radius - abs(y - center_y)
+            row: list[int] = grid[y]
+            for x in range(max(center_x - reach, 0), min(center_x + reach + 1, self.map_size.x)):
+                row[x] += weight
+
+    def __len__(self) -> int:
+        return len(self.__hazards)
@@ -1,22 +1,56 @@
 from __future__ import annotations
 
 import random
-from typing import Self, Callable
+from itertools import repeat
+from typing import Self, Callable, Iterable, TYPE_CHECKING
 
-from game.common.avatar import Avatar
 from game.common.enums import *
 from game.common.game_object import GameObject
+from game.common.map.change_set import ChangeSet, ChangeTracker
+from game.common.map.danger_field import DangerField
+from game.common.map.sparse_game_map import SparseGameMap
 from game.common.map.tile import Tile
-from game.common.map.wall import Wall
-from game.common.stations.occupiable_station import OccupiableStation
-from game.common.stations.station import Station
 from game.quarry_rush.avatar.inventory_manager import InventoryManager
-from game.quarry_rush.entity.placeable.dynamite import Dynamite
-from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+from game.utils.lazy_import import lazy_getattr
+from game.utils.timer_wheel import TimerWheel
 from game.utils.vector import Vector
-from game.quarry_rush.entity.placeable.traps import Trap
-from game.quarry_rush.station.company_station import TuringStation, ChurchStation
-from game.quarry_rush.entity.placeable.traps import EMP, Landmine
+
+if TYPE_CHECKING:
+    from game.common.avatar import Avatar
+    from game.common.map.adjacency import Adjacency
+    from game.common.map.bitboards import Bitboards
+    from game.common.map.reachability import Reachability
+    from game.common.map.wall import Wall
+    from game.common.map.zobrist import ZobristHash, ZobristTracker
+    from game.common.stations.occupiable_station import OccupiableStation
+    from game.common.stations.station import Station
+    from game.quarry_rush.ability.active_ability import ActiveAbility
+    from game.quarry_rush.entity.placeable.dynamite import Dynamite
+    from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+    from game.quarry_rush.entity.placeable.traps import Trap
+    from game.quarry_rush.station.company_station import TuringStation, ChurchStation
+    from game.quarry_rush.entity.placeable.traps import EMP, Landmine
+
+# only needed once a map is generated or searched, so they are imported on first use to keep this import cheap
+__getattr__ = lazy_getattr(__name__, {
+    'Avatar': 'game.common.avatar',
+    'Adjacency': 'game.common.map.adjacency',
+    'Bitboards': 'game.common.map.bitboards',
+    'Reachability': 'game.common.map.reachability',
+    'Wall': 'game.common.map.wall',
+    'ZobristHash': 'game.common.map.zobrist',
+    'ZobristTracker': 'game.common.map.zobrist',
+    'OccupiableStation': 'game.common.stations.occupiable_station',
+    'Station': 'game.common.stations.station',
+    'ActiveAbility': 'game.quarry_rush.ability.active_ability',
+    'Dynamite': 'game.quarry_rush.entity.placeable.dynamite',
+    'OreOccupiableStation': 'game.quarry_rush.station.ore_occupiable_station',
+    'Trap': 'game.quarry_rush.entity.placeable.traps',
+    'EMP': 'game.quarry_rush.entity.placeable.traps',
+    'Landmine': 'game.quarry_rush.entity.placeable.traps',
+    'TuringStation': 'game.quarry_rush.station.company_station',
+    'ChurchStation': 'game.quarry_rush.station.company_station',
+})
 
 
 class GameBoard(GameObject):
@@ -67,8 +101,8 @@ class GameBoard(GameObject):
             If you want to assign multiple GameObjects to different coordinates, use a key-value
             pair of any length.
 
-            **NOTE**: The length of the tuple and list *MUST* be equal, otherwise it will not
-            work. In this case, the assignments will be random. An example of this would be the following:
+            **NOTE**: The length of the tuple and list *MUST* be equal, otherwise a ValueError is
+            raised. In this case, the assignments will be random. An example of this would be the following:
             ::
                 locations =
                 {
@@ -83,6 +117,10 @@ class GameBoard(GameObject):
             If station_0 is randomly assigned at (1, 1), station_1 could be at (2, 2), then station_2 will be at (0, 0).
             This is just one case of what could happen.
 
+        A single Vector can also be given several GameObjects, which are stacked on that tile in order (e.g., a
+        base station and the avatar that starts on it). Any other key whose length differs from its value's raises
+        a ValueError.
+
         Lastly, another example will be shown to explain that you can combine both static and
         dynamic assignments in the same dictionary:
         ::
@@ -107,6 +145,8 @@ class GameBoard(GameObject):
         For example, let the dimensions of the map be (5, 7). There will be wall Objects horizontally across
         x = 0 and x = 4. There will also be wall Objects vertically at y = 0 and y = 6
 
+        Every boundary tile holds the same ``Wall.shared()`` instance, since walls have no state of their own.
+
         Below is a visual example of this, with 'x' being where the wall Objects are.
 
         Example:
@@ -118,14 +158,27 @@ class GameBoard(GameObject):
             x       x
             x       x
             x x x x x   y = 6
+
+    -----
+
+    Sparse:
+    -------
+        This is a bool value that makes the game_map a SparseGameMap instead of a list[list[Tile]]. Only the tiles
+        that have something on them are stored, and every empty coordinate returns one shared, empty Tile. This is
+        meant for very large maps, where creating a Tile for every coordinate takes most of the memory and time.
+
+        ``game_map[y][x]`` works the same in both modes. However, an empty coordinate's Tile can't be occupied, so
+        anything placing objects on a sparse map has to use ``SparseGameMap.tile_for_write()`` or
+        ``SparseGameMap.place()``. Refer to sparse_game_map.py for more details.
     """
 
     def __init__(self, seed: int | None = None, map_size: Vector = Vector(),
-                 locations: dict[tuple[Vector]:list[GameObject]] | None = None, walled: bool = False):
+                 locations: dict[tuple[Vector]:list[GameObject]] | None = None, walled: bool = False,
+                 sparse: bool = False):
 
         super().__init__()
         # game_map is initially going to be None. Since generation is slow, call generate_map() as needed
-        self.game_map: list[list[Tile]] | None = None
+        self.game_map: list[list[Tile]] | SparseGameMap | None = None
         self.seed: int | None = seed
         random.seed(seed)
         self.object_type: ObjectType = ObjectType.GAMEBOARD
@@ -134,7 +187,16 @@ class GameBoard(GameObject):
         # when passing Vectors as a tuple, end the tuple of Vectors with a comma so it is recognized as a tuple
         self.locations: dict | None = locations
         self.walled: bool = walled
+        self.sparse: bool = sparse
         self.inventory_manager: InventoryManager = InventoryManager()
+        # schedules fuses and cooldowns by the turn they expire on; advanced once at the end of every turn
+        self.timer_wheel: TimerWheel = TimerWheel()
+        self.__adjacency: Adjacency | None = None  # built the first time it is used; see the adjacency property
+        self.__reachability: Reachability | None = None
+        # what changed during the last turn, for clients to update their own structures with; see collect_changes
+        self.changes: ChangeSet | None = None
+        self.__change_tracker: ChangeTracker = ChangeTracker()
+        self.__zobrist_tracker: ZobristTracker | None = None  # made the first time zobrist is read
 
     @property
     def seed(self) -> int:
@@ -149,16 +211,19 @@ class GameBoard(GameObject):
         self.__seed = seed
 
     @property
-    def game_map(self) -> list[list[Tile]] | None:
+    def game_map(self) -> list[list[Tile]] | SparseGameMap | None:
         return self.__game_map
 
     @game_map.setter
-    def game_map(self, game_map: list[list[Tile]]) -> None:
+    def game_map(self, game_map: list[list[Tile]] | SparseGameMap) -> None:
+        if isinstance(game_map, SparseGameMap):
+            self.__game_map = game_map
+            return
         if game_map is not None and (not isinstance(game_map, list) or
                                      any(map(lambda l: not isinstance(l, list), game_map)) or
                                      any([any(map(lambda g: not isinstance(g, Tile), tile_list))
                                           for tile_list in game_map])):
-            raise ValueError(f'{self.__class__.__name__}.game_map must be a list[list[Tile]].')
+            raise ValueError(f'{self.__class__.__name__}.game_map must be a list[list[Tile]] or a SparseGameMap.')
         self.__game_map = game_map
 
     @property
@@ -172,6 +237,9 @@ class GameBoard(GameObject):
         if map_size is None or not isinstance(map_size, Vector):
             raise ValueError(f'{self.__class__.__name__}.map_size must be a Vector.')
         self.__map_size = map_size
+        # also makes the danger_field: the extra movement cost per tile from traps and dynamite. The grids are sized
+        # from the map, so they're made again whenever the size changes; collect_changes keeps them up to date
+        self.danger_field = DangerField(map_size)
 
     @property
     def locations(self) -> dict:
@@ -184,11 +252,14 @@ class GameBoard(GameObject):
         if locations is not None and not isinstance(locations, dict):
             raise ValueError("Locations must be a dict. The key must be a tuple of Vector Objects, and the "
                              "value a list of GameObject.")
-        # if locations is not None:
-        #     for k, v in locations.items():
-        #         if len(k) != len(v):
-        #             raise ValueError("Cannot set the locations for the game_board. A key has a different "
-        #                              "length than its key.")
+        if locations is not None:
+            for k, v in locations.items():
+                if len(k) == 0 or len(v) == 0:
+                    raise ValueError("Cannot set the locations for the game_board. A key or its value is empty.")
+                # a single Vector may hold a stack of GameObjects; more Vectors are assigned one GameObject each
+                if len(k) > 1 and len(k) != len(v):
+                    raise ValueError("Cannot set the locations for the game_board. A key has a different "
+                                     "length than its value.")
 
         self.__locations = locations
 
@@ -205,6 +276,272 @@ class GameBoard(GameObject):
 
         self.__walled = walled
 
+    @property
+    def sparse(self) -> bool:
+        return self.__sparse
+
+    @sparse.setter
+    def sparse(self, sparse: bool) -> None:
+        if self.game_map is not None:
+            raise RuntimeError(f'{self.__class__.__name__} variables cannot be changed once generate_map is run.')
+        if sparse is None or not isinstance(sparse, bool):
+            raise ValueError(f'{self.__class__.__name__}.sparse must be a bool.')
+
+        self.__sparse = sparse
+
+    @property
+    def changes(self) -> ChangeSet | None:
+        return self.__changes
+
+    @changes.setter
+    def changes(self, changes: ChangeSet | None) -> None:
+        if changes is not None and not isinstance(changes, ChangeSet):
+            raise ValueError(f'{self.__class__.__name__}.changes must be a ChangeSet or None.')
+        self.__changes = changes
+
+    @property
+    def timer_wheel(self) -> TimerWheel:
+        return self.__timer_wheel
+
+    @timer_wheel.setter
+    def timer_wheel(self, timer_wheel: TimerWheel) -> None:
+        if timer_wheel is None or not isinstance(timer_wheel, TimerWheel):
+            raise ValueError(f'{self.__class__.__name__}.timer_wheel must be a TimerWheel.')
+        self.__timer_wheel = timer_wheel
+
+    @property
+    def danger_field(self) -> DangerField:
+        return self.__danger_field
+
+    @danger_field.setter
+    def danger_field(self, danger_field: DangerField) -> None:
+        if danger_field is None or not isinstance(danger_field, DangerField):
+            raise ValueError(f'{self.__class__.__name__}.danger_field must be a DangerField.')
+        self.__danger_field = danger_field
+
+    @property
+    def adjacency(self) -> Adjacency:
+        """
+        The walkable tiles of the game_map as a graph, shared by every pathfinding and search method. It is built the
+        first time it is used and kept until ``invalidate_adjacency()`` is called.
+        """
+        if self.__adjacency is None:
+            from game.common.map.adjacency import Adjacency
+
+            if self.game_map is None:
+                raise RuntimeError(f'{self.__class__.__name__}.adjacency needs generate_map to be run first.')
+            self.__adjacency = Adjacency(self.game_map)
+        return self.__adjacency
+
+    @property
+    def reachability(self) -> Reachability:
+        """
+        Reachable tiles and interception paths over the adjacency. Its distance maps are cached across turns and
+        dropped by ``invalidate_adjacency()``, which ``collect_changes()`` calls when a tile's walkability changed.
+        """
+        if self.__reachability is None:
+            from game.common.map.reachability import Reachability
+
+            self.__reachability = Reachability(self.adjacency, self.game_map)
+        return self.__reachability
+
+    def invalidate_adjacency(self) -> None:
+        """
+        Call this whenever a wall or station is added to or removed from the game_map
+        """
+        self.__adjacency = None
+        self.__reachability = None
+
+    @property
+    def zobrist(self) -> ZobristHash:
+        """
+        The 64-bit hash of the board state. The tiles written since the last read are hashed again, so a read costs
+        as much as the changes made since the last one; see ZobristTracker in zobrist.py for which writes are seen.
+        A search that applies its own moves should read it once and update that copy with the ZobristHash methods.
+        """
+        from game.common.map.zobrist import ZobristTracker
+
+        if self.game_map is None:
+            raise RuntimeError(f'{self.__class__.__name__}.zobrist needs generate_map to be run first.')
+        if self.__zobrist_tracker is None:
+            self.__zobrist_tracker = ZobristTracker(self.game_map)
+        return self.__zobrist_tracker.update(self.game_map, self.__inventories())
+
+    def tile_for_write(self, x: int, y: int) -> Tile:
+        """
+        Returns the Tile at the coordinate to be written to; on a sparse map it is created if the coordinate was
+        empty. The tile is marked as changed for the zobrist hash.
+        """
+        if self.game_map is None:
+            raise RuntimeError(f'{self.__class__.__name__}.tile_for_write needs generate_map to be run first.')
+        tile: Tile = self.game_map.tile_for_write(x, y) if self.sparse else self.game_map[y][x]
+        self.mark_changed(x, y)
+        return tile
+
+    def place(self, x: int, y: int, game_object: GameObject) -> None:
+        """
+        Places the given GameObject on top of the coordinate's occupied_by stack
+        """
+        temp: GameObject = self.tile_for_write(x, y)
+
+        while temp.occupied_by is not None and hasattr(temp.occupied_by, 'occupied_by'):
+            temp = temp.occupied_by
+
+        if temp.occupied_by is not None:
+            raise ValueError("Last item on the given tile doesn't have the 'occupied_by' attribute.")
+
+        temp.occupied_by = game_object
+
+    def place_dynamite(self, dynamite: Dynamite, ability: ActiveAbility | None = None) -> None:
+        """
+        Places the dynamite on its position, schedules its fuse on the timer_wheel, and adds its blast to the
+        danger_field; ``advance_timers()`` returns it on the turn it explodes. The ability that placed it, if given,
+        starts its cooldown on the same wheel.
+        """
+        self.place(dynamite.position.x, dynamite.position.y, dynamite)
+        dynamite.start_fuse(self.timer_wheel)
+        self.danger_field.add(dynamite)
+        if ability is not None:
+            ability.start_fuse(self.timer_wheel)
+
+    def mark_changed(self, x: int, y: int) -> None:
+        """
+        Call this after changing a tile's occupied_by stack without ``place()`` or ``tile_for_write()``
+        """
+        if self.__zobrist_tracker is not None:
+            self.__zobrist_tracker.mark(x, y)
+
+    def __inventories(self) -> dict[Company, list[GameObject | None]]:
+        # the inventory of every company the inventory_manager has one for; a manager whose inventories were never
+        # set up has none, and is treated as empty
+        inventories: dict[Company, list[GameObject | None]] = {}
+        for company in Company:
+            try:
+                inventories[company] = self.inventory_manager.get_inventory(company)
+            except (AttributeError, KeyError):
+                continue
+        return inventories
+
+    def generate_map(self) -> None:
+        """
+        Builds the game_map from map_size, walled, and locations. Every dynamic group of locations is shuffled in
+        a single pass of the seeded ``random`` module, and each GameObject is written straight onto the top of its
+        tile's stack.
+        """
+        if self.game_map is not None:
+            raise RuntimeError(f'{self.__class__.__name__}.generate_map can only be run once.')
+        from game.common.map.wall import Wall
+
+        width: int = self.map_size.x
+        height: int = self.map_size.y
+        game_map: list[list[Tile]] | SparseGameMap = SparseGameMap(width, height) if self.sparse \
+            else [[Tile() for _ in range(width)] for _ in range(height)]
+        tile_at: Callable[[int, int], Tile] = game_map.tile_for_write if self.sparse \
+            else lambda x, y: game_map[y][x]
+
+        if self.walled:
+            wall: Wall = Wall.shared()
+            for x in range(width):
+                tile_at(x, 0).occupied_by = wall
+                tile_at(x, height - 1).occupied_by = wall
+            for y in range(1, height - 1):
+                tile_at(0, y).occupied_by = wall
+                tile_at(width - 1, y).occupied_by = wall
+
+        if self.locations:
+            self.__populate_map(tile_at)
+        self.game_map = game_map
+
+    def __populate_map(self, tile_at: Callable[[int, int], Tile]) -> None:
+        # every Vector of a dynamic group gets one draw offset by its group's index, so a single sort shuffles each
+        # group within its own range instead of calling random.sample once per key
+        dynamic: list[tuple[Vector]] = [k for k in self.locations if len(k) > 1]
+        vectors: list[Vector] = [vector for k in dynamic for vector in k]
+        draws: list[float] = [group + random.random() for group, k in enumerate(dynamic) for _ in k]
+        shuffled: list[Vector] = [vectors[i] for i in sorted(range(len(vectors)), key=draws.__getitem__)]
+
+        start: int = 0
+        for k, v in self.locations.items():
+            if len(k) > 1:
+                placements: Iterable[tuple[Vector, GameObject]] = zip(shuffled[start:start + len(k)], v)
+                start += len(k)
+            else:
+                placements = zip(repeat(k[0]), v)
+
+            for vector, game_object in placements:
+                if game_object.object_type is ObjectType.AVATAR:
+                    game_object.position = vector
+                temp: GameObject = tile_at(vector.x, vector.y)
+                above: GameObject | None = temp.occupied_by
+                while above is not None and hasattr(above, 'occupied_by'):
+                    temp = above
+                    above = temp.occupied_by
+                if above is not None:
+                    raise ValueError("Last item on the given tile doesn't have the 'occupied_by' attribute.")
+                temp.occupied_by = game_object
+
+    def collect_changes(self, turn: int) -> ChangeSet:
+        """
+        Compares the board against the last call and sets ``changes`` to what changed since then. Call it once per
+        turn, after the turn's actions are applied and before the world is handed to the clients. The danger_field
+        is updated from the changed tiles, so traps and dynamite placed, defused, or detonated by the controllers
+        are seen without them having to tell the GameBoard.
+        """
+        if self.game_map is None:
+            raise RuntimeError(f'{self.__class__.__name__}.collect_changes needs generate_map to be run first.')
+        self.changes = self.__change_tracker.collect(turn, self.game_map, self.__inventories())
+        changed: Iterable[tuple[int, int]] = ((x, y) for y in range(self.map_size.y) for x in range(self.map_size.x)) \
+            if self.changes.full else self.changes.tiles
+        for x, y in changed:
+            self.danger_field.sync_tile(x, y, self.game_map[y][x])
+        if self.__zobrist_tracker is not None:
+            if self.changes.full:
+                self.__zobrist_tracker = None
+            else:
+                for x, y in self.changes.tiles:
+                    self.__zobrist_tracker.mark(x, y)
+                for company, position in self.changes.avatar_positions.items():
+                    self.__zobrist_tracker.mark_avatar(company)
+                    if position is not None:
+                        self.__zobrist_tracker.mark(position.x, position.y)
+        if self.__adjacency is not None and self.__walkability_changed(self.changes):
+            self.invalidate_adjacency()
+        return self.changes
+
+    def __walkability_changed(self, changes: ChangeSet) -> bool:
+        # the adjacency (and the reachability's distance maps) only go stale when a changed tile became walkable or
+        # stopped being walkable; ores being mined or avatars moving don't change either
+        from game.common.map.adjacency import NOT_WALKABLE, is_walkable
+
+        if changes.full:
+            return True
+        return any(is_walkable(self.game_map[y][x]) != (self.__adjacency.node(x, y) != NOT_WALKABLE)
+                   for x, y in changes.tiles)
+
+    def build_bitboards(self) -> Bitboards:
+        """
+        Returns a Bitboards snapshot of the game_map, with one int per layer for fast set queries on tiles
+        """
+        if self.game_map is None:
+            raise RuntimeError(f'{self.__class__.__name__}.build_bitboards needs generate_map to be run first.')
+        from game.common.map.bitboards import Bitboards
+
+        return Bitboards.from_game_map(self.game_map)
+
+    def advance_timers(self) -> list[Dynamite]:
+        """
+        Advances the timer wheel by one turn and returns the dynamite whose fuse reaches 0 on the new turn. Abilities
+        bound to the wheel don't need to be touched since their fuse is derived from the wheel's turn. The returned
+        dynamite can explode, and is taken out of the danger_field. Call it once at the end of every turn.
+        """
+        from game.quarry_rush.entity.placeable.dynamite import Dynamite
+
+        detonating: list[Dynamite] = [timer for timer in self.timer_wheel.advance() if isinstance(timer, Dynamite)]
+        for dynamite in detonating:
+            dynamite.is_fuse_at_0()
+            self.danger_field.remove(dynamite)
+        return detonating
+
 # Returns the Vector and a list of GameObject for whatever objects you are trying to get
     def get_objects(self, look_for: ObjectType) -> list[tuple[Vector, list[GameObject]]]:
        ...
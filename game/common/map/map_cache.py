@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import Callable, Iterable, NamedTuple
+
+import numpy as np
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+from game.common.map.game_board import GameBoard
+from game.common.map.sparse_game_map import SparseGameMap
+from game.common.map.tile import Tile
+from game.utils.vector import Vector
+
+FORMAT_VERSION: int = 3
+EMPTY: int = 0
+ABANDONED_AFTER: float = 3600  # seconds before prune() treats an unfinished write as abandoned
+
+# the modules whose source decides what a seed generates; changing any of them changes the generator version
+GENERATOR_MODULES: tuple[str, ...] = (
+    'game.common.map.game_board',
+    'game.quarry_rush.map.map_generator',
+    'game.quarry_rush.map.collectable.collectable_generator',
+    'game.quarry_rush.map.collectable.collectable_weights_dict',
+    'game.quarry_rush.map.game_location.game_location',
+    'game.quarry_rush.map.game_location.game_location_dict',
+    'game.quarry_rush.station.ore_occupiable_station',
+    'game.utils.noise',
+    'game.config',
+)
+
+# (name, dtype) of every layer, each with the shape (height, width)
+LAYERS: tuple[tuple[str, type], ...] = (
+    ('static', np.uint8),  # ObjectType.value of the wall or station on the tile, or EMPTY
+    ('held', np.uint8),  # ObjectType.value of the item an ore station holds, or EMPTY
+    ('avatar', np.uint8),  # Company.value of the avatar on top of the tile (e.g., on its base), or EMPTY
+    ('ore_seed', np.float64),
+    ('special_weight', np.float64),
+    ('ancient_tech_weight', np.float64),
+)
+
+CACHEABLE_TYPES: frozenset[ObjectType] = frozenset({
+    ObjectType.WALL,
+    ObjectType.CHURCH_STATION,
+    ObjectType.TURING_STATION,
+    ObjectType.ORE_OCCUPIABLE_STATION,
+})
+
+
+class CacheEntry(NamedTuple):
+    layers: dict[str, np.ndarray]
+    random_state: tuple  # random.getstate() right after the board was generated
+
+
+def generator_version(modules: Iterable[str] = GENERATOR_MODULES) -> str:
+    """
+    Hashes the source of the given modules, read through their loaders so modules inside launcher.pyz work too. A
+    module that can't be found is hashed as missing, so adding it later changes the version as well.
+    """
+    digest = hashlib.sha256()
+    for name in modules:
+        digest.update(name.encode())
+        try:
+            spec = importlib.util.find_spec(name)
+        except ImportError:
+            spec = None
+        source: str | None = None
+        if spec is not None and spec.loader is not None and hasattr(spec.loader, 'get_source'):
+            source = spec.loader.get_source(name)
+        digest.update(b'\0missing\0' if source is None else source.encode())
+    return digest.hexdigest()[:16]
+
+
+def encode_board(world: GameBoard) -> dict[str, np.ndarray]:
+    """
+    Encodes the walls, stations, and avatars of a freshly generated GameBoard into the cache's layers. A tile can
+    hold a wall or station, an avatar, or an avatar on top of a station. Anything else (e.g., a trap) can't be
+    rebuilt from the layers, so it raises a ValueError.
+    """
+    height: int = len(world.game_map)
+    width: int = len(world.game_map[0]) if height > 0 else 0
+    layers: dict[str, np.ndarray] = {name: np.zeros((height, width), dtype=dtype) for name, dtype in LAYERS}
+    for y, row in enumerate(world.game_map):
+        for x, tile in enumerate(row):
+            station: GameObject | None = tile.occupied_by
+            avatar: GameObject | None = getattr(station, 'occupied_by', None)
+            if station is not None and station.object_type is ObjectType.AVATAR:
+                station, avatar = None, station
+            if (station is not None and station.object_type not in CACHEABLE_TYPES) or \
+                    (avatar is not None and (avatar.object_type is not ObjectType.AVATAR or
+                                             getattr(avatar, 'occupied_by', None) is not None)):
+                raise ValueError(f'The tile at ({x}, {y}) holds objects that the map cache cannot store.')
+            if avatar is not None:
+                layers['avatar'][y, x] = avatar.company.value
+            if station is None:
+                continue
+            layers['static'][y, x] = station.object_type.value
+            if station.object_type is ObjectType.ORE_OCCUPIABLE_STATION:
+                layers['held'][y, x] = EMPTY if station.held_item is None else station.held_item.object_type.value
+                layers['ore_seed'][y, x] = station.seed
+                layers['special_weight'][y, x] = station.special_weight
+                layers['ancient_tech_weight'][y, x] = station.ancient_tech_weight
+    return layers
+
+
+def decode_board(layers: dict[str, np.ndarray], seed: int | None, map_size: Vector,
+                 sparse: bool = False) -> GameBoard:
+    """
+    Builds a GameBoard from the cache's layers, with a new Tile, station, and Avatar for every non-empty coordinate
+    """
+    from game.common.avatar import Avatar
+    from game.common.map.wall import Wall
+    from game.quarry_rush.entity.ancient_tech import AncientTech
+    from game.quarry_rush.entity.ores import Lambdium, Turite
+    from game.quarry_rush.station.company_station import ChurchStation, TuringStation
+    from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+
+    held_items: dict[int, Callable[[], GameObject] | None] = {
+        EMPTY: None,
+        ObjectType.LAMBDIUM.value: Lambdium,
+        ObjectType.TURITE.value: Turite,
+        ObjectType.ANCIENT_TECH.value: AncientTech,
+    }
+
+    height, width = layers['static'].shape
+    game_map: list[list[Tile]] | SparseGameMap = SparseGameMap(width, height) if sparse \
+        else [[Tile() for _ in range(width)] for _ in range(height)]
+    static: np.ndarray = layers['static']
+    for y, x in zip(*np.nonzero(static)):
+        y, x = int(y), int(x)
+        station: GameObject
+        match ObjectType(int(static[y, x])):
+            case ObjectType.WALL:
+                station = Wall.shared()
+            case ObjectType.CHURCH_STATION:
+                station = ChurchStation()
+            case ObjectType.TURING_STATION:
+                station = TuringStation()
+            case _:
+                station = OreOccupiableStation(Vector(x, y), float(layers['ore_seed'][y, x]),
+                                               float(layers['special_weight'][y, x]),
+                                               float(layers['ancient_tech_weight'][y, x]))
+                held: int = int(layers['held'][y, x])
+                if held != ObjectType.COPIUM.value:  # a new station already holds Copium
+                    held_item: Callable[[], GameObject] | None = held_items[held]
+                    station.held_item = None if held_item is None else held_item()
+        if sparse:
+            game_map.tile_for_write(x, y).occupied_by = station
+        else:
+            game_map[y][x].occupied_by = station
+
+    avatars: np.ndarray = layers['avatar']
+    for y, x in zip(*np.nonzero(avatars)):
+        y, x = int(y), int(x)
+        avatar: Avatar = Avatar(company=Company(int(avatars[y, x])), position=Vector(x, y))
+        below: GameObject = game_map.tile_for_write(x, y) if sparse else game_map[y][x]
+        if below.occupied_by is not None:
+            below = below.occupied_by
+        below.occupied_by = avatar
+
+    world: GameBoard = GameBoard(seed, map_size, sparse=sparse)
+    world.game_map = game_map
+    return world
+
+
+class MapCache:
+    """
+    `MapCache Class Notes:`
+
+        The MapCache keeps generated boards on disk, so replaying the same seed (e.g., when tuning a client) loads
+        the board instead of generating it again.
+
+        -----
+
+        Keys:
+            An entry is keyed by a hash of the seed, the map size, any extra generator parameters, and the
+            generator version. The version is a hash of the generator's source (see GENERATOR_MODULES), so an entry
+            made by older generator code is never used; ``prune()`` deletes those entries.
+
+        -----
+
+        Entries:
+            Each entry is a directory with one .npy file per layer (see LAYERS) and a meta.json, which also holds
+            the global ``random`` state from right after the board was generated. ``load()`` memory maps the layers
+            read-only, so looking up a board only reads the pages that are used. Entries are written
+            to a temporary directory and renamed into place, so a reader never sees half of one, and an entry that
+            doesn't match its key or can't be read is deleted and treated as a miss.
+            ::
+                cache = MapCache('.map_cache')
+                world = cache.get_or_generate(seed, Vector(14, 14), lambda: generate(seed))
+
+        A board loaded from the cache has new stations and avatars built from the layers. ``get_or_generate()``
+        restores the stored ``random`` state on a hit, so a replay draws the same numbers after the board is made
+        whether the cache was warm or cold.
+    """
+
+    def __init__(self, directory: str, version: str | None = None):
+        if directory is None or not isinstance(directory, str):
+            raise ValueError(f'{self.__class__.__name__}.directory must be a str.')
+        if version is not None and not isinstance(version, str):
+            raise ValueError(f'{self.__class__.__name__}.version must be a str or None.')
+        self.directory: str = directory
+        self.version: str = generator_version() if version is None else version
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def key(self, seed: int | None, map_size: Vector, parameters: dict | None = None) -> str:
+        description: str = json.dumps({'format': FORMAT_VERSION, 'version': self.version, 'seed': seed,
+                                       'map_size': [map_size.x, map_size.y], 'parameters': parameters or {}},
+                                      sort_keys=True)
+        return hashlib.sha256(description.encode()).hexdigest()[:32]
+
+    def load(self, seed: int | None, map_size: Vector, parameters: dict | None = None) -> CacheEntry | None:
+        """
+        Returns the memory-mapped layers and the random state of the entry, or None on a miss
+        """
+        key: str = self.key(seed, map_size, parameters)
+        path: str = os.path.join(self.directory, key)
+        if not os.path.isdir(path):
+            self.misses += 1
+            return None
+        try:
+            with open(os.path.join(path, 'meta.json')) as meta_file:
+                meta: dict = json.load(meta_file)
+            if meta.get('key') != key or meta.get('version') != self.version:
+                raise ValueError('The entry does not match its key.')
+            layers: dict[str, np.ndarray] = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+                                             for name, _ in LAYERS}
+            if any(layer.shape != (map_size.y, map_size.x) for layer in layers.values()):
+                raise ValueError('The entry has the wrong shape.')
+            version, internal, gauss_next = meta['random_state']
+            random_state: tuple = (version, tuple(internal), gauss_next)
+        except (OSError, ValueError, KeyError, TypeError):
+            shutil.rmtree(path, ignore_errors=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CacheEntry(layers, random_state)
+
+    def store(self, seed: int | None, map_size: Vector, world: GameBoard, parameters: dict | None = None,
+              random_state: tuple | None = None) -> str:
+        """
+        Writes the board's layers to the cache and returns the entry's key. random_state should be
+        ``random.getstate()`` from right after the board was generated; it defaults to the current state.
+        """
+        layers: dict[str, np.ndarray] = encode_board(world)
+        version, internal, gauss_next = random.getstate() if random_state is None else random_state
+        key: str = self.key(seed, map_size, parameters)
+        path: str = os.path.join(self.directory, key)
+        os.makedirs(self.directory, exist_ok=True)
+        temporary: str = tempfile.mkdtemp(prefix=f'.{key}-', dir=self.directory)
+        try:
+            for name, layer in layers.items():
+                np.save(os.path.join(temporary, f'{name}.npy'), layer)
+            with open(os.path.join(temporary, 'meta.json'), 'w') as meta_file:
+                json.dump({'key': key, 'format': FORMAT_VERSION, 'version': self.version, 'seed': seed,
+                           'map_size': [map_size.x, map_size.y], 'parameters': parameters or {},
+                           'random_state': [version, list(internal), gauss_next]}, meta_file)
+            try:
+                os.rename(temporary, path)
+            except OSError:
+                pass  # another process stored the same entry first; both are the same board
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+        return key
+
+    def get_or_generate(self, seed: int | None, map_size: Vector, generate: Callable[[], GameBoard],
+                        parameters: dict | None = None, sparse: bool = False) -> GameBoard:
+        """
+        Returns the cached board for the key, or calls ``generate()`` and caches what it returns. Either way, the
+        global ``random`` state afterwards is the one generating the board leaves behind.
+        """
+        entry: CacheEntry | None = self.load(seed, map_size, parameters)
+        if entry is not None:
+            world: GameBoard = decode_board(entry.layers, seed, map_size, sparse)
+            random.setstate(entry.random_state)  # after decoding, since making the GameBoard seeds random again
+            return world
+        world = generate()
+        random_state: tuple = random.getstate()
+        self.store(seed, map_size, world, parameters, random_state)
+        return world
+
+    def prune(self) -> int:
+        """
+        Deletes every entry made by another generator version or format, and anything left over from a write that
+        was interrupted. Returns how many were deleted.
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+        removed: int = 0
+        for name in os.listdir(self.directory):
+            path: str = os.path.join(self.directory, name)
+            if not os.path.isdir(path):
+                continue
+            if name.startswith('.'):
+                # a write in progress, unless it was left behind long ago
+                if time.time() - os.path.getmtime(path) > ABANDONED_AFTER:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+                continue
+            try:
+                with open(os.path.join(path, 'meta.json')) as meta_file:
+                    meta: dict = json.load(meta_file)
+                stale: bool = meta.get('version') != self.version or meta.get('format') != FORMAT_VERSION
+            except (OSError, ValueError):
+                stale = True
+            if stale:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
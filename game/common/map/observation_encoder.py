@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+
+# planes, from the point of view of the avatar being encoded for
+WALL: int = 0
+COPIUM: int = 1
+LAMBDIUM: int = 2
+TURITE: int = 3
+ANCIENT_TECH: int = 4
+OWN_LANDMINE: int = 5
+OWN_EMP: int = 6
+OPPONENT_LANDMINE: int = 7
+OPPONENT_EMP: int = 8
+DYNAMITE_FUSE: int = 9
+OWN_STATION: int = 10
+OPPONENT_STATION: int = 11
+OWN_AVATAR: int = 12
+OPPONENT_AVATAR: int = 13
+PLANE_COUNT: int = 14
+TILE_PLANES: slice = slice(WALL, OPPONENT_STATION + 1)  # everything read from a tile's occupied_by stack
+
+# scalars; the opponent's are at the same index plus OPPONENT_OFFSET
+SCIENCE_POINTS: int = 0
+SCORE: int = 1
+DROP_RATE: int = 2
+MOVEMENT_SPEED: int = 3
+INVENTORY_FILL: int = 4
+OPPONENT_OFFSET: int = 5
+SCALAR_COUNT: int = 10
+
+ORE_PLANES: dict[ObjectType, int] = {
+    ObjectType.COPIUM: COPIUM,
+    ObjectType.LAMBDIUM: LAMBDIUM,
+    ObjectType.TURITE: TURITE,
+    ObjectType.ANCIENT_TECH: ANCIENT_TECH,
+}
+
+STATION_TYPES: dict[ObjectType, Company] = {
+    ObjectType.CHURCH_STATION: Company.CHURCH,
+    ObjectType.TURING_STATION: Company.TURING,
+}
+
+
+class ObservationEncoder:
+    """
+    `ObservationEncoder Class Notes:`
+
+        The ObservationEncoder turns a GameBoard and both Avatars into fixed-shape NumPy arrays for a learning-based
+        client: ``planes`` with shape (PLANE_COUNT, height, width), indexed ``[plane][y][x]``, and ``scalars`` with
+        shape (SCALAR_COUNT,). Every plane and scalar is from the point of view of the company the encoder is made
+        for, so the same network can play either side.
+
+        -----
+
+        Buffers:
+            Both arrays are allocated once and filled in place on every call to ``encode()``. The planes can be
+            given to the constructor instead, e.g. a row of a VectorEnv's shared observations.
+
+        -----
+
+        Changed tiles:
+            The first ``encode()`` reads every tile. After that, only the tiles passed as ``changed`` are read
+            again; the avatar planes, dynamite fuses and scalars are refreshed every time since they change on
+            every turn without any tile changing. Pass ``changed=None`` to read every tile again.
+            ::
+                encoder.encode(world, avatar, opponent, changed=[(x, y), ...])
+    """
+
+    def __init__(self, company: Company, width: int, height: int, planes: np.ndarray | None = None):
+        self.company: Company = company
+        self.width: int = width
+        self.height: int = height
+
+        if planes is None:
+            planes = np.zeros((PLANE_COUNT, height, width), dtype=np.float32)
+        elif planes.shape != (PLANE_COUNT, height, width):
+            raise ValueError(f'{self.__class__.__name__}.planes must have the shape {(PLANE_COUNT, height, width)}.')
+        self.planes: np.ndarray = planes
+        self.scalars: np.ndarray = np.zeros(SCALAR_COUNT, dtype=np.float32)
+
+        self.__encoded: bool = False
+        self.__dynamite: dict[tuple[int, int], GameObject] = {}
+        self.__avatar_positions: list[tuple[int, int] | None] = [None, None]
+
+    def encode(self, world: GameObject, avatar: GameObject, opponent: GameObject | None = None,
+               changed: Iterable[tuple[int, int]] | None = None) -> np.ndarray:
+        """
+        Fills the planes and scalars for the given board and returns the planes
+        """
+        game_map: list[list[GameObject]] = world.game_map
+        if changed is None or not self.__encoded:
+            self.planes[TILE_PLANES] = 0
+            self.__dynamite.clear()
+            for y, row in enumerate(game_map):
+                for x, tile in enumerate(row):
+                    self.__encode_tile(x, y, tile)
+            self.__encoded = True
+        else:
+            for x, y in changed:
+                self.planes[TILE_PLANES, y, x] = 0
+                self.__dynamite.pop((x, y), None)
+                self.__encode_tile(x, y, game_map[y][x])
+
+        for (x, y), dynamite in self.__dynamite.items():
+            self.planes[DYNAMITE_FUSE, y, x] = dynamite.fuse
+
+        for index, (plane, current) in enumerate(((OWN_AVATAR, avatar), (OPPONENT_AVATAR, opponent))):
+            previous: tuple[int, int] | None = self.__avatar_positions[index]
+            if previous is not None:
+                self.planes[plane, previous[1], previous[0]] = 0
+            position = None if current is None else current.position
+            self.__avatar_positions[index] = None if position is None else (position.x, position.y)
+            if position is not None:
+                self.planes[plane, position.y, position.x] = 1
+
+        self.__encode_scalars(world, avatar, 0)
+        if opponent is not None:
+            self.__encode_scalars(world, opponent, OPPONENT_OFFSET)
+        else:
+            self.scalars[OPPONENT_OFFSET:] = 0
+        return self.planes
+
+    def __encode_tile(self, x: int, y: int, tile: GameObject) -> None:
+        planes: np.ndarray = self.planes
+        temp: GameObject | None = tile.occupied_by
+        while temp is not None:
+            match temp.object_type:
+                case ObjectType.WALL:
+                    planes[WALL, y, x] = 1
+                case ObjectType.LANDMINE:
+                    planes[OWN_LANDMINE if temp.owner_company is self.company else OPPONENT_LANDMINE, y, x] = 1
+                case ObjectType.EMP:
+                    planes[OWN_EMP if temp.owner_company is self.company else OPPONENT_EMP, y, x] = 1
+                case ObjectType.DYNAMITE:
+                    self.__dynamite[(x, y)] = temp
+                case ObjectType.CHURCH_STATION | ObjectType.TURING_STATION:
+                    own: bool = STATION_TYPES[temp.object_type] is self.company
+                    planes[OWN_STATION if own else OPPONENT_STATION, y, x] = 1
+
+            held_item: GameObject | None = getattr(temp, 'held_item', None)
+            if held_item is not None and held_item.object_type in ORE_PLANES:
+                planes[ORE_PLANES[held_item.object_type], y, x] = 1
+            temp = getattr(temp, 'occupied_by', None)
+
+    def __encode_scalars(self, world: GameObject, avatar: GameObject, offset: int) -> None:
+        inventory: list = world.inventory_manager.get_inventory(avatar.company)
+        scalars: np.ndarray = self.scalars
+        scalars[offset + SCIENCE_POINTS] = avatar.science_points
+        scalars[offset + SCORE] = avatar.score
+        scalars[offset + DROP_RATE] = avatar.drop_rate
+        scalars[offset + MOVEMENT_SPEED] = avatar.movement_speed
+        scalars[offset + INVENTORY_FILL] = sum(item is not None for item in inventory) / max(len(inventory), 1)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from game.common.avatar import Avatar
 from game.common.enums import ObjectType
 from game.common.game_object import GameObject
 from game.common.items.item import Item
-from typing import Self, Type
+from typing import Self, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game.common.avatar import Avatar
 
 
 class Occupiable(GameObject):
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import numpy as np
+
+from game.common.enums import ObjectType
+from game.common.game_object import GameObject
+
+# the value used for each held item; ancient tech is worth its science points
+DEFAULT_ORE_VALUES: dict[ObjectType, float] = {
+    ObjectType.COPIUM: 20.0,
+    ObjectType.LAMBDIUM: 80.0,
+    ObjectType.TURITE: 80.0,
+    ObjectType.ANCIENT_TECH: 10.0,
+}
+
+
+class OreDensity:
+    """
+    `OreDensity Class Notes:`
+
+        The OreDensity class keeps a grid of how much the ore on every tile is worth, and turns it into a density
+        field: the total value of the ores in a window around each tile. The tile with the highest density is the
+        center of the best region to mine.
+
+        Both grids are NumPy arrays indexed with ``[y][x]``, like ``GameBoard.game_map``.
+
+        -----
+
+        Kernels:
+            'box' adds up every ore in a square window. It is computed from a summed-area table, so the cost does not
+            depend on the window size.
+
+            'gaussian' weighs ores by their distance from the center of the window. It is computed as two 1D
+            convolutions, one along each axis.
+
+        -----
+
+        Incremental updates:
+            ``set_value()`` (or ``update_tile()``) changes one tile. If a density field was already computed, only
+            the window around that tile is adjusted instead of computing the whole field again.
+    """
+
+    def __init__(self, values: np.ndarray, ore_values: dict[ObjectType, float] | None = None):
+        self.values: np.ndarray = values.astype(np.float64, copy=False)
+        self.ore_values: dict[ObjectType, float] = DEFAULT_ORE_VALUES if ore_values is None else ore_values
+        self.__density: np.ndarray | None = None
+        self.__kernel: np.ndarray | None = None  # the 2D kernel the cached density was computed with
+
+    @classmethod
+    def from_game_map(cls, game_map: list[list[GameObject]],
+                      ore_values: dict[ObjectType, float] | None = None) -> OreDensity:
+        ore_values = DEFAULT_ORE_VALUES if ore_values is None else ore_values
+        height: int = len(game_map)
+        width: int = len(game_map[0]) if height > 0 else 0
+        values: np.ndarray = np.zeros((height, width), dtype=np.float64)
+
+        for y, row in enumerate(game_map):
+            for x, tile in enumerate(row):
+                values[y, x] = cls.__tile_value(tile, ore_values)
+
+        return cls(values, ore_values)
+
+    def density(self, window: int = 5, kernel: str = 'box', sigma: float | None = None) -> np.ndarray:
+        """
+        Returns the density field for a square window of the given (odd) size. The result is cached and kept up to
+        date by ``set_value()``; it should not be modified.
+        """
+        if window < 1 or window % 2 == 0:
+            raise ValueError(f'{self.__class__.__name__}.density window must be a positive odd int.')
+
+        match kernel:
+            case 'box':
+                weights: np.ndarray = np.ones(window, dtype=np.float64)
+                self.__density = self.__box_sum(self.values, window // 2)
+            case 'gaussian':
+                sigma = window / 4 if sigma is None else sigma
+                offsets: np.ndarray = np.arange(window, dtype=np.float64) - window // 2
+                weights = np.exp(-offsets ** 2 / (2 * sigma ** 2))
+                self.__density = self.__separable(self.values, weights)
+            case _:
+                raise ValueError(f'{self.__class__.__name__}.density kernel must be "box" or "gaussian".')
+
+        self.__kernel = np.outer(weights, weights)
+        return self.__density
+
+    def set_value(self, x: int, y: int, value: float) -> None:
+        """
+        Sets the ore value of a single tile and adjusts the cached density field around it
+        """
+        delta: float = value - self.values[y, x]
+        if delta == 0:
+            return
+        self.values[y, x] = value
+
+        if self.__density is None:
+            return
+
+        radius: int = self.__kernel.shape[0] // 2
+        height, width = self.values.shape
+        top, bottom = max(y - radius, 0), min(y + radius + 1, height)
+        left, right = max(x - radius, 0), min(x + radius + 1, width)
+        self.__density[top:bottom, left:right] += delta * self.__kernel[
+            top - (y - radius):bottom - (y - radius), left - (x - radius):right - (x - radius)]
+
+    def update_tile(self, x: int, y: int, tile: GameObject) -> None:
+        """
+        Reads the ore value of the given tile again, e.g. after it was mined
+        """
+        self.set_value(x, y, self.__tile_value(tile, self.ore_values))
+
+    def best_region(self, mask: np.ndarray | None = None) -> tuple[int, int] | None:
+        """
+        Returns the (x, y) with the highest value in the last density field computed, only looking at tiles where
+        the mask is True. Returns None if no density was computed or no tile is allowed.
+        """
+        if self.__density is None:
+            return None
+        density: np.ndarray = self.__density if mask is None else np.where(mask, self.__density, -np.inf)
+        index: int = int(np.argmax(density))
+        if not np.isfinite(density.flat[index]):
+            return None
+        y, x = divmod(index, density.shape[1])
+        return x, y
+
+    @staticmethod
+    def __tile_value(tile: GameObject, ore_values: dict[ObjectType, float]) -> float:
+        temp: GameObject | None = tile.occupied_by
+        while temp is not None:
+            if temp.object_type is ObjectType.ORE_OCCUPIABLE_STATION:
+                held_item: GameObject | None = getattr(temp, 'held_item', None)
+                return 0.0 if held_item is None else ore_values.get(held_item.object_type, 0.0)
+            temp = getattr(temp, 'occupied_by', None)
+        return 0.0
+
+    @staticmethod
+    def __box_sum(values: np.ndarray, radius: int) -> np.ndarray:
+        height, width = values.shape
+        table: np.ndarray = np.zeros((height + 1, width + 1), dtype=np.float64)
+        table[1:, 1:] = values.cumsum(axis=0).cumsum(axis=1)
+
+        top: np.ndarray = np.clip(np.arange(height) - radius, 0, height)
+        bottom: np.ndarray = np.clip(np.arange(height) + radius + 1, 0, height)
+        left: np.ndarray = np.clip(np.arange(width) - radius, 0, width)
+        right: np.ndarray = np.clip(np.arange(width) + radius + 1, 0, width)
+
+        return table[bottom][:, right] - table[top][:, right] - table[bottom][:, left] + table[top][:, left]
+
+    @staticmethod
+    def __separable(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        radius: int = len(weights) // 2
+        height, width = values.shape
+
+        padded: np.ndarray = np.pad(values, ((0, 0), (radius, radius)))
+        rows: np.ndarray = sum(weight * padded[:, i:i + width] for i, weight in enumerate(weights))
+
+        padded = np.pad(rows, ((radius, radius), (0, 0)))
+        return sum(weight * padded[i:i + height, :] for i, weight in enumerate(weights))
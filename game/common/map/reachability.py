@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict, deque
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+from game.common.map.adjacency import Adjacency, NOT_WALKABLE
+
+UNREACHABLE: int = -1
+MAX_CACHED_DISTANCES: int = 64
+
+STATION_TYPES: dict[Company, ObjectType] = {
+    Company.CHURCH: ObjectType.CHURCH_STATION,
+    Company.TURING: ObjectType.TURING_STATION,
+}
+
+
+class Reachability:
+    """
+    `Reachability Class Notes:`
+
+        The Reachability class answers where an avatar can be in the next few turns and where it can be stopped on
+        its way home. It is built on ``GameBoard.adjacency`` and is meant for choosing where to place a Landmine or
+        EMP against the avatar from ``Avatar.get_opposing_team()``.
+
+        -----
+
+        Distance maps:
+            ``distances(sources)`` does one multi-source BFS and returns the moves from the nearest source to every
+            node, or UNREACHABLE. The maps are cached by their sources and reused on every later turn, so the
+            distances to a company station are usually only computed once. Only the ``max_cached`` most recently used
+            maps are kept, since every new avatar position adds one. ``clear()`` drops them all; GameBoard does that
+            (by making a new Reachability) whenever a tile becomes walkable or stops being walkable.
+
+        -----
+
+        Frontiers:
+            ``frontier(x, y, movement_speed, turns)`` returns every node an avatar at (x, y) can reach within the
+            given amount of turns. ``frontier_rings()`` splits that into the nodes first reached on each turn.
+
+        -----
+
+        Interception:
+            ``interception(x, y, goals, slack)`` returns the nodes on a shortest path from (x, y) to the nearest
+            goal, i.e., where the total of the distance from the avatar and the distance to the goal is no more than
+            the shortest distance (plus slack for paths that are a few moves longer). ``station_nodes(company)``
+            gives the goals for an avatar heading back to its company station.
+    """
+
+    def __init__(self, adjacency: Adjacency, game_map: list[list[GameObject]] | None = None,
+                 max_cached: int = MAX_CACHED_DISTANCES):
+        if not isinstance(max_cached, int) or max_cached < 1:
+            raise ValueError(f'{self.__class__.__name__}.max_cached must be a positive int.')
+        self.adjacency: Adjacency = adjacency
+        self.max_cached: int = max_cached
+        self.__game_map: list[list[GameObject]] | None = game_map
+        self.__distances: OrderedDict[tuple[int, ...], array] = OrderedDict()
+        self.__station_nodes: dict[Company, list[int]] = {}
+
+    def distances(self, sources: list[int]) -> array:
+        """
+        Returns the moves from the nearest of the given nodes to every node. The result is cached and should not be
+        modified.
+        """
+        key: tuple[int, ...] = tuple(sorted(set(source for source in sources if source != NOT_WALKABLE)))
+        cached: array | None = self.__distances.get(key)
+        if cached is not None:
+            self.__distances.move_to_end(key)
+            return cached
+
+        offsets: array = self.adjacency.offsets
+        neighbours: array = self.adjacency.neighbours
+        distances: array = array('i', [UNREACHABLE]) * len(self.adjacency)
+        queue: deque[int] = deque(key)
+        for source in key:
+            distances[source] = 0
+
+        while queue:
+            current: int = queue.popleft()
+            next_distance: int = distances[current] + 1
+            for neighbour in neighbours[offsets[current]:offsets[current + 1]]:
+                if distances[neighbour] == UNREACHABLE:
+                    distances[neighbour] = next_distance
+                    queue.append(neighbour)
+
+        self.__distances[key] = distances
+        if len(self.__distances) > self.max_cached:
+            self.__distances.popitem(last=False)
+        return distances
+
+    def clear(self) -> None:
+        """
+        Drops every cached distance map and station node list
+        """
+        self.__distances.clear()
+        self.__station_nodes.clear()
+
+    def frontier(self, x: int, y: int, movement_speed: int, turns: int = 1) -> list[int]:
+        """
+        Returns every node an avatar at (x, y) can reach within the given amount of turns, including its own node
+        """
+        node: int = self.adjacency.node(x, y)
+        if node == NOT_WALKABLE:
+            return []
+        moves: int = movement_speed * turns
+        return [other for other, distance in enumerate(self.distances([node])) if 0 <= distance <= moves]
+
+    def frontier_rings(self, x: int, y: int, movement_speed: int, turns: int) -> list[list[int]]:
+        """
+        Returns the nodes an avatar at (x, y) can first reach on each of the next turns; index 0 is its own node
+        """
+        node: int = self.adjacency.node(x, y)
+        if node == NOT_WALKABLE:
+            return []
+        speed: int = max(movement_speed, 1)
+        rings: list[list[int]] = [[] for _ in range(turns + 1)]
+        for other, distance in enumerate(self.distances([node])):
+            if distance != UNREACHABLE and -(-distance // speed) <= turns:
+                rings[-(-distance // speed)].append(other)
+        return rings
+
+    def interception(self, x: int, y: int, goals: list[int], slack: int = 0) -> list[int]:
+        """
+        Returns the nodes on a path from (x, y) to the nearest goal that is at most slack moves longer than the
+        shortest one, ordered by how soon the avatar reaches them
+        """
+        node: int = self.adjacency.node(x, y)
+        if node == NOT_WALKABLE:
+            return []
+        from_avatar: array = self.distances([node])
+        to_goal: array = self.distances(goals)
+        shortest: int = to_goal[node]
+        if shortest == UNREACHABLE:
+            return []
+
+        on_path: list[int] = [other for other in range(len(from_avatar))
+                              if from_avatar[other] != UNREACHABLE and to_goal[other] != UNREACHABLE
+                              and from_avatar[other] + to_goal[other] <= shortest + slack]
+        on_path.sort(key=from_avatar.__getitem__)
+        return on_path
+
+    def station_nodes(self, company: Company) -> list[int]:
+        """
+        Returns the nodes of the given company's station(s). Needs the game_map the Reachability was built with.
+        """
+        cached: list[int] | None = self.__station_nodes.get(company)
+        if cached is not None:
+            return cached
+        if self.__game_map is None:
+            raise RuntimeError(f'{self.__class__.__name__}.station_nodes needs the game_map.')
+
+        nodes: list[int] = []
+        for y, row in enumerate(self.__game_map):
+            for x, tile in enumerate(row):
+                temp: GameObject | None = tile.occupied_by
+                while temp is not None:
+                    if temp.object_type is STATION_TYPES[company]:
+                        nodes.append(self.adjacency.node(x, y))
+                        break
+                    temp = getattr(temp, 'occupied_by', None)
+
+        self.__station_nodes[company] = [node for node in nodes if node != NOT_WALKABLE]
+        return self.__station_nodes[company]
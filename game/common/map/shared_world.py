@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterator, TypeVar
+
+import numpy as np
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+from game.common.map.change_set import ChangeSet
+from game.utils.vector import Vector
+
+MAX_LAYERS: int = 4  # traps and dynamite stacked on top of a tile's static object
+INVENTORY_SIZE: int = 50
+EMPTY: int = 0
+
+# objects that stay on their tile for the whole game; everything else is written to the layers
+STATIC_TYPES: frozenset[ObjectType] = frozenset({
+    ObjectType.WALL,
+    ObjectType.ORE_OCCUPIABLE_STATION,
+    ObjectType.CHURCH_STATION,
+    ObjectType.TURING_STATION,
+})
+
+# per-company avatar fields, in order
+AVATAR_FIELDS: tuple[str, ...] = ('x', 'y', 'on_board', 'score', 'science_points', 'movement_speed', 'drop_rate')
+
+# how long SharedWorldView.read waits between retries, doubling from MIN_BACKOFF, and how long it tries for
+MIN_BACKOFF: float = 1e-5
+MAX_BACKOFF: float = 1e-3
+READ_TIMEOUT: float = 1.0
+
+T = TypeVar('T')
+
+
+def _attach(names: tuple[str, ...]) -> list[SharedMemory]:
+    """
+    Attaches to segments made by another process without leaving them registered with this process's resource_tracker.
+    Before Python 3.13 every attach on POSIX is registered, and the tracker unlinks the segments when this process
+    exits, even though the SharedWorld that made them is still using them.
+
+    A process that shares the SharedWorld's tracker (its own process, or a multiprocessing child of it) takes the
+    segments off that tracker too; ``SharedWorld.unlink()`` registers them again before unlinking them.
+    """
+    if sys.version_info >= (3, 13):
+        return [SharedMemory(name=name, track=False) for name in names]
+    memories: list[SharedMemory] = [SharedMemory(name=name) for name in names]
+    if os.name == 'posix':
+        for name in names:
+            resource_tracker.unregister(_tracked_name(name), 'shared_memory')
+    return memories
+
+
+def _tracked_name(name: str) -> str:
+    # the name a segment is registered with the resource_tracker under; POSIX names start with a slash
+    return f'/{name}'
+
+
+def _find(start: GameObject | None, target: ObjectType | GameObject) -> GameObject | None:
+    """
+    ``Occupiable.get_occupied_by()`` for the read-only objects: the first object in the occupied_by chain from start
+    with the given ObjectType, or with the object_type of the given GameObject
+    """
+    object_type: ObjectType = target if isinstance(target, ObjectType) else target.object_type
+    temp: GameObject | None = start
+    while temp is not None:
+        if temp.object_type is object_type:
+            return temp
+        temp = getattr(temp, 'occupied_by', None)
+    return None
+
+
+def _state_arrays(buffer: memoryview, width: int, height: int) -> dict[str, np.ndarray]:
+    """
+    Lays out the per-turn arrays over one buffer. Used by both sides so they always agree on the layout.
+    """
+    companies: int = len(Company)
+    shapes: list[tuple[str, tuple[int, ...], type]] = [
+        ('sequence', (1,), np.int64),  # odd while update() is writing; see SharedWorldView.read()
+        ('turn', (1,), np.int32),
+        ('avatars', (companies, len(AVATAR_FIELDS)), np.int32),
+        ('extras', (height, width, MAX_LAYERS), np.int16),  # owner company or fuse of each layer
+        ('layers', (height, width, MAX_LAYERS), np.uint8),  # ObjectType.value of each layer, or EMPTY
+        ('held', (height, width), np.uint8),  # ObjectType.value of the item held by the static object, or EMPTY
+        ('inventories', (companies, INVENTORY_SIZE), np.uint8),
+    ]
+    arrays: dict[str, np.ndarray] = {}
+    offset: int = 0
+    for name, shape, dtype in shapes:
+        array: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        arrays[name] = array
+        offset += array.nbytes
+    return arrays
+
+
+def _state_size(width: int, height: int) -> int:
+    companies: int = len(Company)
+    return 8 + 4 + companies * len(AVATAR_FIELDS) * 4 + height * width * (MAX_LAYERS * 3 + 1) \
+        + companies * INVENTORY_SIZE
+
+
+class SharedWorld:
+    """
+    `SharedWorld Class Notes:`
+
+        The SharedWorld puts a GameBoard into two ``multiprocessing.shared_memory`` segments, so a client running in
+        another process can read it through a SharedWorldView instead of receiving a serialized copy every turn.
+
+        -----
+
+        Segments:
+            The static segment holds the ObjectType of the wall or station on every tile. It is filled when the
+            SharedWorld is created and after that only changes when a station is removed (e.g., a mined out ore).
+
+            The state segment holds everything that changes during a game: the traps and dynamite on each tile
+            (up to MAX_LAYERS), the item held by each station, both avatars, both inventories, and the turn.
+
+        -----
+
+        Updates:
+            ``update()`` takes the turn's ChangeSet (see ``GameBoard.collect_changes()``) and only rewrites the
+            tiles in it, the dynamite fuses, the avatars and the inventories, so the cost of a turn does not grow
+            with the size of the board. Without a ChangeSet, every tile is written again. Note that the ChangeSet
+            from ``GameBoard.collect_changes()`` is itself found by scanning every tile, so the server's turn is
+            still O(board); only the hand-off to the clients isn't.
+
+            The state segment starts with a sequence number that ``update()`` increments before it writes anything
+            and again after it's done (a seqlock), so it is odd while an update is in progress. Readers use it to
+            tell whether what they read was torn by an update; see ``SharedWorldView.read()``.
+
+        Pass ``names`` to the client process and open a SharedWorldView with them. The process that created the
+        SharedWorld calls ``close()`` and ``unlink()`` when the game is over.
+    """
+
+    def __init__(self, world: GameObject, avatars: list[GameObject]):
+        self.height: int = len(world.game_map)
+        self.width: int = len(world.game_map[0]) if self.height > 0 else 0
+
+        self.__static_memory: SharedMemory = SharedMemory(create=True, size=max(self.width * self.height, 1))
+        self.__state_memory: SharedMemory = SharedMemory(create=True, size=_state_size(self.width, self.height))
+        self.static: np.ndarray = np.ndarray((self.height, self.width), dtype=np.uint8,
+                                             buffer=self.__static_memory.buf)
+        self.state: dict[str, np.ndarray] = _state_arrays(self.__state_memory.buf, self.width, self.height)
+        self.__dynamite: dict[tuple[int, int], tuple[int, GameObject]] = {}  # (x, y) -> (layer, dynamite)
+        self.update(world, avatars, 0)
+
+    @property
+    def names(self) -> tuple[str, str]:
+        return self.__static_memory.name, self.__state_memory.name
+
+    def update(self, world: GameObject, avatars: list[GameObject], turn: int, changes: ChangeSet | None = None) -> None:
+        sequence: np.ndarray = self.state['sequence']
+        sequence[0] += 1
+        try:
+            self.__update(world, avatars, turn, changes)
+        finally:
+            sequence[0] += 1
+
+    def __update(self, world: GameObject, avatars: list[GameObject], turn: int, changes: ChangeSet | None) -> None:
+        game_map: list[list[GameObject]] = world.game_map
+        if changes is None or changes.full:
+            positions: Iterator[tuple[int, int]] = ((x, y) for y in range(self.height) for x in range(self.width))
+        else:
+            positions = iter(changes.tiles)
+        for x, y in positions:
+            self.__write_tile(x, y, game_map[y][x])
+
+        extras: np.ndarray = self.state['extras']
+        for (x, y), (layer, dynamite) in self.__dynamite.items():
+            extras[y, x, layer] = dynamite.fuse
+
+        avatar_block: np.ndarray = self.state['avatars']
+        avatar_block.fill(0)
+        for avatar in avatars:
+            row: np.ndarray = avatar_block[avatar.company.value - 1]
+            position: Vector | None = avatar.position
+            row[:] = (0 if position is None else position.x, 0 if position is None else position.y,
+                      position is not None, avatar.score, avatar.science_points, avatar.movement_speed,
+                      avatar.drop_rate)
+
+        inventories: np.ndarray = self.state['inventories']
+        for company in Company:
+            for slot, item in enumerate(world.inventory_manager.get_inventory(company)[:INVENTORY_SIZE]):
+                inventories[company.value - 1, slot] = EMPTY if item is None else item.object_type.value
+
+        self.state['turn'][0] = turn
+
+    def close(self) -> None:
+        del self.static, self.state
+        self.__static_memory.close()
+        self.__state_memory.close()
+
+    def unlink(self) -> None:
+        if sys.version_info < (3, 13) and os.name == 'posix':
+            # a view attached from a process sharing this one's resource_tracker took the segments off of it, and
+            # unlink() unregisters them
+            for name in self.names:
+                resource_tracker.register(_tracked_name(name), 'shared_memory')
+        self.__static_memory.unlink()
+        self.__state_memory.unlink()
+
+    def __write_tile(self, x: int, y: int, tile: GameObject) -> None:
+        layers: np.ndarray = self.state['layers']
+        extras: np.ndarray = self.state['extras']
+        layers[y, x] = EMPTY
+        extras[y, x] = 0
+        self.state['held'][y, x] = EMPTY
+        self.static[y, x] = EMPTY
+        self.__dynamite.pop((x, y), None)
+
+        layer: int = 0
+        temp: GameObject | None = tile.occupied_by
+        while temp is not None:
+            object_type: ObjectType = temp.object_type
+            if object_type in STATIC_TYPES:
+                self.static[y, x] = object_type.value
+                held_item: GameObject | None = getattr(temp, 'held_item', None)
+                if held_item is not None:
+                    self.state['held'][y, x] = held_item.object_type.value
+            elif object_type is not ObjectType.AVATAR and layer < MAX_LAYERS:
+                layers[y, x, layer] = object_type.value
+                if object_type is ObjectType.DYNAMITE:
+                    self.__dynamite[(x, y)] = (layer, temp)
+                elif getattr(temp, 'owner_company', None) is not None:
+                    extras[y, x, layer] = temp.owner_company.value
+                layer += 1
+            temp = getattr(temp, 'occupied_by', None)
+
+
+class ReadOnlyObject:
+    """
+    A read-only stand-in for a GameObject in a SharedWorldView. It has the attributes clients read (object_type,
+    occupied_by, held_item, owner_company, target_company, fuse, company), and setting any of them raises.
+    """
+
+    def __init__(self, object_type: ObjectType, **attributes):
+        object.__setattr__(self, 'object_type', object_type)
+        object.__setattr__(self, 'occupied_by', None)
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is a read-only view; {name} cannot be set.')
+
+    def get_occupied_by(self, target: ObjectType | GameObject) -> ReadOnlyObject | None:
+        return _find(self.occupied_by, target)
+
+    def is_occupied_by_object_type(self, object_type: ObjectType) -> bool:
+        return _find(self.occupied_by, object_type) is not None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.object_type.name})'
+
+
+class SharedTileView:
+    def __init__(self, view: SharedWorldView, x: int, y: int):
+        self.__view: SharedWorldView = view
+        self.__x: int = x
+        self.__y: int = y
+
+    @property
+    def object_type(self) -> ObjectType:
+        return ObjectType.TILE
+
+    @property
+    def occupied_by(self) -> ReadOnlyObject | None:
+        return self.__view.stack(self.__x, self.__y)
+
+    def get_occupied_by(self, target: ObjectType | GameObject) -> ReadOnlyObject | None:
+        return _find(self.occupied_by, target)
+
+    def is_occupied_by_object_type(self, object_type: ObjectType) -> bool:
+        return _find(self.occupied_by, object_type) is not None
+
+
+class SharedWorldView:
+    """
+    `SharedWorldView Class Notes:`
+
+        The client side of a SharedWorld. It attaches to the segments by name and reads them in place, with
+        ``game_map[y][x].occupied_by`` chains and ``inventory_manager.get_inventory()`` working like they do on a
+        GameBoard. The objects it returns are built from the arrays when they are read and cannot be changed, and
+        the arrays themselves are marked read-only.
+
+        -----
+
+        Consistency:
+            Each of ``stack()``, ``avatar()`` and ``get_inventory()`` retries until it reads the arrays without an
+            update happening at the same time. To read several things from the same turn, pass a function to
+            ``read()``; it is called again until no update happened while it ran. Retries back off up to
+            MAX_BACKOFF seconds, and a read that can't finish within its timeout (e.g., the server died while
+            writing an update) raises a RuntimeError.
+            ::
+                ores = view.read(lambda v: [tile.get_occupied_by(ObjectType.ORE_OCCUPIABLE_STATION)
+                                            for row in v.game_map for tile in row])
+    """
+
+    def __init__(self, names: tuple[str, str], width: int, height: int):
+        self.width: int = width
+        self.height: int = height
+        self.map_size: Vector = Vector(width, height)
+        self.__static_memory, self.__state_memory = _attach(names)
+
+        self.static: np.ndarray = np.ndarray((height, width), dtype=np.uint8, buffer=self.__static_memory.buf)
+        self.static.flags.writeable = False
+        self.state: dict[str, np.ndarray] = _state_arrays(self.__state_memory.buf, width, height)
+        for array in self.state.values():
+            array.flags.writeable = False
+
+        self.game_map: list[list[SharedTileView]] = [[SharedTileView(self, x, y) for x in range(width)]
+                                                     for y in range(height)]
+        self.inventory_manager: SharedWorldView = self
+
+    @property
+    def turn(self) -> int:
+        return int(self.state['turn'][0])
+
+    def read(self, function: Callable[[SharedWorldView], T], timeout: float = READ_TIMEOUT) -> T:
+        """
+        Calls function(self) until it runs without an update starting or finishing, and returns what it returned
+        """
+        sequence: np.ndarray = self.state['sequence']
+        deadline: float = time.monotonic() + timeout
+        backoff: float = MIN_BACKOFF
+        while True:
+            before: int = int(sequence[0])
+            if before % 2 == 0:  # otherwise an update is being written
+                result: T = function(self)
+                if int(sequence[0]) == before:
+                    return result
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f'{self.__class__.__name__}.read could not read a whole turn in {timeout} seconds.')
+            time.sleep(backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF)
+
+    def avatar(self, company: Company) -> ReadOnlyObject | None:
+        return self.read(lambda view: view.__avatar(company))
+
+    def get_inventory(self, company: Company) -> list[ReadOnlyObject | None]:
+        return self.read(lambda view: view.__inventory(company))
+
+    def stack(self, x: int, y: int) -> ReadOnlyObject | None:
+        """
+        Builds the occupied_by chain of a tile: its static object, then its layers, then an avatar standing on it
+        """
+        return self.read(lambda view: view.__stack(x, y))
+
+    def close(self) -> None:
+        del self.static, self.state
+        self.__static_memory.close()
+        self.__state_memory.close()
+
+    def __avatar(self, company: Company) -> ReadOnlyObject | None:
+        row: np.ndarray = self.state['avatars'][company.value - 1]
+        fields: dict[str, int] = dict(zip(AVATAR_FIELDS, (int(value) for value in row)))
+        if not fields.pop('on_board'):
+            return None
+        position: Vector = Vector(fields.pop('x'), fields.pop('y'))
+        return ReadOnlyObject(ObjectType.AVATAR, company=company, position=position, **fields)
+
+    def __inventory(self, company: Company) -> list[ReadOnlyObject | None]:
+        return [None if value == EMPTY else ReadOnlyObject(ObjectType(int(value)))
+                for value in self.state['inventories'][company.value - 1]]
+
+    def __stack(self, x: int, y: int) -> ReadOnlyObject | None:
+        objects: list[ReadOnlyObject] = []
+        static: int = int(self.static[y, x])
+        if static != EMPTY:
+            held: int = int(self.state['held'][y, x])
+            objects.append(ReadOnlyObject(ObjectType(static), held_item=None if held == EMPTY
+                                          else ReadOnlyObject(ObjectType(held))))
+
+        for layer in range(MAX_LAYERS):
+            value: int = int(self.state['layers'][y, x, layer])
+            if value == EMPTY:
+                break
+            object_type: ObjectType = ObjectType(value)
+            extra: int = int(self.state['extras'][y, x, layer])
+            if object_type is ObjectType.DYNAMITE:
+                objects.append(ReadOnlyObject(object_type, fuse=extra))
+            else:
+                owner: Company | None = Company(extra) if extra != 0 else None
+                target: Company | None = None if owner is None else \
+                    Company.CHURCH if owner is Company.TURING else Company.TURING
+                objects.append(ReadOnlyObject(object_type, owner_company=owner, target_company=target))
+
+        for company in Company:
+            avatar: ReadOnlyObject | None = self.__avatar(company)
+            if avatar is not None and avatar.position.x == x and avatar.position.y == y:
+                objects.append(avatar)
+
+        for below, above in zip(objects, objects[1:]):
+            object.__setattr__(below, 'occupied_by', above)
+        return objects[0] if len(objects) > 0 else None
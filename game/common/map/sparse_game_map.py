@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from game.common.game_object import GameObject
+from game.common.map.tile import Tile
+
+
+class EmptyTile(Tile):
+    """
+    `EmptyTile Class Notes:`
+
+        An EmptyTile is the single shared Tile returned by a SparseGameMap for every coordinate that has nothing on
+        it. Since the same instance stands in for many coordinates, nothing can be placed on it; use
+        ``SparseGameMap.tile_for_write()`` or ``SparseGameMap.place()`` to get a real Tile for a coordinate first.
+    """
+
+    @property
+    def occupied_by(self) -> None:
+        return None
+
+    @occupied_by.setter
+    def occupied_by(self, occupied_by: GameObject | None) -> None:
+        if occupied_by is not None:
+            raise RuntimeError(f'{self.__class__.__name__} is shared and cannot be occupied. Use '
+                               f'SparseGameMap.tile_for_write() to get the Tile for a coordinate.')
+
+    def place_on_top_of_stack(self, game_object: GameObject) -> bool:
+        raise RuntimeError(f'{self.__class__.__name__} is shared and cannot be occupied. Use '
+                           f'SparseGameMap.place() to place on a coordinate.')
+
+
+EMPTY_TILE: EmptyTile = EmptyTile()
+
+
+class SparseRow:
+    """
+    A view of one row of a SparseGameMap, so ``game_map[y][x]`` works the same as it does on a list[list[Tile]].
+    """
+
+    def __init__(self, game_map: SparseGameMap, y: int):
+        self.__game_map: SparseGameMap = game_map
+        self.__y: int = y
+
+    def __getitem__(self, x: int) -> Tile:
+        return self.__game_map.get_tile(self.__check_x(x), self.__y)
+
+    def __setitem__(self, x: int, tile: Tile) -> None:
+        self.__game_map.set_tile(self.__check_x(x), self.__y, tile)
+
+    def __len__(self) -> int:
+        return self.__game_map.width
+
+    def __iter__(self) -> Iterator[Tile]:
+        for x in range(self.__game_map.width):
+            yield self.__game_map.get_tile(x, self.__y)
+
+    def __check_x(self, x: int) -> int:
+        width: int = self.__game_map.width
+        if x < 0:
+            x += width  # negative indexes work like they do for a list
+        if not 0 <= x < width:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        return x
+
+
+class SparseGameMap:
+    """
+    `SparseGameMap Class Notes:`
+
+        Most tiles on a large map are empty. The SparseGameMap only stores the Tiles that have something on them,
+        keyed by their ``y * width + x`` index, and returns the shared EMPTY_TILE for every other coordinate.
+
+        Indexing works the same as a list[list[Tile]] through row views: ``game_map[y][x]``, ``len(game_map)``, and
+        iterating over rows and tiles are all supported.
+
+        -----
+
+        Copy-on-write:
+            The EMPTY_TILE cannot be occupied. To place something on an empty coordinate, ask for a writable Tile
+            first; a new Tile is only created the first time that coordinate is written to.
+            ::
+                game_map.tile_for_write(x, y).occupied_by = Wall.shared()
+                game_map.place(x, y, station)  # places on top of the coordinate's stack
+
+        ``compact()`` drops stored Tiles that became empty again (e.g., after an ore is mined out).
+    """
+
+    def __init__(self, width: int, height: int):
+        if width is None or not isinstance(width, int) or width < 0:
+            raise ValueError(f'{self.__class__.__name__}.width must be a positive int.')
+        if height is None or not isinstance(height, int) or height < 0:
+            raise ValueError(f'{self.__class__.__name__}.height must be a positive int.')
+        self.width: int = width
+        self.height: int = height
+        self.__tiles: dict[int, Tile] = {}
+        self.__rows: list[SparseRow] = [SparseRow(self, y) for y in range(height)]
+
+    def __getitem__(self, y: int) -> SparseRow:
+        return self.__rows[y]
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[SparseRow]:
+        return iter(self.__rows)
+
+    def get_tile(self, x: int, y: int) -> Tile:
+        return self.__tiles.get(y * self.width + x, EMPTY_TILE)
+
+    def set_tile(self, x: int, y: int, tile: Tile) -> None:
+        if not isinstance(tile, Tile):
+            raise ValueError(f'{self.__class__.__name__} can only hold Tiles.')
+        if tile is EMPTY_TILE:
+            self.__tiles.pop(y * self.width + x, None)
+        else:
+            self.__tiles[y * self.width + x] = tile
+
+    def tile_for_write(self, x: int, y: int) -> Tile:
+        """
+        Returns the Tile stored for the coordinate, creating it if the coordinate was empty
+        """
+        index: int = y * self.width + x
+        tile: Tile | None = self.__tiles.get(index)
+        if tile is None:
+            tile = Tile()
+            self.__tiles[index] = tile
+        return tile
+
+    def place(self, x: int, y: int, game_object: GameObject) -> None:
+        """
+        Places the given GameObject on top of the coordinate's occupied_by stack
+        """
+        temp: GameObject = self.tile_for_write(x, y)
+
+        while temp.occupied_by is not None and hasattr(temp.occupied_by, 'occupied_by'):
+            temp = temp.occupied_by
+
+        if temp.occupied_by is not None:
+            raise ValueError("Last item on the given tile doesn't have the 'occupied_by' attribute.")
+
+        temp.occupied_by = game_object
+
+    def occupied_tiles(self) -> Iterator[tuple[int, int, Tile]]:
+        """
+        Yields (x, y, tile) for every stored Tile
+        """
+        for index, tile in self.__tiles.items():
+            yield index % self.width, index // self.width, tile
+
+    def compact(self) -> None:
+        self.__tiles = {index: tile for index, tile in self.__tiles.items() if tile.occupied_by is not None}
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        return position[1] * self.width + position[0] in self.__tiles
@@ -1,13 +1,28 @@
-from typing import Self
+from __future__ import annotations
+
+from typing import Self, TYPE_CHECKING
 
-from game.common.avatar import Avatar
 from game.common.enums import ObjectType
 from game.common.game_object import GameObject
 from game.common.map.occupiable import Occupiable
-from game.common.map.wall import Wall
-from game.common.stations.station import Station
-from game.common.stations.occupiable_station import OccupiableStation
-from game.quarry_rush.station.company_station import ChurchStation, TuringStation
+from game.utils.lazy_import import lazy_getattr
+
+if TYPE_CHECKING:
+    from game.common.avatar import Avatar
+    from game.common.map.wall import Wall
+    from game.common.stations.station import Station
+    from game.common.stations.occupiable_station import OccupiableStation
+    from game.quarry_rush.station.company_station import ChurchStation, TuringStation
+
+# the objects a Tile can hold are only imported when they are first used, since most of them import Tile's neighbours
+__getattr__ = lazy_getattr(__name__, {
+    'Avatar': 'game.common.avatar',
+    'Wall': 'game.common.map.wall',
+    'Station': 'game.common.stations.station',
+    'OccupiableStation': 'game.common.stations.occupiable_station',
+    'ChurchStation': 'game.quarry_rush.station.company_station',
+    'TuringStation': 'game.quarry_rush.station.company_station',
+})
 
 
 class Tile(Occupiable):
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 from game.common.enums import ObjectType
 from game.common.game_object import GameObject
+from typing import Self
 
 
 class Wall(GameObject):
@@ -7,8 +10,51 @@ class Wall(GameObject):
     `Wall Class Note:`
 
         The Wall class is used for creating objects that border the map. These are impassable.
+
+        Walls have no state, so every tile can hold the same instance. Use ``Wall.shared()`` instead of ``Wall()``
+        when building a map. The shared Wall has the fixed id ``Wall.SHARED_ID`` and can't be changed once made;
+        ``from_json()`` gives the shared Wall back for any data with that id.
     """
+    __shared: Wall | None = None
+    SHARED_ID: str = 'wall'
+
     def __init__(self):
         super().__init__()
         self.object_type = ObjectType.WALL
-    
\ No newline at end of file
+
+    def __setattr__(self, name: str, value) -> None:
+        if self is Wall.__shared:
+            raise AttributeError(f'{self.__class__.__name__}.shared() must not be modified.')
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self is Wall.__shared:
+            raise AttributeError(f'{self.__class__.__name__}.shared() must not be modified.')
+        super().__delattr__(name)
+
+    @classmethod
+    def shared(cls) -> Wall:
+        """
+        Returns the Wall instance shared by every tile
+        """
+        if Wall.__shared is None:
+            wall: Wall = Wall()
+            wall.id = Wall.SHARED_ID
+            Wall.__shared = wall
+        return Wall.__shared
+
+    def to_json(self) -> dict:
+        data: dict = dict()
+        data['id'] = self.id
+        data['object_type'] = self.object_type.value
+        data['state'] = self.state
+        return data
+
+    def from_json(self, data: dict) -> Self:
+        # every wall written with the shared id comes back as the one shared instance
+        if data['id'] == Wall.SHARED_ID:
+            return Wall.shared()
+        self.id = data['id']
+        self.object_type = ObjectType(data['object_type'])
+        self.state = data['state']
+        return self
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from game.common.enums import ObjectType, Company
+from game.common.game_object import GameObject
+
+MASK_64: int = (1 << 64) - 1
+
+# feature kinds, mixed into every key so the same numbers in two kinds never share a key
+OCCUPANT: int = 1
+ORE: int = 2
+AVATAR: int = 3
+INVENTORY: int = 4
+TECH: int = 5
+
+
+def zobrist_key(*feature: int) -> int:
+    """
+    Returns the 64-bit key of a feature. Keys are derived with splitmix64 instead of drawn from a table, so they are
+    the same in every process and run without storing anything.
+    """
+    value: int = 0
+    for part in feature:
+        value = (value ^ part) + 0x9E3779B97F4A7C15 & MASK_64
+        value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK_64
+        value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK_64
+        value ^= value >> 31
+    return value
+
+
+def researched_mask(avatar: GameObject) -> int:
+    """
+    Returns the avatar's researched tech mask, or 0 for an avatar without ``get_researched_mask()`` (the launcher's)
+    """
+    get_researched_mask = getattr(avatar, 'get_researched_mask', None)
+    return 0 if get_researched_mask is None else get_researched_mask()
+
+
+def inventory_counts(inventory: list[GameObject | None]) -> dict[ObjectType, int]:
+    counts: dict[ObjectType, int] = {}
+    for item in inventory:
+        if item is not None:
+            counts[item.object_type] = counts.get(item.object_type, 0) + 1
+    return counts
+
+
+class ZobristHash:
+    """
+    `ZobristHash Class Notes:`
+
+        The ZobristHash is a 64-bit hash of the state of a GameBoard, where every feature of the state has its own
+        random key and the hash is the XOR of the keys of every feature that is present. XOR undoes itself, so a
+        change to the board is applied by XORing the key out for the old feature and in for the new one; this is
+        O(1) per mutation no matter how big the board is. Two equal boards always have equal hashes.
+
+        -----
+
+        Features:
+            - ``occupant``: an ObjectType in the occupied_by stack of a tile (avatars are tracked separately)
+            - ``ore``: the ObjectType of the item held by a station on a tile
+            - ``avatar``: the tile a company's avatar is on
+            - ``inventory``: how many items of an ObjectType are in a company's inventory
+            - ``tech``: a tech bit that is set in a company's researched mask (see ``Avatar.get_researched_mask()``)
+
+        -----
+
+        Updates:
+            ``GameBoard.zobrist`` is kept up to date by a ZobristTracker, which only hashes again the tiles written
+            since the last read. A search that simulates moves on its own copy of the state calls the matching method
+            per change:
+            ::
+                zobrist.toggle_occupant(x, y, ObjectType.LANDMINE)  # a landmine was placed or removed
+                zobrist.move_avatar(Company.CHURCH, (1, 1), (1, 2))
+                zobrist.set_inventory_count(Company.CHURCH, ObjectType.COPIUM, 3, 5)
+
+            ``from_game_map()`` computes the hash from scratch, which can be compared against the incremental value
+            to check that every simulated change was accounted for.
+    """
+
+    def __init__(self, width: int, value: int = 0):
+        self.width: int = width
+        self.value: int = value
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ZobristHash) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return self.value
+
+    @classmethod
+    def from_game_map(cls, game_map: list[list[GameObject]],
+                      inventories: dict[Company, list[GameObject | None]] | None = None) -> ZobristHash:
+        """
+        Computes the hash from scratch. The tech masks are read from the avatars on the game_map.
+        """
+        height: int = len(game_map)
+        width: int = len(game_map[0]) if height > 0 else 0
+        zobrist: ZobristHash = cls(width)
+
+        for y, row in enumerate(game_map):
+            for x, tile in enumerate(row):
+                value, avatars = zobrist.tile_value(x, y, tile)
+                zobrist.value ^= value
+                for avatar in avatars:
+                    zobrist.set_tech_mask(avatar.company, 0, researched_mask(avatar))
+
+        for company, inventory in ({} if inventories is None else inventories).items():
+            for object_type, count in inventory_counts(inventory).items():
+                zobrist.set_inventory_count(company, object_type, 0, count)
+
+        return zobrist
+
+    def tile_value(self, x: int, y: int, tile: GameObject) -> tuple[int, list[GameObject]]:
+        """
+        Returns the part of the hash that comes from a tile's occupied_by stack, and the avatars on the tile. The
+        avatars' tech masks aren't part of the value.
+        """
+        index: int = y * self.width + x
+        value: int = 0
+        avatars: list[GameObject] = []
+        temp: GameObject | None = tile.occupied_by
+        while temp is not None:
+            if temp.object_type is ObjectType.AVATAR:
+                company: Company | None = getattr(temp, 'company', None)
+                if company is not None:
+                    value ^= zobrist_key(AVATAR, company.value, index)
+                    avatars.append(temp)
+            else:
+                value ^= zobrist_key(OCCUPANT, index, temp.object_type.value)
+
+            held_item: GameObject | None = getattr(temp, 'held_item', None)
+            if held_item is not None:
+                value ^= zobrist_key(ORE, index, held_item.object_type.value)
+            temp = getattr(temp, 'occupied_by', None)
+        return value, avatars
+
+    def toggle_occupant(self, x: int, y: int, object_type: ObjectType) -> None:
+        """
+        XORs an occupant in or out of the hash; call it both when the occupant is added and when it is removed
+        """
+        self.value ^= zobrist_key(OCCUPANT, y * self.width + x, object_type.value)
+
+    def toggle_ore(self, x: int, y: int, ore_type: ObjectType) -> None:
+        self.value ^= zobrist_key(ORE, y * self.width + x, ore_type.value)
+
+    def move_avatar(self, company: Company, old: tuple[int, int] | None, new: tuple[int, int] | None) -> None:
+        """
+        Moves a company's avatar from one (x, y) to another; None is used for an avatar that isn't on the board
+        """
+        if old is not None:
+            self.value ^= zobrist_key(AVATAR, company.value, old[1] * self.width + old[0])
+        if new is not None:
+            self.value ^= zobrist_key(AVATAR, company.value, new[1] * self.width + new[0])
+
+    def set_inventory_count(self, company: Company, object_type: ObjectType, old: int, new: int) -> None:
+        if old == new:
+            return
+        if old > 0:
+            self.value ^= zobrist_key(INVENTORY, company.value, object_type.value, old)
+        if new > 0:
+            self.value ^= zobrist_key(INVENTORY, company.value, object_type.value, new)
+
+    def set_tech_mask(self, company: Company, old: int, new: int) -> None:
+        """
+        Updates the hash for the bits that differ between the old and new researched masks
+        """
+        changed: int = old ^ new
+        while changed:
+            lowest: int = changed & -changed
+            self.value ^= zobrist_key(TECH, company.value, lowest.bit_length() - 1)
+            changed ^= lowest
+
+
+class ZobristTracker:
+    """
+    `ZobristTracker Class Notes:`
+
+        The ZobristTracker keeps the ZobristHash of a GameBoard up to date without scanning the whole board on every
+        read. It keeps every tile's part of the hash, and ``mark(x, y)`` tells it a tile was written; ``update()``
+        then XORs out the old part and in the new one for the marked tiles only.
+
+        -----
+
+        What is checked on every read:
+            The tech masks of the avatars last seen on the board and the item counts of the inventories are compared
+            against the last read. Both are a handful of values (an inventory has at most 50 slots), so the tech
+            purchases and inventory changes never need to be marked.
+
+        -----
+
+        What has to be marked:
+            GameBoard marks the tiles written through ``GameBoard.place()`` and ``GameBoard.tile_for_write()``, and
+            the tiles ``collect_changes()`` found changed. A tile written any other way has to be marked with
+            ``GameBoard.mark_changed(x, y)``. ``ZobristHash.from_game_map()`` can be compared against the tracked
+            hash to check that nothing was missed.
+    """
+
+    def __init__(self, game_map: list[list[GameObject]]):
+        height: int = len(game_map)
+        self.__zobrist: ZobristHash = ZobristHash(len(game_map[0]) if height > 0 else 0)
+        self.__tiles: dict[int, int] = {}  # tile index -> that tile's part of the hash, for the tiles with one
+        self.__avatars: dict[int, list[GameObject]] = {}  # tile index -> the avatars on it
+        self.__masks: dict[Company, int] = {}
+        self.__counts: dict[Company, dict[ObjectType, int]] = {}
+        self.__marked: set[int] = set()
+
+        for y, row in enumerate(game_map):
+            for x, tile in enumerate(row):
+                if tile.occupied_by is not None:
+                    self.__marked.add(y * self.__zobrist.width + x)
+
+    def mark(self, x: int, y: int) -> None:
+        self.__marked.add(y * self.__zobrist.width + x)
+
+    def mark_avatar(self, company: Company) -> None:
+        """
+        Marks the tile the company's avatar was on at the last read, e.g. because it moved off of it
+        """
+        for index, avatars in self.__avatars.items():
+            if any(avatar.company is company for avatar in avatars):
+                self.__marked.add(index)
+
+    def update(self, game_map: list[list[GameObject]],
+               inventories: dict[Company, list[GameObject | None]]) -> ZobristHash:
+        """
+        Applies the marked tiles, tech masks, and inventories to the hash and returns a copy of it
+        """
+        zobrist: ZobristHash = self.__zobrist
+        width: int = zobrist.width
+        for index in self.__marked:
+            value, avatars = zobrist.tile_value(index % width, index // width, game_map[index // width][index % width])
+            zobrist.value ^= self.__tiles.pop(index, 0) ^ value
+            self.__avatars.pop(index, None)
+            if value != 0:
+                self.__tiles[index] = value
+            if len(avatars) > 0:
+                self.__avatars[index] = avatars
+        self.__marked.clear()
+
+        masks: dict[Company, int] = {avatar.company: researched_mask(avatar)
+                                     for avatars in self.__avatars.values() for avatar in avatars}
+        for company in self.__masks.keys() | masks.keys():
+            zobrist.set_tech_mask(company, self.__masks.get(company, 0), masks.get(company, 0))
+        self.__masks = masks
+
+        for company in self.__counts.keys() | inventories.keys():
+            old: dict[ObjectType, int] = self.__counts.get(company, {})
+            new: dict[ObjectType, int] = inventory_counts(inventories.get(company, []))
+            for object_type in old.keys() | new.keys():
+                zobrist.set_inventory_count(company, object_type, old.get(object_type, 0), new.get(object_type, 0))
+            self.__counts[company] = new
+
+        return ZobristHash(width, zobrist.value)
@@ -1,6 +1,5 @@
 from typing import Self
 
-from game.common.avatar import Avatar
 from game.common.enums import ObjectType
 from game.common.game_object import GameObject
 from game.common.items.item import Item
@@ -1,11 +1,14 @@
-from typing import Self
+from __future__ import annotations
+
+from typing import Self, TYPE_CHECKING
 
-from game.common.avatar import Avatar
 from game.common.game_object import GameObject
-from game.quarry_rush.avatar.inventory_manager import InventoryManager
-from game.quarry_rush.entity.ancient_tech import AncientTech
 from game.quarry_rush.entity.ores import *
 
+if TYPE_CHECKING:
+    from game.common.avatar import Avatar
+    from game.quarry_rush.avatar.inventory_manager import InventoryManager
+
 
 # create Station object from GameObject that allows item to be contained in it
 class Station(GameObject):
@@ -1,5 +1,6 @@
 from game.common.enums import ObjectType
 from game.common.game_object import GameObject
+from game.utils.timer_wheel import TimerWheel
 from typing import Self
 
 
@@ -8,6 +9,8 @@ class ActiveAbility(GameObject):
     def __init__(self, cooldown: int = 1, fuse: int = 0):
         super().__init__()
         self.object_type: ObjectType = ObjectType.ACTIVE_ABILITY
+        self.timer_wheel: TimerWheel | None = None  # when set, the fuse is derived from the wheel's current turn
+        self.expiry_turn: int = 0  # the turn the ability can be used again; only used with a timer_wheel
         self.cooldown: int = cooldown  # variable shouldn't change; used to reset the fuse
         self.fuse: int = fuse  # variable to keep track of how many turns until the ability can be used again
         self.is_usable: bool = fuse == 0
@@ -31,6 +34,8 @@ class ActiveAbility(GameObject):
 # fuse getter
     @property
     def fuse(self) -> int:
+        if self.timer_wheel is not None:
+            return max(self.expiry_turn - self.timer_wheel.turn, 0)
         return self.__fuse
 
 # fuse setter
@@ -41,11 +46,14 @@ class ActiveAbility(GameObject):
         if fuse < 0:
             raise ValueError(f'{self.__class__.__name__}.fuse cannot be negative')
         self.__fuse = fuse
+        self.timer_wheel = None  # setting the fuse directly goes back to counting it down every turn
         self.is_usable = fuse == 0  # adjust bool value for if the ability is usable or not
 
     # is_usable getter property
     @property
     def is_usable(self) -> bool:
+        if self.timer_wheel is not None:
+            return self.timer_wheel.turn >= self.expiry_turn
         return self.__is_usable
 
     # is_usable setter. Property helps with visualization
@@ -55,13 +63,50 @@ class ActiveAbility(GameObject):
             raise ValueError(f'{self.__class__.__name__}.is_usable must be a bool')
         self.__is_usable = is_usable
 
+# timer_wheel getter
+    @property
+    def timer_wheel(self) -> TimerWheel | None:
+        return self.__timer_wheel
+
+# timer_wheel setter
+    @timer_wheel.setter
+    def timer_wheel(self, timer_wheel: TimerWheel | None) -> None:
+        if timer_wheel is not None and not isinstance(timer_wheel, TimerWheel):
+            raise ValueError(f'{self.__class__.__name__}.timer_wheel must be a TimerWheel or None')
+        self.__timer_wheel = timer_wheel
+
+# expiry_turn getter
+    @property
+    def expiry_turn(self) -> int:
+        return self.__expiry_turn
+
+# expiry_turn setter
+    @expiry_turn.setter
+    def expiry_turn(self, expiry_turn: int) -> None:
+        if expiry_turn is None or not isinstance(expiry_turn, int):
+            raise ValueError(f'{self.__class__.__name__}.expiry_turn must be an int')
+        if expiry_turn < 0:
+            raise ValueError(f'{self.__class__.__name__}.expiry_turn cannot be negative')
+        self.__expiry_turn = expiry_turn
+
 # decrease cooldown, decrement cooldown: at the end of each turn it will have to be called for each avatar
     def decrease_fuse(self):
-        ...
+        if self.timer_wheel is not None:
+            return  # the fuse is derived from the timer wheel, so there is nothing to count down
+        self.fuse = max(self.fuse - 1, 0)  # through the setter so is_usable flips once the fuse reaches 0
 
-# reset cooldown tick: resetting the cooldown tick
+# reset cooldown tick: resetting the cooldown tick; an ability bound to a timer wheel is scheduled on it again
     def reset_fuse(self):
-        ...
+        if self.timer_wheel is not None:
+            self.start_fuse(self.timer_wheel)
+        else:
+            self.fuse = self.cooldown
+
+# start fuse: resets the fuse by scheduling the expiry turn instead of counting down every turn
+    def start_fuse(self, timer_wheel: TimerWheel) -> None:
+        self.fuse = self.cooldown
+        self.expiry_turn = timer_wheel.turn + self.cooldown
+        self.timer_wheel = timer_wheel
 
 # to json
     def to_json(self) -> dict:
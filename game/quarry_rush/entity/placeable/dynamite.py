@@ -1,6 +1,7 @@
 from game.utils.vector import Vector
 from game.common.stations.occupiable_station import OccupiableStation
 from game.common.enums import *
+from game.utils.timer_wheel import TimerWheel
 from typing import Self
 
 
@@ -13,9 +14,11 @@ class Dynamite(OccupiableStation):
         super().__init__()
         self.position: Vector | None = position
         self.blast_radius: int = blast_radius
-        self.fuse: int = 3  # how many turns it'll take before the dynamite explodes
         self.object_type: ObjectType = ObjectType.DYNAMITE
         self.company: Company = company
+        self.timer_wheel: TimerWheel | None = None  # when set, the fuse is derived from the wheel's current turn
+        self.expiry_turn: int = 0  # the turn the dynamite explodes on; only used with a timer_wheel
+        self.fuse: int = 3  # how many turns it'll take before the dynamite explodes
 
         # property to be used for the visualizer mainly; will have a separate method for other uses in gameboard
         self.can_explode = False
@@ -44,6 +47,23 @@ class Dynamite(OccupiableStation):
             raise ValueError(f'{self.__class__.__name__}.blast_radius must be an int.')
         self.__blast_radius: int = blast_radius
 
+    # fuse getter
+    @property
+    def fuse(self) -> int:
+        if self.timer_wheel is not None:
+            return max(self.expiry_turn - self.timer_wheel.turn, 0)
+        return self.__fuse
+
+    # fuse setter
+    @fuse.setter
+    def fuse(self, fuse: int) -> None:
+        if fuse is None or not isinstance(fuse, int):
+            raise ValueError(f'{self.__class__.__name__}.fuse must be an int.')
+        if fuse < 0:
+            raise ValueError(f'{self.__class__.__name__}.fuse cannot be negative.')
+        self.__fuse: int = fuse
+        self.timer_wheel = None  # setting the fuse directly goes back to counting it down every turn
+
     # can_explode getter
     @property
     def can_explode(self) -> bool:
@@ -68,12 +88,56 @@ class Dynamite(OccupiableStation):
             raise ValueError(f'{self.__class__.__name__}.company must be a Company enum.')
         self.__company = company
 
+    # timer_wheel getter
+    @property
+    def timer_wheel(self) -> TimerWheel | None:
+        return self.__timer_wheel
+
+    # timer_wheel setter
+    @timer_wheel.setter
+    def timer_wheel(self, timer_wheel: TimerWheel | None) -> None:
+        if timer_wheel is not None and not isinstance(timer_wheel, TimerWheel):
+            raise ValueError(f'{self.__class__.__name__}.timer_wheel must be a TimerWheel or None.')
+        self.__timer_wheel = timer_wheel
+
+    # expiry_turn getter
+    @property
+    def expiry_turn(self) -> int:
+        return self.__expiry_turn
+
+    # expiry_turn setter
+    @expiry_turn.setter
+    def expiry_turn(self, expiry_turn: int) -> None:
+        if expiry_turn is None or not isinstance(expiry_turn, int):
+            raise ValueError(f'{self.__class__.__name__}.expiry_turn must be an int.')
+        self.__expiry_turn = expiry_turn
+
+    def start_fuse(self, timer_wheel: TimerWheel) -> None:
+        """
+        Schedules the dynamite on the given TimerWheel. The wheel will return this dynamite from ``advance()`` on the
+        turn it explodes, so it no longer needs to be decremented every turn. Dynamite with a fuse of 0 can already
+        explode, so it isn't scheduled.
+        """
+        if self.fuse == 0:
+            self.can_explode = True
+            return
+        self.expiry_turn = timer_wheel.turn + self.fuse
+        self.timer_wheel = timer_wheel
+        timer_wheel.schedule(self.expiry_turn, self)
 
     def decrement_fuse(self) -> None:
-        ...
+        if self.timer_wheel is not None:
+            self.is_fuse_at_0()  # the fuse is derived from the timer wheel, so there is nothing to count down
+            return
+        self.fuse = max(self.fuse - 1, 0)
+        self.can_explode = True if self.fuse == 0 else False
 
     def is_fuse_at_0(self) -> bool:
-        ...
+        """
+        Reassigns the bool value of can_explode and returns if the dynamite can explode or not
+        """
+        self.can_explode = True if self.fuse == 0 else False
+        return self.can_explode
 
     # detonate method
     def detonate(self):
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 from game.common.stations.occupiable_station import OccupiableStation
 from game.utils.vector import Vector
 from game.common.enums import *
-from game.quarry_rush.avatar.inventory_manager import InventoryManager
-from typing import Self
+from typing import Self, TYPE_CHECKING
 from typing import Callable
 
+if TYPE_CHECKING:
+    from game.quarry_rush.avatar.inventory_manager import InventoryManager
+
 
 class Trap(OccupiableStation):
     """
@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 from game.common.stations.occupiable_station import OccupiableStation
-from game.common.avatar import Avatar
 from game.common.enums import Company
-from game.quarry_rush.avatar.inventory_manager import InventoryManager
 from game.common.enums import ObjectType
-from typing import Self
+from typing import Self, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game.common.avatar import Avatar
+    from game.quarry_rush.avatar.inventory_manager import InventoryManager
 
 
 class CompanyStation(OccupiableStation):
@@ -1,14 +1,18 @@
+from __future__ import annotations
+
 import random
 from game.common.enums import ObjectType, Company
 from game.common.game_object import GameObject
 from game.common.stations.occupiable_station import OccupiableStation
-from game.quarry_rush.avatar.inventory_manager import InventoryManager
 from game.quarry_rush.entity.ancient_tech import AncientTech
 from game.quarry_rush.entity.ores import Lambdium, Turite, Copium
 from game.utils.vector import Vector
-from game.common.map.tile import Tile
-from game.common.avatar import Avatar
-from typing import Self
+from typing import Self, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game.common.avatar import Avatar
+    from game.common.map.tile import Tile
+    from game.quarry_rush.avatar.inventory_manager import InventoryManager
 
 
 class OreOccupiableStation(OccupiableStation):
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import Callable, Self
+
+from game.common.enums import ActionType
+from game.quarry_rush.tech.tech_tree import TECH_IDS, TECH_PREREQUISITES, TECH_EXCLUSIONS, TECH_TABLE, TechStats
+
+# The action a client returns to buy each tech
+TECH_ACTIONS: dict[str, ActionType] = {
+    'Improved Drivetrain': ActionType.BUY_IMPROVED_DRIVETRAIN,
+    'Superior Drivetrain': ActionType.BUY_SUPERIOR_DRIVETRAIN,
+    'Overdrive Drivetrain': ActionType.BUY_OVERDRIVE_DRIVETRAIN,
+    'Improved Mining': ActionType.BUY_IMPROVED_MINING,
+    'Superior Mining': ActionType.BUY_SUPERIOR_MINING,
+    'Overdrive Mining': ActionType.BUY_OVERDRIVE_MINING,
+    'Dynamite': ActionType.BUY_DYNAMITE,
+    'Landmines': ActionType.BUY_LANDMINES,
+    'EMPs': ActionType.BUY_EMPS,
+    'Trap Defusal': ActionType.BUY_TRAP_DEFUSAL,
+}
+
+# What an ore station gives on average over its life, from the item values and the mean inner weights of the
+# launcher's collectable_weights_dict.py: Copium (20) always, a special ore (80 for the avatar's own ore and 24 for
+# the other) 38% of the time, and Ancient Tech (10 science points) 58% of the time
+STATION_POINTS: float = 20 + 0.38 * (80 + 24) / 2
+STATION_SCIENCE: float = 0.58 * 10
+STATION_MINES: float = 1 + 0.38 + 0.58  # one turn of mining for every item the station holds
+STATION_TRAVEL: float = 3.0  # tiles walked per station, counting the trips back to the base
+
+NO_PURCHASE: int = 255  # stored in the table when the best move is to save science points
+_HEADER: struct.Struct = struct.Struct('<4sHHHHH')
+_MAGIC: bytes = b'TRT1'
+
+
+def default_income(drop_rate: int, movement_speed: int) -> tuple[float, float]:
+    """
+    An estimate of the (score, science points) earned per turn for the given drop rate and movement speed. Every
+    turn of mining gives ``drop_rate`` copies of the station's item, and a faster avatar walks between stations in
+    fewer turns. Pass an income function measured from your own client to ``solve_tech_routes`` for better tables.
+    """
+    turns_per_station: float = STATION_MINES + STATION_TRAVEL / movement_speed
+    return STATION_POINTS * drop_rate / turns_per_station, STATION_SCIENCE * drop_rate / turns_per_station
+
+
+class TechRouteTable:
+    """
+    `TechRouteTable Class Notes:`
+
+        A lookup table from (turn, science points, researched techs) to the best tech to buy next. The table is
+        made offline by ``solve_tech_routes`` and is then used by a client with one lookup per turn.
+
+        -----
+
+        Buckets:
+            Turns are grouped into buckets of ``turns_per_bucket`` turns and science points into buckets of
+            ``science_step`` points. Each science point bucket is solved with its lowest value, so the table never
+            suggests a tech the avatar can't afford.
+
+        -----
+
+        Researched techs:
+            The researched techs are given as the TechTree's researched bitmask (see TECH_IDS in tech_tree.py). Only
+            the masks that can be reached by researching techs in order are stored.
+
+        -----
+
+        Serialization:
+            ``to_bytes()`` writes a small header, the stored masks, and one byte per table entry holding either the
+            tech id to buy or NO_PURCHASE.
+    """
+
+    def __init__(self, turns_per_bucket: int, turn_buckets: int, science_step: int, science_buckets: int,
+                 masks: list[int], actions: array):
+        if len(actions) != turn_buckets * science_buckets * len(masks):
+            raise ValueError(f'{self.__class__.__name__}.actions does not match the size of the table.')
+        self.turns_per_bucket: int = turns_per_bucket
+        self.turn_buckets: int = turn_buckets
+        self.science_step: int = science_step
+        self.science_buckets: int = science_buckets
+        self.masks: list[int] = masks
+        self.actions: array = actions
+        self.__mask_indices: dict[int, int] = {mask: index for index, mask in enumerate(masks)}
+        self.__tech_names: list[str] = list(TECH_IDS)
+
+    def best_purchase(self, turn: int, science_points: int, researched_mask: int) -> str | None:
+        """
+        Returns the name of the tech to buy, or None if nothing should be bought right now
+        """
+        mask_index: int | None = self.__mask_indices.get(researched_mask)
+        if mask_index is None:
+            return None
+
+        turn_bucket: int = min(max(turn, 0) // self.turns_per_bucket, self.turn_buckets - 1)
+        science_bucket: int = min(max(science_points, 0) // self.science_step, self.science_buckets - 1)
+        action: int = self.actions[
+            (turn_bucket * self.science_buckets + science_bucket) * len(self.masks) + mask_index]
+        return None if action == NO_PURCHASE else self.__tech_names[action]
+
+    def best_action(self, turn: int, science_points: int, researched_mask: int) -> ActionType | None:
+        """
+        Returns the ActionType that buys the best tech, or None if nothing should be bought right now
+        """
+        tech_name: str | None = self.best_purchase(turn, science_points, researched_mask)
+        return None if tech_name is None else TECH_ACTIONS[tech_name]
+
+    def to_bytes(self) -> bytes:
+        header: bytes = _HEADER.pack(_MAGIC, self.turns_per_bucket, self.turn_buckets, self.science_step,
+                                     self.science_buckets, len(self.masks))
+        return header + array('H', self.masks).tobytes() + self.actions.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        magic, turns_per_bucket, turn_buckets, science_step, science_buckets, mask_count = \
+            _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f'The given data is not a {cls.__name__}.')
+
+        masks: array = array('H')
+        masks.frombytes(data[_HEADER.size:_HEADER.size + mask_count * masks.itemsize])
+        actions: array = array('B')
+        actions.frombytes(data[_HEADER.size + mask_count * masks.itemsize:])
+        return cls(turns_per_bucket, turn_buckets, science_step, science_buckets, masks.tolist(), actions)
+
+
+def _reachable_masks() -> list[int]:
+    """
+    Returns every researched mask that can be reached from the starting tree, sorted so supersets come first
+    """
+    prerequisite_masks: list[int] = [0 if prerequisite is None else 1 << TECH_IDS[prerequisite]
+                                     for prerequisite in TECH_PREREQUISITES.values()]
+    exclusion_masks: list[int] = [1 << TECH_IDS[TECH_EXCLUSIONS[name]] if name in TECH_EXCLUSIONS else 0
+                                  for name in TECH_IDS]
+
+    start: int = 1 << TECH_IDS['Mining Robotics']
+    seen: set[int] = {start}
+    to_visit: list[int] = [start]
+    while to_visit:
+        mask: int = to_visit.pop()
+        for tech_id in range(len(TECH_IDS)):
+            if mask & ((1 << tech_id) | exclusion_masks[tech_id]) == 0 \
+                    and mask & prerequisite_masks[tech_id] == prerequisite_masks[tech_id]:
+                next_mask: int = mask | 1 << tech_id
+                if next_mask not in seen:
+                    seen.add(next_mask)
+                    to_visit.append(next_mask)
+
+    return sorted(seen, key=lambda m: (-m.bit_count(), m))
+
+
+def solve_tech_routes(max_turns: int = 200, turns_per_bucket: int = 10, science_step: int = 10,
+                      max_science_points: int = 600,
+                      income: Callable[[int, int], tuple[float, float]] = default_income,
+                      tech_table: dict[str, TechStats] | None = None) -> TechRouteTable:
+    """
+    Finds the best tech to buy for every (turn bucket, science point bucket, researched mask) with dynamic
+    programming over the remaining turns. The value of a state is the score from techs bought plus the score the
+    avatar is expected to earn with its movement speed and drop rate until the game ends.
+
+    ``income`` takes the drop rate and movement speed and returns the (score, science points) earned per turn.
+    ``tech_table`` defaults to TECH_TABLE.
+    """
+    tech_table = TECH_TABLE if tech_table is None else tech_table
+    tech_list: list[TechStats] = [tech_table[name] for name in TECH_IDS]
+    masks: list[int] = _reachable_masks()
+    mask_indices: dict[int, int] = {mask: index for index, mask in enumerate(masks)}
+    mask_count: int = len(masks)
+    turn_buckets: int = -(-max_turns // turns_per_bucket)
+    science_buckets: int = max_science_points // science_step + 1
+
+    # per mask: the techs that can be bought next, and the income earned with the mask's stats
+    purchases: list[list[int]] = []
+    incomes: list[tuple[float, float]] = []
+    for mask in masks:
+        purchases.append([tech_id for tech_id in range(len(tech_list))
+                          if (mask | 1 << tech_id) in mask_indices and not mask >> tech_id & 1])
+        researched: list[TechStats] = [tech for tech_id, tech in enumerate(tech_list) if mask >> tech_id & 1]
+        movement_speed: int = 1 + sum(tech.movement for tech in researched)
+        drop_rate: int = 1 + sum(tech.mining for tech in researched)
+        incomes.append(income(drop_rate, movement_speed))
+
+    actions: array = array('B', bytes(turn_buckets * science_buckets * mask_count))
+    next_values: list[float] = [0.0] * (science_buckets * mask_count)  # the game is over after the last bucket
+
+    for turn_bucket in reversed(range(turn_buckets)):
+        bucket_turns: int = min(turns_per_bucket, max_turns - turn_bucket * turns_per_bucket)
+        values: list[float] = [0.0] * (science_buckets * mask_count)
+
+        for science_bucket in range(science_buckets):
+            science_points: int = science_bucket * science_step
+            row: int = science_bucket * mask_count
+            table_row: int = (turn_bucket * science_buckets + science_bucket) * mask_count
+
+            # supersets come first in masks, so buying a tech always leads to a state that is already solved
+            for mask_index, mask in enumerate(masks):
+                score_income, science_income = incomes[mask_index]
+                saved_bucket: int = min((science_points + int(science_income * bucket_turns)) // science_step,
+                                        science_buckets - 1)
+                best_value: float = score_income * bucket_turns + next_values[saved_bucket * mask_count + mask_index]
+                best_action: int = NO_PURCHASE
+
+                for tech_id in purchases[mask_index]:
+                    tech: TechStats = tech_list[tech_id]
+                    if tech.cost > science_points:
+                        continue
+                    after_bucket: int = (science_points - tech.cost) // science_step
+                    value: float = tech.point_value + \
+                        values[after_bucket * mask_count + mask_indices[mask | 1 << tech_id]]
+                    if value > best_value:
+                        best_value = value
+                        best_action = tech_id
+
+                values[row + mask_index] = best_value
+                actions[table_row + mask_index] = best_action
+
+        next_values = values
+
+    return TechRouteTable(turns_per_bucket, turn_buckets, science_step, science_buckets, masks, actions)
@@ -1,10 +1,58 @@
 from __future__ import annotations
-from typing import Callable, TypeVar, Generic, Self
+from typing import Callable, TypeVar, Generic, NamedTuple, Self
 from game.quarry_rush.tech.tech import Tech, techs, TechInfo
 from game.quarry_rush.avatar.avatar_functions import AvatarFunctions
 from functools import reduce
 from game.common.game_object import GameObject
 
+# Every tech in the tree mapped to the tech that must be researched before it. The order of this dict gives each tech
+# its integer id (its bit in the researched mask), and a tech always comes after its prerequisite.
+TECH_PREREQUISITES: dict[str, str | None] = {
+    'Mining Robotics': None,
+    'Improved Drivetrain': 'Mining Robotics',
+    'Superior Drivetrain': 'Improved Drivetrain',
+    'Overdrive Drivetrain': 'Superior Drivetrain',
+    'Improved Mining': 'Mining Robotics',
+    'Superior Mining': 'Improved Mining',
+    'Overdrive Mining': 'Superior Mining',
+    'Dynamite': 'Improved Mining',
+    'Landmines': 'Dynamite',
+    'EMPs': 'Landmines',
+    'Trap Defusal': 'Landmines',
+}
+
+# Techs that can't both be researched
+TECH_EXCLUSIONS: dict[str, str] = {
+    'EMPs': 'Trap Defusal',
+    'Trap Defusal': 'EMPs',
+}
+
+TECH_IDS: dict[str, int] = {name: tech_id for tech_id, name in enumerate(TECH_PREREQUISITES)}
+
+
+class TechStats(NamedTuple):
+    cost: int
+    point_value: int
+    movement: int  # how much the tech raises the movement speed
+    mining: int  # how much the tech raises the drop rate
+
+
+# The cost, points, and stat changes of every tech, matching the launcher's config.py. The Overdrive techs count as
+# one more level of movement and mining, the way the launcher's Avatar marks the fourth level as Overdrive.
+TECH_TABLE: dict[str, TechStats] = {
+    'Mining Robotics': TechStats(0, 0, 0, 0),
+    'Improved Drivetrain': TechStats(80, 150, 1, 0),
+    'Superior Drivetrain': TechStats(160, 250, 1, 0),
+    'Overdrive Drivetrain': TechStats(320, 350, 1, 0),
+    'Improved Mining': TechStats(50, 100, 0, 1),
+    'Superior Mining': TechStats(100, 150, 0, 1),
+    'Overdrive Mining': TechStats(200, 300, 0, 1),
+    'Dynamite': TechStats(70, 140, 0, 0),
+    'Landmines': TechStats(120, 240, 0, 0),
+    'EMPs': TechStats(180, 360, 0, 0),
+    'Trap Defusal': TechStats(180, 360, 0, 0),
+}
+
 
 class TechTree(GameObject):
     """
@@ -12,39 +60,112 @@ class TechTree(GameObject):
 
     Contains all functionality for researching and tech effects
 
+    The tree is compiled once into integer tech ids (see TECH_IDS). Which techs are researched is kept as a bitmask,
+    and the score is updated when a tech is researched instead of being summed on every call
+
+    Given a tech_table (e.g., TECH_TABLE), the costs and point values are taken from it and researching a tech has no
+    effect, so a bot can plan purchases, or a test can run, without an Avatar
+
     [Note]: This class does not handle cost validation or taking research points away from the player
     """
 
-    def __init__(self, avatar_functions: AvatarFunctions):
+    def __init__(self, avatar_functions: AvatarFunctions | None = None,
+                 tech_table: dict[str, TechStats] | None = None):
         super().__init__()
-        ...
+        if avatar_functions is None and tech_table is None:
+            raise ValueError(f'{self.__class__.__name__} needs avatar_functions or a tech_table.')
+        self.avatar_functions = avatar_functions
+        this_techs: dict[str, Tech] = techs(avatar_functions=avatar_functions) if tech_table is None else {
+            name: Tech(name=name, cost=stats.cost, point_value=stats.point_value, apply=lambda: None)
+            for name, stats in tech_table.items()}
+
+        # all of these lists are indexed by tech id
+        self.__techs: list[Tech] = [this_techs[name] for name in TECH_IDS]
+        self.__tech_infos: list[TechInfo] = [TechInfo(name=tech.name, cost=tech.cost, point_value=tech.point_value)
+                                             for tech in self.__techs]
+        self.__prerequisite_masks: list[int] = [
+            0 if prerequisite is None else 1 << TECH_IDS[prerequisite] for prerequisite in TECH_PREREQUISITES.values()]
+        self.__exclusion_masks: list[int] = [
+            1 << TECH_IDS[TECH_EXCLUSIONS[name]] if name in TECH_EXCLUSIONS else 0 for name in TECH_IDS]
+
+        self.__researched: int = 0
+        self.__score: int = 0
+        self.research('Mining Robotics')
+
+    @property
+    def researched_mask(self) -> int:
+        """
+        The researched techs as a bitmask; bit ``TECH_IDS[name]`` is set if the tech is researched
+        """
+        return self.__researched
 
     def tech_names(self) -> list[str]:
         """
         Returns a list of all techs that are in the tech tree regardless of whether or not they are
         researched in no particular order
         """
-        ...
+        return list(TECH_IDS)
 
     def researched_techs(self) -> list[str]:
-        ...
+        """
+        Returns a list of all of the techs that are researched in this tech tree
+        """
+        return [name for name, tech_id in TECH_IDS.items() if self.__researched >> tech_id & 1]
 
     def is_researched(self, tech_name: str) -> bool:
-        ...
+        """
+        Returns whether or not the tech with the given name is researched
+        """
+        tech_id: int | None = TECH_IDS.get(tech_name)
+        return tech_id is not None and self.__researched >> tech_id & 1 == 1
+
+    def can_research(self, tech_name: str) -> bool:
+        """
+        Returns whether or not the tech with the given name can be researched, i.e. it isn't researched yet, its
+        prerequisite is researched, and no tech it excludes is researched
+        """
+        tech_id: int | None = TECH_IDS.get(tech_name)
+        return tech_id is not None and self.__can_research_id(tech_id)
 
     def research(self, tech_name: str) -> bool:
-        ...
+        """
+        Takes the name of the tech to research and returns whether or not it was successfully researched
+        """
+        if not self.can_research(tech_name):
+            return False
+
+        tech_id: int = TECH_IDS[tech_name]
+        self.__researched |= 1 << tech_id
+        self.__score += self.__techs[tech_id].point_value
+        self.__techs[tech_id].apply()
+        return True
 
     def tech_info(self, tech_name: str) -> TechInfo | None:
         """
         Returns a TechInfo object about the tech with the given name if the tech is found in the tree.
         Returns None if the tech isn't found
+
+        The TechInfo objects are created once with the tree and shared between calls
         """
-        ...
+        tech_id: int | None = TECH_IDS.get(tech_name)
+        return None if tech_id is None else self.__tech_infos[tech_id]
+
+    def affordable_techs(self, science_points: int) -> list[str]:
+        """
+        Returns the names of the techs that can be researched (see ``can_research``) and cost at most the given
+        amount of science points, in order of their tech id
+        """
+        return [name for name, tech_id in TECH_IDS.items()
+                if self.__techs[tech_id].cost <= science_points and self.__can_research_id(tech_id)]
 
     def score(self) -> int:
         """
         Returns the total score of the tree. This is done by summing the point values of all of the techs
         that are researched
         """
-        ...
\ No newline at end of file
+        return self.__score
+
+    def __can_research_id(self, tech_id: int) -> bool:
+        prerequisite_mask: int = self.__prerequisite_masks[tech_id]
+        blocked: int = self.__researched & ((1 << tech_id) | self.__exclusion_masks[tech_id])
+        return blocked == 0 and self.__researched & prerequisite_mask == prerequisite_mask
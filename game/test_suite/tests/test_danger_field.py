@@ -0,0 +1,93 @@
+import unittest
+
+from game.common.enums import ActionType, Company
+from game.common.map.danger_field import DANGER_WEIGHTS
+from game.common.map.game_board import GameBoard
+from game.quarry_rush.entity.placeable.dynamite import Dynamite
+from game.quarry_rush.entity.placeable.traps import Landmine
+from game.utils.vector import Vector
+
+
+def client_available() -> bool:
+    # base_client is written against the launcher's game, which has the game.config this tree leaves out
+    try:
+        import base_client
+    except ImportError:
+        return False
+    return True
+
+
+class TestDangerField(unittest.TestCase):
+    """
+    `Test Danger Field Notes:`
+
+        This class tests that GameBoard.collect_changes keeps the danger_field in step with the traps and dynamite
+        on the board however they were placed or removed, and that A* walks around a hazard's range.
+    """
+
+    def setUp(self) -> None:
+        self.world: GameBoard = GameBoard(1, Vector(7, 7), walled=True)
+        self.world.generate_map()
+        self.world.collect_changes(0)
+
+    def test_trap_placed_and_removed(self):
+        landmine: Landmine = Landmine(target_company=Company.TURING, position=Vector(3, 3))
+        self.world.game_map[3][3].occupied_by = landmine  # the way the launcher's place_controller does it
+        self.world.collect_changes(1)
+        weight: int = DANGER_WEIGHTS[landmine.object_type]
+        self.assertEqual(self.world.danger_field.cost(Company.TURING, Vector(3, 2)), weight)
+        self.assertEqual(self.world.danger_field.cost(Company.CHURCH, Vector(3, 2)), 0)
+
+        self.world.game_map[3][3].occupied_by = None  # defused or set off
+        self.world.collect_changes(2)
+        self.assertEqual(len(self.world.danger_field), 0)
+        self.assertEqual(self.world.danger_field.cost(Company.TURING, Vector(3, 2)), 0)
+
+    def test_first_collect(self):
+        world: GameBoard = GameBoard(1, Vector(7, 7), walled=True, locations={
+            (Vector(2, 2),): [Landmine(position=Vector(2, 2))]})
+        world.generate_map()
+        world.collect_changes(0)
+        self.assertEqual(len(world.danger_field), 1)
+
+    def test_dynamite_detonates(self):
+        dynamite: Dynamite = Dynamite(Vector(3, 3), blast_radius=1, company=Company.CHURCH)
+        self.world.place_dynamite(dynamite)
+        self.world.collect_changes(1)
+        self.assertEqual(len(self.world.danger_field), 1)
+        for _ in range(dynamite.fuse):
+            self.world.advance_timers()
+        self.world.collect_changes(2)  # still on the board until it's removed, but it's already gone off
+        self.assertEqual(len(self.world.danger_field), 0)
+
+    @unittest.skipUnless(client_available(), "needs the launcher's game.config")
+    def test_a_star_avoids_danger(self):
+        from base_client import Client
+
+        self.world.place_dynamite(Dynamite(Vector(3, 2), blast_radius=1, company=Company.CHURCH))
+        self.world.collect_changes(1)
+        client: Client = Client()
+        client.company = Company.TURING
+        start: Vector = Vector(1, 2)
+        moves: dict[ActionType, tuple[int, int]] = {ActionType.MOVE_UP: (0, -1), ActionType.MOVE_DOWN: (0, 1),
+                                                    ActionType.MOVE_LEFT: (-1, 0), ActionType.MOVE_RIGHT: (1, 0)}
+
+        def walk(actions: list[ActionType]) -> list[tuple[int, int]]:
+            x, y = start.x, start.y
+            path: list[tuple[int, int]] = []
+            for action in actions:
+                x, y = x + moves[action][0], y + moves[action][1]
+                path.append((x, y))
+            return path
+
+        plain: list[tuple[int, int]] = walk(client.a_star_search(self.world.game_map, start, Vector(5, 2)))
+        self.assertIn((3, 2), plain)
+        safe: list[tuple[int, int]] = walk(client.a_star_search(self.world.game_map, start, Vector(5, 2),
+                                                                client.danger_grid(self.world)))
+        self.assertEqual(safe[-1], (5, 2))
+        self.assertNotIn((3, 2), safe)
+
+        def cost(path: list[tuple[int, int]]) -> int:
+            return len(path) + sum(self.world.danger_field.cost(Company.TURING, Vector(x, y)) for x, y in path)
+
+        self.assertLess(cost(safe), cost(plain))
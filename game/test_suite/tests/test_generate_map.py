@@ -0,0 +1,66 @@
+import unittest
+
+from game.common.game_object import GameObject
+from game.common.map.game_board import GameBoard
+from game.common.map.wall import Wall
+from game.common.stations.occupiable_station import OccupiableStation
+from game.utils.generation_benchmark import build_locations
+from game.utils.vector import Vector
+
+
+class TestGenerateMap(unittest.TestCase):
+    """
+    `Test Generate Map Notes:`
+
+        This class tests that generate_map places every GameObject of the locations exactly once: a dynamic group's
+        objects on distinct Vectors of its own key, and a single Vector's objects stacked on it in order.
+    """
+
+    def setUp(self) -> None:
+        self.size: int = 20
+        self.locations: dict[tuple[Vector], list[GameObject]] = build_locations(self.size, 30, 8, seed=3)
+        self.stack: list[GameObject] = [OccupiableStation(None), OccupiableStation(None), OccupiableStation(None)]
+        used: set[tuple[int, int]] = {(vector.x, vector.y) for k in self.locations for vector in k}
+        self.free: tuple[int, int] = next((x, y) for y in range(1, self.size - 1) for x in range(1, self.size - 1)
+                                      if (x, y) not in used)
+        self.locations[(Vector(*self.free),)] = self.stack
+
+    def placed(self, world: GameBoard) -> dict[int, tuple[int, int]]:
+        # id of every non-wall object on the board -> where it is; an object seen twice fails right away
+        positions: dict[int, tuple[int, int]] = {}
+        for y in range(self.size):
+            for x in range(self.size):
+                temp: GameObject | None = world.game_map[y][x].occupied_by
+                while temp is not None:
+                    if not isinstance(temp, Wall):
+                        self.assertNotIn(id(temp), positions)
+                        positions[id(temp)] = (x, y)
+                    temp = getattr(temp, 'occupied_by', None)
+        return positions
+
+    def check(self, sparse: bool) -> None:
+        world: GameBoard = GameBoard(3, Vector(self.size, self.size), self.locations, walled=True, sparse=sparse)
+        world.generate_map()
+        positions: dict[int, tuple[int, int]] = self.placed(world)
+        self.assertEqual(len(positions), sum(len(v) for v in self.locations.values()))
+
+        for k, v in self.locations.items():
+            expected: set[tuple[int, int]] = {(vector.x, vector.y) for vector in k}
+            used: list[tuple[int, int]] = [positions[id(game_object)] for game_object in v]
+            self.assertTrue(set(used) <= expected)
+            if len(k) > 1:
+                self.assertEqual(len(set(used)), len(used))
+
+    def test_every_object_once(self):
+        self.check(sparse=False)
+
+    def test_every_object_once_sparse(self):
+        self.check(sparse=True)
+
+    def test_stack_order(self):
+        world: GameBoard = GameBoard(3, Vector(self.size, self.size), self.locations, walled=True)
+        world.generate_map()
+        x, y = self.free
+        self.assertIs(world.game_map[y][x].occupied_by, self.stack[0])
+        self.assertIs(self.stack[0].occupied_by, self.stack[1])
+        self.assertIs(self.stack[1].occupied_by, self.stack[2])
@@ -0,0 +1,18 @@
+import unittest
+
+from game.utils.import_benchmark import IMPORT_BUDGETS, measure_import
+
+
+class TestImportBudgets(unittest.TestCase):
+    """
+    `Test Import Budgets Notes:`
+
+        This class tests that every module in IMPORT_BUDGETS loads no more of the game package than its budget. Each
+        module is imported in a fresh interpreter, since this one already has most of the package loaded.
+    """
+
+    def test_budgets(self):
+        for module, budget in IMPORT_BUDGETS.items():
+            with self.subTest(module=module):
+                milliseconds, loaded = measure_import(module, runs=1)
+                self.assertLessEqual(loaded, budget)
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from game.common.enums import ActionType
+from game.common.map.game_board import GameBoard
+from game.common.map.wall import Wall
+from game.utils.landmarks import LandmarkTable
+from game.utils.vector import Vector
+
+
+def client_available() -> bool:
+    # base_client is written against the launcher's game, which has the game.config this tree leaves out
+    try:
+        import base_client
+    except ImportError:
+        return False
+    return True
+
+
+class TestLandmarks(unittest.TestCase):
+    """
+    `Test Landmarks Notes:`
+
+        This class tests that the landmark heuristic never overestimates the walking distance, beats the Manhattan
+        distance behind a wall, comes back the same from its cache file, and gives A* the same path lengths.
+    """
+
+    def setUp(self) -> None:
+        # a wall across the middle column with a gap at the bottom
+        self.world: GameBoard = GameBoard(1, Vector(9, 7), walled=True)
+        self.world.generate_map()
+        for y in range(1, 5):
+            self.world.place(4, y, Wall())
+        self.table: LandmarkTable = LandmarkTable.from_game_map(self.world.game_map)
+
+    def test_heuristic(self):
+        # (2, 1) to (6, 1) is 4 apart, but the walk goes around the wall through row 5
+        self.assertEqual(self.table.heuristic(2, 1, 2, 1), 0)
+        self.assertGreater(self.table.heuristic(2, 1, 6, 1), 4)
+        self.assertLessEqual(self.table.heuristic(2, 1, 6, 1), 12)
+
+    def test_load_or_build(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            built: LandmarkTable = LandmarkTable.load_or_build(self.world.game_map, cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            loaded: LandmarkTable = LandmarkTable.load_or_build(self.world.game_map, cache_dir)
+        self.assertEqual(loaded.landmarks, built.landmarks)
+        self.assertEqual(loaded.distances, built.distances)
+
+    def test_bytes_fail(self):
+        with self.assertRaises(ValueError):
+            LandmarkTable.from_bytes(b'NOPE' + self.table.to_bytes()[4:])
+
+    @unittest.skipUnless(client_available(), "needs the launcher's game.config")
+    def test_a_star(self):
+        from base_client import Client
+
+        client: Client = Client()
+        for start, end in ((Vector(2, 1), Vector(6, 1)), (Vector(1, 5), Vector(7, 2)), (Vector(3, 3), Vector(3, 3))):
+            plain: list[ActionType] = client.a_star_search(self.world.game_map, start, end)
+            alt: list[ActionType] = client.a_star_search(self.world.game_map, start, end, landmarks=self.table)
+            self.assertEqual(len(alt), len(plain))
+        self.assertEqual(len(client.a_star_search(self.world.game_map, Vector(2, 1), Vector(6, 1),
+                                                  landmarks=self.table)), 12)
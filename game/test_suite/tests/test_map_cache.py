@@ -0,0 +1,134 @@
+import os
+import random
+import tempfile
+import unittest
+
+from game.common.avatar import Avatar
+from game.common.enums import Company, ObjectType
+from game.common.game_object import GameObject
+from game.common.map.game_board import GameBoard
+from game.common.map.map_cache import CacheEntry, MapCache, decode_board, encode_board
+from game.quarry_rush.entity.ancient_tech import AncientTech
+from game.quarry_rush.entity.ores import Lambdium, Turite
+from game.quarry_rush.entity.placeable.traps import Landmine
+from game.quarry_rush.station.company_station import ChurchStation, TuringStation
+from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+from game.utils.vector import Vector
+
+
+def avatars_available() -> bool:
+    # this tree's Avatar leaves its tech tree to the launcher's copy, so it can only be made with the launcher's game
+    try:
+        Avatar()
+    except AttributeError:
+        return False
+    return True
+
+
+def generate(seed: int, map_size: Vector) -> GameBoard:
+    """
+    A walled board with both bases and ore stations holding every kind of item, placed with the global ``random``
+    the way the launcher's generator uses it
+    """
+    world: GameBoard = GameBoard(seed, map_size, walled=True)
+    world.generate_map()
+    world.game_map[1][1].occupied_by = ChurchStation()
+    world.game_map[map_size.y - 2][map_size.x - 2].occupied_by = TuringStation()
+    inside: list[tuple[int, int]] = [(x, y) for y in range(2, map_size.y - 2) for x in range(2, map_size.x - 2)]
+    for (x, y), held_item in zip(random.sample(inside, k=5), (Lambdium(), Turite(), AncientTech(), None, 'copium')):
+        station: OreOccupiableStation = OreOccupiableStation(Vector(x, y), random.random(), random.random(),
+                                                             random.random())
+        if held_item != 'copium':
+            station.held_item = held_item
+        world.game_map[y][x].occupied_by = station
+    return world
+
+
+class TestMapCache(unittest.TestCase):
+    """
+    `Test Map Cache Notes:`
+
+        This class tests that a board with walls, company stations, and ore stations comes back the same after being
+        encoded and decoded, and that a replay with a warm cache leaves ``random`` where a cold one does.
+    """
+
+    def setUp(self) -> None:
+        self.seed: int = 8675309
+        self.map_size: Vector = Vector(10, 8)
+        self.world: GameBoard = generate(self.seed, self.map_size)
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def stack(self, world: GameBoard, x: int, y: int) -> list[tuple]:
+        # what the cache has to keep for a tile: every object's type, its held item, and an avatar's company
+        objects: list[tuple] = []
+        temp: GameObject | None = world.game_map[y][x].occupied_by
+        while temp is not None:
+            held_item: GameObject | None = getattr(temp, 'held_item', None)
+            objects.append((temp.object_type, None if held_item is None else held_item.object_type,
+                            getattr(temp, 'seed', None), getattr(temp, 'company', None)))
+            temp = getattr(temp, 'occupied_by', None)
+        return objects
+
+    def assert_same_board(self, world: GameBoard, expected: GameBoard) -> None:
+        for y in range(self.map_size.y):
+            for x in range(self.map_size.x):
+                self.assertEqual(self.stack(world, x, y), self.stack(expected, x, y))
+
+    def test_round_trip(self):
+        world: GameBoard = decode_board(encode_board(self.world), self.seed, self.map_size)
+        self.assert_same_board(world, self.world)
+
+    def test_round_trip_sparse(self):
+        world: GameBoard = decode_board(encode_board(self.world), self.seed, self.map_size, sparse=True)
+        self.assert_same_board(world, self.world)
+
+    def test_encode_avatar(self):
+        avatar: GameObject = GameObject()
+        avatar.object_type = ObjectType.AVATAR
+        avatar.company = Company.TURING
+        self.world.game_map[self.map_size.y - 2][self.map_size.x - 2].occupied_by.occupied_by = avatar
+        self.world.game_map[3][1].occupied_by = avatar
+        layers = encode_board(self.world)
+        self.assertEqual(layers['avatar'][self.map_size.y - 2][self.map_size.x - 2], Company.TURING.value)
+        self.assertEqual(layers['avatar'][3][1], Company.TURING.value)
+        self.assertEqual(layers['static'][3][1], 0)
+
+    @unittest.skipUnless(avatars_available(), "needs the launcher's Avatar")
+    def test_avatars_on_bases(self):
+        self.world.game_map[1][1].occupied_by.occupied_by = Avatar(Company.CHURCH, Vector(1, 1))
+        world: GameBoard = decode_board(encode_board(self.world), self.seed, self.map_size)
+        self.assert_same_board(world, self.world)
+        avatar: Avatar = world.game_map[1][1].occupied_by.occupied_by
+        self.assertEqual(avatar.company, Company.CHURCH)
+        self.assertEqual((avatar.position.x, avatar.position.y), (1, 1))
+
+    def test_store_and_load(self):
+        cache: MapCache = MapCache(os.path.join(self.directory.name, 'cache'), 'test')
+        cache.store(self.seed, self.map_size, self.world)
+        entry: CacheEntry | None = cache.load(self.seed, self.map_size)
+        self.assertIsNotNone(entry)
+        self.assert_same_board(decode_board(entry.layers, self.seed, self.map_size), self.world)
+        self.assertEqual(cache.hits, 1)
+
+    def test_warm_matches_cold(self):
+        path: str = os.path.join(self.directory.name, 'cache')
+        cold_world: GameBoard = MapCache(path, 'test').get_or_generate(
+            self.seed, self.map_size, lambda: generate(self.seed, self.map_size))
+        cold_draws: list[float] = [random.random() for _ in range(5)]
+
+        random.seed(1)  # whatever happened in between shouldn't matter
+        warm_cache: MapCache = MapCache(path, 'test')
+        warm_world: GameBoard = warm_cache.get_or_generate(self.seed, self.map_size, lambda: self.fail('generated'))
+        warm_draws: list[float] = [random.random() for _ in range(5)]
+
+        self.assertEqual(warm_cache.hits, 1)
+        self.assert_same_board(warm_world, cold_world)
+        self.assertEqual(warm_draws, cold_draws)
+
+    def test_encode_fail(self):
+        self.world.game_map[3][3].occupied_by = Landmine()
+        with self.assertRaises(ValueError):
+            encode_board(self.world)
@@ -0,0 +1,59 @@
+import time
+import unittest
+
+from game.client.mcts_client import DEFAULT_TIME_LIMIT, SECONDS_PER_TURN, MCTSClient
+from game.common.enums import ActionType
+
+
+class CountingClient(MCTSClient):
+    """
+    A state is an int; moving up adds 1 and moving down takes 1, so MOVE_UP is always the best action. Without
+    rollouts every node is scored by its own state, so the result doesn't depend on lucky random playouts.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(rollout_depth=0, **kwargs)
+
+    def root_state(self, turn, world, avatar) -> int:
+        return 0
+
+    def legal_actions(self, state: int) -> list[ActionType]:
+        return [ActionType.MOVE_UP, ActionType.MOVE_DOWN]
+
+    def apply(self, state: int, action: ActionType) -> int:
+        return state + (1 if action is ActionType.MOVE_UP else -1)
+
+    def evaluate(self, state: int) -> float:
+        return state
+
+
+class TestMCTSClient(unittest.TestCase):
+    """
+    `Test MCTS Client Notes:`
+
+        This class tests that the MCTSClient finds the best action within its time limit, and that the worker pool
+        is made once and reused across turns.
+    """
+
+    def test_default_time_limit(self):
+        self.assertLess(DEFAULT_TIME_LIMIT, SECONDS_PER_TURN)
+        self.assertEqual(CountingClient().time_limit, DEFAULT_TIME_LIMIT)
+
+    def test_time_limit_fail(self):
+        with self.assertRaises(ValueError):
+            CountingClient(time_limit=0.01, safety_margin=0.03)
+
+    def test_take_turn(self):
+        client: CountingClient = CountingClient(seed=1)
+        start: float = time.perf_counter()
+        self.assertEqual(client.take_turn(0, [], None, None), [ActionType.MOVE_UP])
+        self.assertLess(time.perf_counter() - start, client.time_limit)
+
+    def test_workers(self):
+        with CountingClient(workers=2, seed=1) as client:
+            self.assertEqual(client.take_turn(0, [], None, None), [ActionType.MOVE_UP])
+            pool = client._MCTSClient__pool
+            self.assertIsNotNone(pool)
+            self.assertEqual(client.take_turn(1, [], None, None), [ActionType.MOVE_UP])
+            self.assertIs(client._MCTSClient__pool, pool)
+        self.assertIsNone(client._MCTSClient__pool)
@@ -0,0 +1,87 @@
+import unittest
+
+from game.common.enums import Company
+from game.common.map.game_board import GameBoard
+from game.common.map.tile import Tile
+from game.quarry_rush.entity.placeable.traps import Landmine
+from game.utils.read_only import ReadOnly, read_only_view
+from game.utils.vector import Vector
+
+
+class TestReadOnly(unittest.TestCase):
+    """
+    `Test Read Only Notes:`
+
+        This class tests that a read-only view of a GameBoard reads the same as the board, passes the same
+        isinstance checks, and raises on every write without the board changing.
+    """
+
+    def setUp(self) -> None:
+        self.build(sparse=False)
+
+    def build(self, sparse: bool) -> None:
+        self.sparse: bool = sparse
+        self.world: GameBoard = GameBoard(1, Vector(5, 4), walled=True, sparse=self.sparse)
+        self.world.generate_map()
+        self.world.place(2, 2, Landmine(position=Vector(2, 2)))
+        self.view: GameBoard = read_only_view(self.world)
+
+    def test_reads_match(self):
+        self.assertIsInstance(self.view, GameBoard)
+        self.assertIsInstance(self.view, ReadOnly)
+        self.assertEqual(self.view.map_size, self.world.map_size)
+        self.assertEqual(self.view.seed, self.world.seed)
+        for y in range(self.world.map_size.y):
+            for x in range(self.world.map_size.x):
+                original = self.world.game_map[y][x].occupied_by
+                occupied_by = self.view.game_map[y][x].occupied_by
+                self.assertEqual(None if original is None else original.id,
+                                 None if occupied_by is None else occupied_by.id)
+
+    def test_isinstance(self):
+        self.assertIsInstance(self.view.game_map[2][2], Tile)
+        self.assertIsInstance(self.view.game_map[2][2].occupied_by, Landmine)
+        if not self.sparse:
+            self.assertIsInstance(self.view.game_map, list)
+            self.assertIsInstance(self.view.game_map[0], list)
+        other: GameBoard = GameBoard(1, Vector(5, 4))
+        other.game_map = self.view.game_map  # the setter's isinstance checks pass
+
+    def test_shows_changes(self):
+        self.world.tile_for_write(1, 1).occupied_by = Landmine(position=Vector(1, 1))
+        self.assertIsNotNone(self.view.game_map[1][1].occupied_by)
+
+    def test_writes_fail(self):
+        with self.assertRaises(AttributeError):
+            self.view.seed = 5
+        with self.assertRaises(AttributeError):
+            self.view.game_map[2][2].occupied_by = None
+        with self.assertRaises(AttributeError):
+            self.view.game_map[2][2].occupied_by.target_company = Company.CHURCH
+        with self.assertRaises(TypeError):
+            self.view.game_map[2][2] = Tile()
+        with self.assertRaises((AttributeError, TypeError)):
+            self.view.place(1, 1, Landmine())
+        self.assertEqual(self.world.seed, 1)
+        self.assertIsNotNone(self.world.game_map[2][2].occupied_by)
+        self.assertEqual(self.world.game_map[2][2].occupied_by.target_company, Company.TURING)
+        self.assertIsNone(self.world.game_map[1][1].occupied_by)
+
+    def test_sequence_and_mapping(self):
+        items: list = [1, 2]
+        view: list = read_only_view(items)
+        self.assertIsInstance(view, list)
+        self.assertEqual(view, [1, 2])
+        with self.assertRaises(AttributeError):
+            view.append(3)
+        mapping: dict = read_only_view({'a': [1]})
+        self.assertIsInstance(mapping, dict)
+        self.assertIsInstance(mapping['a'], list)
+        with self.assertRaises(TypeError):
+            mapping['b'] = 2
+
+
+class TestReadOnlySparse(TestReadOnly):
+
+    def setUp(self) -> None:
+        self.build(sparse=True)
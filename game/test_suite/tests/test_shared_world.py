@@ -0,0 +1,52 @@
+import unittest
+
+from game.common.enums import Company, ObjectType
+from game.common.map.game_board import GameBoard
+from game.common.map.shared_world import SharedWorld, SharedWorldView
+from game.quarry_rush.entity.placeable.traps import Landmine
+from game.utils.vector import Vector
+
+
+class TestSharedWorld(unittest.TestCase):
+    """
+    `Test Shared World Notes:`
+
+        This class tests that a SharedWorldView reads back what the SharedWorld wrote, can't be written to, and
+        gives up on a read that an unfinished update keeps tearing.
+    """
+
+    def setUp(self) -> None:
+        self.world: GameBoard = GameBoard(1, Vector(5, 4), walled=True)
+        self.world.generate_map()
+        self.world.inventory_manager._InventoryManager__inventories = {company: [None] * 50 for company in Company}
+        self.shared: SharedWorld = SharedWorld(self.world, [])
+        self.view: SharedWorldView = SharedWorldView(self.shared.names, self.shared.width, self.shared.height)
+
+    def tearDown(self) -> None:
+        self.view.close()
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_read(self):
+        self.assertEqual(self.view.game_map[0][0].occupied_by.object_type, ObjectType.WALL)
+        self.assertIsNone(self.view.game_map[1][1].occupied_by)
+
+        self.world.game_map[1][1].occupied_by = Landmine(owner_company=Company.CHURCH, position=Vector(1, 1))
+        self.shared.update(self.world, [], 1, self.world.collect_changes(1))
+        landmine = self.view.game_map[1][1].occupied_by
+        self.assertEqual(landmine.object_type, ObjectType.LANDMINE)
+        self.assertEqual(landmine.target_company, Company.TURING)
+        self.assertEqual(self.view.turn, 1)
+
+    def test_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.view.game_map[0][0].occupied_by.object_type = ObjectType.TILE
+        with self.assertRaises(ValueError):
+            self.view.static[0, 0] = 0
+
+    def test_read_timeout(self):
+        self.shared.state['sequence'][0] += 1  # as if the server stopped in the middle of an update
+        with self.assertRaises(RuntimeError):
+            self.view.read(lambda view: view.turn, timeout=0.01)
+        self.shared.state['sequence'][0] += 1
+        self.assertEqual(self.view.read(lambda view: view.turn), 0)
@@ -0,0 +1,67 @@
+import unittest
+
+from game.common.enums import ActionType
+from game.quarry_rush.tech.tech_route_table import TECH_TABLE, TechRouteTable, TechStats, default_income, \
+    solve_tech_routes
+from game.quarry_rush.tech.tech_tree import TECH_IDS
+
+
+class TestTechRouteTable(unittest.TestCase):
+    """
+    `Test Tech Route Table Notes:`
+
+        This class tests that a table solved over a short game only suggests techs the avatar can afford and
+        research, and that it comes back the same after being written to bytes.
+    """
+
+    def setUp(self) -> None:
+        self.start: int = 1 << TECH_IDS['Mining Robotics']
+        self.table: TechRouteTable = solve_tech_routes(max_turns=20, turns_per_bucket=5, science_step=10,
+                                                       max_science_points=200)
+
+    def test_tech_table(self):
+        self.assertEqual(set(TECH_TABLE), set(TECH_IDS))
+        self.assertEqual(TECH_TABLE['Overdrive Drivetrain'].movement, 1)
+        self.assertEqual(TECH_TABLE['Overdrive Mining'].mining, 1)
+
+    def test_default_income(self):
+        score, science = default_income(1, 1)
+        faster_score, faster_science = default_income(2, 2)
+        self.assertGreater(faster_score, score)
+        self.assertGreater(faster_science, science)
+
+    def test_nothing_affordable(self):
+        for turn in range(20):
+            self.assertIsNone(self.table.best_purchase(turn, 0, self.start))
+
+    def test_affordable(self):
+        for turn in range(20):
+            for science_points in range(0, 201, 10):
+                tech_name: str | None = self.table.best_purchase(turn, science_points, self.start)
+                if tech_name is not None:
+                    self.assertLessEqual(TECH_TABLE[tech_name].cost, science_points)
+                    self.assertIn(tech_name, ('Improved Drivetrain', 'Improved Mining'))
+
+    def test_points_now(self):
+        # on the last turn only the points a tech gives are left, so the cheapest one that gives points is bought
+        self.assertEqual(self.table.best_purchase(19, 50, self.start), 'Improved Mining')
+        self.assertEqual(self.table.best_action(19, 50, self.start), ActionType.BUY_IMPROVED_MINING)
+
+    def test_tech_table_given(self):
+        tech_table: dict[str, TechStats] = {name: TechStats(10, 0, 0, 0) for name in TECH_IDS}
+        tech_table['Improved Drivetrain'] = TechStats(10, 1000, 0, 0)
+        table: TechRouteTable = solve_tech_routes(max_turns=10, turns_per_bucket=5, tech_table=tech_table)
+        self.assertEqual(table.best_purchase(0, 10, self.start), 'Improved Drivetrain')
+
+    def test_unknown_mask(self):
+        self.assertIsNone(self.table.best_purchase(0, 200, 0))
+
+    def test_bytes(self):
+        table: TechRouteTable = TechRouteTable.from_bytes(self.table.to_bytes())
+        self.assertEqual(table.masks, self.table.masks)
+        self.assertEqual(table.actions, self.table.actions)
+        self.assertEqual(table.best_purchase(0, 100, self.start), self.table.best_purchase(0, 100, self.start))
+
+    def test_bytes_fail(self):
+        with self.assertRaises(ValueError):
+            TechRouteTable.from_bytes(b'NOPE' + self.table.to_bytes()[4:])
@@ -0,0 +1,85 @@
+import unittest
+
+from game.quarry_rush.tech.tech_tree import TECH_IDS, TECH_TABLE, TechStats, TechTree
+
+
+def client_available() -> bool:
+    # base_client is written against the launcher's game, which has the game.config this tree leaves out
+    try:
+        import base_client
+    except ImportError:
+        return False
+    return True
+
+
+class FakeAvatar:
+    """
+    Stands in for an Avatar, which this tree can't make: science points and a tech tree to ask
+    """
+
+    def __init__(self, tree: TechTree, science_points: int):
+        self.tree: TechTree = tree
+        self.science_points: int = science_points
+
+    def get_affordable_techs(self) -> list[str]:
+        return self.tree.affordable_techs(self.science_points)
+
+
+class TestTechTree(unittest.TestCase):
+    """
+    `Test Tech Tree Notes:`
+
+        This class tests that a TechTree made from a tech table keeps its researched mask and score as techs are
+        researched, and only offers the techs whose prerequisite is researched and that fit the science points.
+    """
+
+    def setUp(self) -> None:
+        # every tech costs 10 and is worth its id, so the score tells which techs were researched
+        self.tech_table: dict[str, TechStats] = {name: TechStats(10, tech_id, 0, 0)
+                                                 for name, tech_id in TECH_IDS.items()}
+        self.tree: TechTree = TechTree(tech_table=self.tech_table)
+
+    def test_init(self):
+        self.assertEqual(self.tree.researched_techs(), ['Mining Robotics'])
+        self.assertEqual(self.tree.researched_mask, 1 << TECH_IDS['Mining Robotics'])
+        self.assertEqual(self.tree.tech_info('Dynamite').cost, 10)
+        self.assertEqual(TechTree(tech_table=TECH_TABLE).tech_info('Dynamite').cost, TECH_TABLE['Dynamite'].cost)
+
+    def test_init_fail(self):
+        with self.assertRaises(ValueError):
+            TechTree()
+
+    def test_research(self):
+        self.assertFalse(self.tree.research('Superior Mining'))  # Improved Mining isn't researched
+        self.assertTrue(self.tree.research('Improved Mining'))
+        self.assertTrue(self.tree.research('Superior Mining'))
+        self.assertFalse(self.tree.research('Superior Mining'))
+        self.assertEqual(self.tree.score(), TECH_IDS['Improved Mining'] + TECH_IDS['Superior Mining'])
+        self.assertTrue(self.tree.is_researched('Superior Mining'))
+
+    def test_exclusions(self):
+        for name in ('Improved Mining', 'Dynamite', 'Landmines', 'EMPs'):
+            self.assertTrue(self.tree.research(name))
+        self.assertFalse(self.tree.can_research('Trap Defusal'))
+
+    def test_affordable_techs(self):
+        self.assertEqual(self.tree.affordable_techs(9), [])
+        self.assertEqual(self.tree.affordable_techs(10), ['Improved Drivetrain', 'Improved Mining'])
+        self.tree.research('Improved Mining')
+        self.assertEqual(self.tree.affordable_techs(10), ['Improved Drivetrain', 'Superior Mining', 'Dynamite'])
+
+    @unittest.skipUnless(client_available(), "needs the launcher's game.config")
+    def test_can_purchase(self):
+        from base_client import Client
+
+        client: Client = Client()
+        self.assertFalse(client.can_purchase(FakeAvatar(self.tree, 9), None))
+        self.assertTrue(client.can_purchase(FakeAvatar(self.tree, 10), None))
+
+        # only Dynamite is left to buy, and it isn't an upgrade
+        tree: TechTree = TechTree(tech_table={**self.tech_table, 'Improved Drivetrain': TechStats(99, 0, 0, 0)})
+        tree.research('Improved Mining')
+        tree.research('Superior Mining')
+        tree.research('Overdrive Mining')
+        self.assertEqual(tree.affordable_techs(10), ['Dynamite'])
+        self.assertFalse(client.can_purchase(FakeAvatar(tree, 10), None))
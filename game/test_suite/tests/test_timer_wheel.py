@@ -0,0 +1,82 @@
+import unittest
+
+from game.common.map.game_board import GameBoard
+from game.quarry_rush.ability.dynamite_active_ability import DynamiteActiveAbility
+from game.quarry_rush.entity.placeable.dynamite import Dynamite
+from game.utils.timer_wheel import TimerWheel
+from game.utils.vector import Vector
+
+
+class TestTimerWheel(unittest.TestCase):
+    """
+    `Test Timer Wheel Notes:`
+
+        This class tests that dynamite and abilities bound to a TimerWheel derive their fuse from the wheel's turn,
+        and that a GameBoard schedules placed dynamite and returns it on the turn it explodes.
+    """
+
+    def setUp(self) -> None:
+        self.wheel: TimerWheel = TimerWheel()
+        self.dynamite: Dynamite = Dynamite(Vector(2, 2), blast_radius=1)
+        self.ability: DynamiteActiveAbility = DynamiteActiveAbility()
+
+    def test_advance(self):
+        self.wheel.schedule(2, 'a')
+        self.wheel.schedule(10, 'b')
+        self.assertEqual(self.wheel.advance(), [])
+        self.assertEqual(self.wheel.advance(), ['a'])
+        self.assertEqual(len(self.wheel), 1)
+        for _ in range(7):
+            self.assertEqual(self.wheel.advance(), [])
+        self.assertEqual(self.wheel.advance(), ['b'])
+
+    def test_dynamite_fuse(self):
+        self.dynamite.start_fuse(self.wheel)
+        self.assertEqual(self.dynamite.fuse, 3)
+        self.wheel.advance()
+        self.assertEqual(self.dynamite.fuse, 2)  # nothing counted it down
+        self.wheel.advance()
+        self.assertEqual(self.wheel.advance(), [self.dynamite])
+        self.assertEqual(self.dynamite.fuse, 0)
+        self.assertTrue(self.dynamite.is_fuse_at_0())
+
+    def test_dynamite_fuse_set(self):
+        self.dynamite.start_fuse(self.wheel)
+        self.dynamite.fuse = 1
+        self.assertIsNone(self.dynamite.timer_wheel)
+        self.dynamite.decrement_fuse()
+        self.assertTrue(self.dynamite.can_explode)
+
+    def test_dynamite_fuse_fail(self):
+        with self.assertRaises(ValueError):
+            self.dynamite.fuse = -1
+
+    def test_reset_fuse(self):
+        self.ability.reset_fuse()
+        self.assertEqual(self.ability.fuse, self.ability.cooldown)
+        self.assertFalse(self.ability.is_usable)
+
+    def test_reset_fuse_on_wheel(self):
+        self.ability.start_fuse(self.wheel)
+        for _ in range(self.ability.cooldown):
+            self.wheel.advance()
+        self.assertTrue(self.ability.is_usable)
+        self.ability.reset_fuse()
+        self.assertIs(self.ability.timer_wheel, self.wheel)
+        self.assertEqual(self.ability.fuse, self.ability.cooldown)
+        self.assertFalse(self.ability.is_usable)
+
+    def test_place_dynamite(self):
+        world: GameBoard = GameBoard(1, Vector(5, 5), walled=True)
+        world.generate_map()
+        world.place_dynamite(self.dynamite, self.ability)
+        self.assertIs(world.game_map[2][2].occupied_by, self.dynamite)
+        self.assertGreater(len(world.danger_field), 0)
+        self.assertFalse(self.ability.is_usable)
+
+        self.assertEqual(world.advance_timers(), [])
+        self.assertEqual(world.advance_timers(), [])
+        self.assertEqual(world.advance_timers(), [self.dynamite])
+        self.assertTrue(self.dynamite.can_explode)
+        self.assertEqual(len(world.danger_field), 0)
+        self.assertEqual(self.ability.fuse, max(self.ability.cooldown - 3, 0))
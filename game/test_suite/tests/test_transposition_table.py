@@ -0,0 +1,38 @@
+import unittest
+
+from game.common.enums import ActionType
+from game.common.map.zobrist import ZobristHash
+from game.utils.transposition_table import Bound, TableEntry, TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    `Test Transposition Table Notes:`
+
+        This class tests that entries come back for the key they were stored with, whether it's an int or a
+        ZobristHash, and that the table keeps the deeper search.
+    """
+
+    def setUp(self) -> None:
+        self.table: TranspositionTable = TranspositionTable(size=16)
+
+    def test_store_and_probe(self):
+        self.table.store(12345, 1.5, 3, ActionType.MOVE_UP, Bound.EXACT)
+        self.assertEqual(self.table.probe(12345), TableEntry(1.5, 3, ActionType.MOVE_UP, Bound.EXACT))
+        self.assertIsNone(self.table.probe(54321))
+
+    def test_zobrist_key(self):
+        zobrist: ZobristHash = ZobristHash(10, (1 << 63) | 7)
+        self.table.store(zobrist, 2.0, 1, ActionType.MINE, Bound.LOWER)
+        self.assertEqual(self.table.best_action(zobrist), ActionType.MINE)
+        self.assertEqual(self.table.probe(int(zobrist)).value, 2.0)
+
+    def test_keeps_deeper(self):
+        self.table.store(99, 1.0, 5, ActionType.MOVE_LEFT, Bound.LOWER)
+        self.table.store(99, 4.0, 2, None, Bound.UPPER)
+        self.assertEqual(self.table.probe(99).depth, 5)
+
+    def test_size(self):
+        self.assertEqual(TranspositionTable(size=100).size, 128)
+        with self.assertRaises(ValueError):
+            TranspositionTable(size=0)
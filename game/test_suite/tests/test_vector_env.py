@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+
+from game.common.avatar import Avatar
+from game.common.enums import ActionType, ObjectType
+from game.common.map.observation_encoder import OWN_AVATAR, OWN_STATION, PLANE_COUNT, WALL
+from game.common.map.tile import Tile
+from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+from game.utils.quarry_rush_env import QuarryRushEnv
+from game.utils.vector import Vector
+from game.utils.vector_env import GameEnv, VectorEnv
+
+
+def avatars_available() -> bool:
+    # this tree's Avatar leaves its tech tree to the launcher's copy, so it can only be made with the launcher's game
+    try:
+        Avatar()
+    except AttributeError:
+        return False
+    return True
+
+
+class CountingEnv(GameEnv):
+    """
+    The observation is [turn, seed]; the game is done on the third turn
+    """
+
+    def reset(self, seed, observation):
+        observation[:] = (0, -1 if seed is None else seed)
+
+    def step(self, actions, observation):
+        observation[0] += 1
+        return 1.0, observation[0] >= 3, {'actions': len(actions)}
+
+
+class TestVectorEnv(unittest.TestCase):
+    """
+    `Test Vector Env Notes:`
+
+        This class tests that the VectorEnv's rows are written by the workers, and that a finished game is reset
+        with its last observation kept in the info.
+    """
+
+    def test_reset_and_step(self):
+        with VectorEnv(CountingEnv, 2, observation_shape=(2,)) as env:
+            np.testing.assert_array_equal(env.reset(seeds=[5, 6]), [[0, 5], [0, 6]])
+            observations, rewards, dones, infos = env.step([[ActionType.MINE], []])
+            np.testing.assert_array_equal(observations, [[1, 5], [1, 6]])
+            np.testing.assert_array_equal(rewards, [1, 1])
+            self.assertFalse(dones.any())
+            self.assertEqual([info['actions'] for info in infos], [1, 0])
+
+    def test_final_observation(self):
+        with VectorEnv(CountingEnv, 1, observation_shape=(2,)) as env:
+            env.reset(seeds=[7])
+            env.step([[]])
+            env.step([[]])
+            observations, rewards, dones, infos = env.step([[]])
+            self.assertTrue(dones[0])
+            self.assertTrue(infos[0]['terminal'])
+            np.testing.assert_array_equal(infos[0]['final_observation'], [3, 7])
+            np.testing.assert_array_equal(observations[0], [0, -1])  # already the next game
+
+    def test_seeds_fail(self):
+        with VectorEnv(CountingEnv, 2, observation_shape=(2,)) as env:
+            with self.assertRaises(ValueError):
+                env.reset(seeds=[1])
+
+
+class TestQuarryRushEnv(unittest.TestCase):
+    """
+    `Test Quarry Rush Env Notes:`
+
+        This class tests that the QuarryRushEnv builds its game from the seed, moves and mines through the game
+        objects, and encodes the board into the given row.
+    """
+
+    def test_observation_shape(self):
+        self.assertEqual(QuarryRushEnv(Vector(10, 8), ore_count=5).observation_shape, (PLANE_COUNT, 8, 10))
+
+    def test_map_size_fail(self):
+        with self.assertRaises(ValueError):
+            QuarryRushEnv(Vector(4, 4), ore_count=4)
+
+    @unittest.skipUnless(avatars_available(), "needs the launcher's Avatar")
+    def test_reset(self):
+        env: QuarryRushEnv = QuarryRushEnv(Vector(10, 8), ore_count=5)
+        observation: np.ndarray = np.zeros(env.observation_shape, dtype=np.float32)
+        env.reset(3, observation)
+        self.assertEqual(observation[OWN_AVATAR, 1, 1], 1)
+        self.assertEqual(observation[OWN_STATION, 1, 1], 1)
+        self.assertEqual(observation[WALL, 0].sum(), 10)
+
+        other: np.ndarray = np.zeros(env.observation_shape, dtype=np.float32)
+        QuarryRushEnv(Vector(10, 8), ore_count=5).reset(3, other)
+        np.testing.assert_array_equal(observation, other)
+
+    @unittest.skipUnless(avatars_available(), "needs the launcher's Avatar")
+    def test_step(self):
+        env: QuarryRushEnv = QuarryRushEnv(Vector(10, 8), ore_count=5, max_turns=2)
+        observation: np.ndarray = np.zeros(env.observation_shape, dtype=np.float32)
+        env.reset(3, observation)
+
+        reward, done, info = env.step([ActionType.MOVE_RIGHT, ActionType.MOVE_DOWN], observation)
+        self.assertEqual(env.avatar.position.as_tuple(), (2, 1))  # a movement speed of 1 keeps the first move
+        self.assertEqual(observation[OWN_AVATAR, 1, 2], 1)
+        self.assertEqual(observation[OWN_AVATAR, 1, 1], 0)
+        self.assertEqual(reward, 0)
+        self.assertFalse(done)
+
+        reward, done, info = env.step([ActionType.MOVE_UP], observation)
+        self.assertEqual(env.avatar.position.as_tuple(), (2, 1))  # the wall is in the way
+        self.assertTrue(done)
+        self.assertEqual(info['turn'], 2)
+
+    @unittest.skipUnless(avatars_available(), "needs the launcher's Avatar")
+    def test_mine_and_cash_in(self):
+        env: QuarryRushEnv = QuarryRushEnv(Vector(10, 8), ore_count=5)
+        observation: np.ndarray = np.zeros(env.observation_shape, dtype=np.float32)
+        env.reset(3, observation)
+
+        # put an ore station next to the base so the avatar can walk to it and back
+        tile: Tile = env.world.game_map[1][2]
+        if tile.occupied_by is None:
+            tile.occupied_by = OreOccupiableStation(Vector(2, 1))
+        self.assertEqual(tile.occupied_by.object_type, ObjectType.ORE_OCCUPIABLE_STATION)
+        env.step([ActionType.MOVE_RIGHT], observation)
+        env.step([ActionType.MINE], observation)
+        self.assertIsNotNone(env.world.inventory_manager.get_inventory(env.company)[0])
+        env.step([ActionType.MOVE_LEFT], observation)
+        self.assertGreater(env.avatar.score, 0)
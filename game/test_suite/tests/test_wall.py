@@ -0,0 +1,49 @@
+import json
+import unittest
+
+from game.common.enums import ObjectType
+from game.common.map.wall import Wall
+
+
+class TestWall(unittest.TestCase):
+    """
+    `Test Wall Notes:`
+
+        This class tests that the shared Wall can't be changed, and that both kinds of Wall come back from JSON with
+        their id and state.
+    """
+
+    def setUp(self) -> None:
+        self.wall: Wall = Wall()
+
+    def test_shared(self):
+        self.assertIs(Wall.shared(), Wall.shared())
+        self.assertEqual(Wall.shared().id, Wall.SHARED_ID)
+        self.assertEqual(Wall.shared().object_type, ObjectType.WALL)
+
+    def test_shared_fail(self):
+        with self.assertRaises(AttributeError):
+            Wall.shared().id = 'other'
+        with self.assertRaises(AttributeError):
+            Wall.shared().state = 'moved'
+        with self.assertRaises(AttributeError):
+            del Wall.shared().state
+        self.assertEqual(Wall.shared().id, Wall.SHARED_ID)
+
+    def test_wall_can_change(self):
+        self.wall.state = 'moved'
+        self.assertEqual(self.wall.state, 'moved')
+
+    def test_shared_json(self):
+        data: dict = json.loads(json.dumps(Wall.shared().to_json()))
+        self.assertEqual(data, {'id': Wall.SHARED_ID, 'object_type': ObjectType.WALL.value, 'state': 'idle'})
+        self.assertIs(Wall().from_json(data), Wall.shared())
+
+    def test_wall_json(self):
+        self.wall.state = 'moved'
+        data: dict = json.loads(json.dumps(self.wall.to_json()))
+        wall: Wall = Wall().from_json(data)
+        self.assertIsNot(wall, Wall.shared())
+        self.assertEqual(wall.id, self.wall.id)
+        self.assertEqual(wall.object_type, ObjectType.WALL)
+        self.assertEqual(wall.state, 'moved')
@@ -0,0 +1,125 @@
+import unittest
+
+from game.common.enums import Company, ObjectType
+from game.common.game_object import GameObject
+from game.common.map.game_board import GameBoard
+from game.common.map.zobrist import ZobristHash
+from game.quarry_rush.entity.ores import Copium, Lambdium
+from game.quarry_rush.entity.placeable.traps import Landmine
+from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+from game.utils.vector import Vector
+
+
+class FakeAvatar(GameObject):
+    """
+    Stands in for an Avatar, which this tree can't make: a company, a place in a stack, and maybe a tech mask
+    """
+
+    def __init__(self, company: Company, mask: int | None = None):
+        super().__init__()
+        self.object_type = ObjectType.AVATAR
+        self.company: Company = company
+        self.occupied_by: GameObject | None = None
+        if mask is not None:
+            self.mask: int = mask
+            self.get_researched_mask = lambda: self.mask
+
+
+class TestZobrist(unittest.TestCase):
+    """
+    `Test Zobrist Notes:`
+
+        This class tests that GameBoard.zobrist, which only hashes again what was written since it was last read,
+        always equals the hash computed from scratch, on dense and sparse boards.
+    """
+
+    def setUp(self) -> None:
+        self.sparse: bool = False
+
+    def make(self) -> GameBoard:
+        world: GameBoard = GameBoard(1, Vector(6, 5), walled=True, sparse=self.sparse)
+        world.generate_map()
+        return world
+
+    def tile(self, world: GameBoard, x: int, y: int):
+        # the tile straight from the game_map, so the GameBoard doesn't see the write
+        return world.game_map.tile_for_write(x, y) if self.sparse else world.game_map[y][x]
+
+    def inventories(self, world: GameBoard) -> dict:
+        return world._GameBoard__inventories()
+
+    def assert_matches(self, world: GameBoard) -> None:
+        self.assertEqual(world.zobrist, ZobristHash.from_game_map(world.game_map, self.inventories(world)))
+
+    def test_place(self):
+        world: GameBoard = self.make()
+        empty: ZobristHash = world.zobrist
+        self.assert_matches(world)
+        world.place(2, 2, Landmine())
+        self.assertNotEqual(world.zobrist, empty)
+        self.assert_matches(world)
+
+    def test_tile_for_write(self):
+        world: GameBoard = self.make()
+        world.place(3, 2, OreOccupiableStation(Vector(3, 2)))
+        before: ZobristHash = world.zobrist
+        world.tile_for_write(3, 2).occupied_by.held_item = Lambdium()
+        self.assertNotEqual(world.zobrist, before)
+        self.assert_matches(world)
+        world.tile_for_write(3, 2).occupied_by = None
+        self.assert_matches(world)
+
+    def test_mark_changed(self):
+        world: GameBoard = self.make()
+        world.place(1, 1, Landmine())
+        world.zobrist
+        self.tile(world, 1, 1).occupied_by = None  # written without the GameBoard, so the tracker can't see it
+        self.assertNotEqual(world.zobrist, ZobristHash.from_game_map(world.game_map))
+        world.mark_changed(1, 1)
+        self.assert_matches(world)
+
+    def test_tech_purchase(self):
+        world: GameBoard = self.make()
+        avatar: FakeAvatar = FakeAvatar(Company.CHURCH, mask=1)
+        world.place(1, 1, avatar)
+        before: ZobristHash = world.zobrist
+        avatar.mask = 0b101  # nothing on the board is written when a tech is bought
+        self.assertNotEqual(world.zobrist, before)
+        self.assert_matches(world)
+
+    def test_avatar_without_mask(self):
+        world: GameBoard = self.make()
+        world.place(1, 1, FakeAvatar(Company.TURING))
+        self.assert_matches(world)
+
+    def test_collect_changes(self):
+        world: GameBoard = self.make()
+        avatar: FakeAvatar = FakeAvatar(Company.CHURCH, mask=1)
+        self.tile(world, 1, 1).occupied_by = avatar
+        world.collect_changes(0)
+        self.assert_matches(world)
+
+        # moved by hand, the way the launcher's controllers move it
+        self.tile(world, 1, 1).occupied_by = None
+        self.tile(world, 1, 2).occupied_by = avatar
+        self.tile(world, 3, 3).occupied_by = Landmine()
+        world.collect_changes(1)
+        self.assert_matches(world)
+
+    def test_inventories(self):
+        world: GameBoard = self.make()
+        inventory: list = [None] * 50
+        world.inventory_manager._InventoryManager__inventories = {Company.CHURCH: inventory, Company.TURING: []}
+        before: ZobristHash = world.zobrist
+        inventory[0] = Copium()
+        inventory[1] = Copium()
+        self.assertNotEqual(world.zobrist, before)
+        self.assert_matches(world)
+        inventory[0] = None
+        self.assert_matches(world)
+
+
+class TestZobristSparse(TestZobrist):
+
+    def setUp(self) -> None:
+        self.sparse: bool = True
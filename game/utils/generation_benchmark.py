@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+
+from game.common.game_object import GameObject
+from game.common.map.game_board import GameBoard
+from game.common.map.tile import Tile
+from game.quarry_rush.station.company_station import ChurchStation, TuringStation
+from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+from game.utils.vector import Vector
+
+
+def build_locations(size: int, groups: int, group_size: int, seed: int = 0) -> dict[tuple[Vector], list[GameObject]]:
+    """
+    Locations for a size x size walled map: the two bases, and ``groups`` dynamic groups of ``group_size`` ore
+    stations each, spread over the inside of the map
+    """
+    rng: random.Random = random.Random(seed)
+    inside: list[Vector] = [Vector(x, y) for y in range(1, size - 1) for x in range(1, size - 1)]
+    rng.shuffle(inside)
+    locations: dict[tuple[Vector], list[GameObject]] = {
+        (inside.pop(),): [ChurchStation()],
+        (inside.pop(),): [TuringStation()],
+    }
+    for _ in range(groups):
+        vectors: tuple[Vector, ...] = tuple(inside.pop() for _ in range(group_size))
+        locations[vectors] = [OreOccupiableStation(vector, seed) for vector in vectors]
+    return locations
+
+
+def place_per_key(world: GameBoard, locations: dict[tuple[Vector], list[GameObject]]) -> list[list[Tile]]:
+    """
+    The placement the launcher's generate_map does, kept to compare against: a random.sample per key and a walk
+    from the bottom of the tile's stack for every GameObject
+    """
+    size: Vector = world.map_size
+    game_map: list[list[Tile]] = [[Tile() for _ in range(size.x)] for _ in range(size.y)]
+    for k, v in locations.items():
+        vectors: list[Vector] = random.sample(k, k=len(k))
+        if len(k) == len(v):
+            vectors = random.sample(k, k=len(k))
+        for vector, game_object in zip(vectors, v):
+            temp: GameObject = game_map[vector.y][vector.x]
+            while temp.occupied_by is not None and hasattr(temp.occupied_by, 'occupied_by'):
+                temp = temp.occupied_by
+            temp.occupied_by = game_object
+    world.game_map = game_map
+    return game_map
+
+
+def measure(size: int, groups: int, group_size: int, runs: int) -> tuple[float, float]:
+    """
+    Returns the median milliseconds of ``generate_map()`` and of ``place_per_key()`` for the same locations. The
+    GameObjects are made before the clock starts, since that cost is the same for both. Most of either time goes to
+    making the Tiles; the one pass shuffle saves a little on the random draws, and the placement itself costs about
+    the same as the per key walk, since nearly every tile gets a single GameObject.
+    """
+    generated: list[float] = []
+    per_key: list[float] = []
+    for run in range(runs):
+        world: GameBoard = GameBoard(run, Vector(size, size), build_locations(size, groups, group_size, run))
+        start: float = time.perf_counter()
+        world.generate_map()
+        generated.append((time.perf_counter() - start) * 1000)
+
+        locations: dict[tuple[Vector], list[GameObject]] = build_locations(size, groups, group_size, run)
+        world = GameBoard(run, Vector(size, size))
+        start = time.perf_counter()
+        place_per_key(world, locations)
+        per_key.append((time.perf_counter() - start) * 1000)
+    return statistics.median(generated), statistics.median(per_key)
+
+
+def main() -> int:
+    """
+    Times map generation for large location dicts. Run it from the project root:
+    ::
+        python -m game.utils.generation_benchmark --size 200 --groups 2000 --group-size 8
+    """
+    parser: ArgumentParser = ArgumentParser(description='Measures how long GameBoard.generate_map takes.')
+    parser.add_argument('--size', type=int, default=200, help='width and height of the map')
+    parser.add_argument('--groups', type=int, default=2000, help='dynamic groups of ore stations')
+    parser.add_argument('--group-size', type=int, default=8, help='ore stations in every group')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    if (args.size - 2) ** 2 < args.groups * args.group_size + 2:
+        parser.error('the map is too small for that many locations')
+    generated, per_key = measure(args.size, args.groups, args.group_size, args.runs)
+    print(f'{args.groups * args.group_size} ore stations on a {args.size}x{args.size} map')
+    print(f'generate_map:  {generated:8.1f} ms')
+    print(f'per key:       {per_key:8.1f} ms')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
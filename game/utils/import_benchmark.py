@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+# modules a client imports before its first turn, and how much of the game package each one may load
+IMPORT_BUDGETS: dict[str, int] = {
+    'game.common.map.game_board': 24,
+    'game.common.avatar': 12,
+    'game.quarry_rush.entity.placeable.traps': 20,
+}
+
+MEASURE: str = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, len([name for name in sys.modules if name == 'game' or name.startswith('game.')]))
+'''
+
+
+def measure_import(module: str, runs: int = 20) -> tuple[float, int]:
+    """
+    Imports the module in ``runs`` fresh interpreters and returns the median import time in milliseconds and the
+    number of modules from the game package it loaded. Use the module count to compare changes; the time depends on
+    the machine and how busy it is.
+    """
+    times: list[float] = []
+    loaded: int = 0
+    for _ in range(runs):
+        result: subprocess.CompletedProcess = subprocess.run([sys.executable, '-c', MEASURE.format(module=module)],
+                                                             capture_output=True, text=True, check=True)
+        elapsed, count = result.stdout.split()
+        times.append(float(elapsed) * 1000)
+        loaded = int(count)
+    return statistics.median(times), loaded
+
+
+def main() -> int:
+    """
+    Checks every module in IMPORT_BUDGETS against its budget and exits with 1 if any of them loads more of the game
+    package than it is allowed to. Run it from the project root:
+    ::
+        python -m game.utils.import_benchmark --runs 20
+    """
+    parser: ArgumentParser = ArgumentParser(description='Measures how long the game modules take to import.')
+    parser.add_argument('--runs', type=int, default=20, help='fresh interpreters to import each module in')
+    args = parser.parse_args()
+
+    over_budget: bool = False
+    for module, budget in IMPORT_BUDGETS.items():
+        milliseconds, loaded = measure_import(module, args.runs)
+        status: str = 'ok' if loaded <= budget else 'OVER BUDGET'
+        print(f'{module:<45} {milliseconds:7.1f} ms  {loaded:3} / {budget:3} modules  {status}')
+        over_budget = over_budget or loaded > budget
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
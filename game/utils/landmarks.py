@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from array import array
+from collections import deque
+from typing import Self
+
+from game.common.enums import ObjectType
+from game.common.game_object import GameObject
+
+_HEADER: struct.Struct = struct.Struct('<4sHHH')
+_MAGIC: bytes = b'ALT1'
+UNREACHABLE: int = -1
+
+
+def wall_grid(game_map: list[list[GameObject]]) -> list[list[bool]]:
+    """
+    Returns a grid indexed with ``[y][x]`` that is True wherever a Wall is in the tile's occupied_by stack
+    """
+    def has_wall(tile: GameObject) -> bool:
+        temp: GameObject | None = tile.occupied_by
+        while temp is not None:
+            if temp.object_type is ObjectType.WALL:
+                return True
+            temp = getattr(temp, 'occupied_by', None)
+        return False
+
+    return [[has_wall(tile) for tile in row] for row in game_map]
+
+
+def wall_hash(walls: list[list[bool]]) -> str:
+    """
+    Returns a hash of the map's size and wall layout. Two maps with the same hash share the same landmark distances.
+    """
+    height: int = len(walls)
+    width: int = len(walls[0]) if height > 0 else 0
+    bits: bytes = bytes(wall for row in walls for wall in row)
+    return hashlib.sha1(struct.pack('<HH', width, height) + bits).hexdigest()
+
+
+class LandmarkTable:
+    """
+    `LandmarkTable Class Notes:`
+
+        Walls never move during a game, so the exact walking distance from a few landmark tiles to every other tile
+        can be computed once. The ALT (A*, Landmarks, Triangle inequality) heuristic then uses:
+        ::
+            h(n, goal) = max over landmarks L of |d(L, goal) - d(L, n)|
+
+        which is never more than the real distance, and is much closer to it than the Manhattan distance around
+        clusters of walls. ``heuristic()`` also takes the Manhattan distance into account, so it is never worse.
+
+        -----
+
+        Landmarks:
+            Landmarks are picked with farthest-point selection: each new landmark is the walkable tile farthest from
+            the landmarks already picked. Landmarks near the edges of the map give the best bounds.
+
+        -----
+
+        Caching:
+            ``load_or_build()`` stores the table in the given directory under the hash of the wall layout (see
+            ``wall_hash``). Maps with the same walls reuse the file instead of searching again.
+    """
+
+    def __init__(self, width: int, height: int, landmarks: list[tuple[int, int]], distances: list[array]):
+        self.width: int = width
+        self.height: int = height
+        self.landmarks: list[tuple[int, int]] = landmarks  # (x, y) of every landmark
+        self.distances: list[array] = distances  # one flat array per landmark, indexed with y * width + x
+
+    @classmethod
+    def from_walls(cls, walls: list[list[bool]], landmark_count: int = 4) -> Self:
+        """
+        Picks landmarks and computes their distances for the given wall grid (see ``wall_grid``)
+        """
+        height: int = len(walls)
+        width: int = len(walls[0]) if height > 0 else 0
+        blocked: list[bool] = [wall for row in walls for wall in row]
+
+        start: int | None = next((index for index, wall in enumerate(blocked) if not wall), None)
+        if start is None:
+            return cls(width, height, [], [])
+
+        landmarks: list[tuple[int, int]] = []
+        distances: list[array] = []
+        # distance from each tile to the nearest landmark so far; starts as the distance from an arbitrary tile
+        nearest: array = cls.__breadth_first(blocked, width, height, start)
+
+        for _ in range(landmark_count):
+            farthest: int = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[farthest] <= 0 and len(landmarks) > 0:
+                break  # every reachable tile is already a landmark
+
+            landmark_distances: array = cls.__breadth_first(blocked, width, height, farthest)
+            if len(landmarks) == 0:
+                nearest = array('i', landmark_distances)
+            else:
+                nearest = array('i', map(min, nearest, landmark_distances))
+            landmarks.append((farthest % width, farthest // width))
+            distances.append(landmark_distances)
+
+        return cls(width, height, landmarks, distances)
+
+    @classmethod
+    def from_game_map(cls, game_map: list[list[GameObject]], landmark_count: int = 4) -> Self:
+        return cls.from_walls(wall_grid(game_map), landmark_count)
+
+    @classmethod
+    def load_or_build(cls, game_map: list[list[GameObject]], cache_dir: str, landmark_count: int = 4) -> Self:
+        """
+        Loads the table for the map's wall layout from cache_dir, or builds it and saves it there
+        """
+        walls: list[list[bool]] = wall_grid(game_map)
+        path: str = os.path.join(cache_dir, f'{wall_hash(walls)}_{landmark_count}.alt')
+
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                return cls.from_bytes(f.read())
+
+        table: LandmarkTable = cls.from_walls(walls, landmark_count)
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path: str = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(table.to_bytes())
+        os.replace(temp_path, path)  # so a reader never sees a half written file
+        return table
+
+    def heuristic(self, x: int, y: int, goal_x: int, goal_y: int) -> int:
+        """
+        Returns a lower bound of the walking distance between (x, y) and (goal_x, goal_y)
+        """
+        best: int = abs(goal_x - x) + abs(goal_y - y)
+        index: int = y * self.width + x
+        goal_index: int = goal_y * self.width + goal_x
+
+        for landmark_distances in self.distances:
+            distance: int = landmark_distances[index]
+            goal_distance: int = landmark_distances[goal_index]
+            if distance == UNREACHABLE or goal_distance == UNREACHABLE:
+                continue
+            bound: int = abs(goal_distance - distance)
+            if bound > best:
+                best = bound
+
+        return best
+
+    def to_bytes(self) -> bytes:
+        data: bytearray = bytearray(_HEADER.pack(_MAGIC, self.width, self.height, len(self.landmarks)))
+        data += array('H', [coordinate for landmark in self.landmarks for coordinate in landmark]).tobytes()
+        for landmark_distances in self.distances:
+            data += landmark_distances.tobytes()
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        magic, width, height, landmark_count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f'The given data is not a {cls.__name__}.')
+
+        offset: int = _HEADER.size
+        coordinates: array = array('H')
+        coordinates.frombytes(data[offset:offset + 2 * landmark_count * coordinates.itemsize])
+        offset += 2 * landmark_count * coordinates.itemsize
+
+        distances: list[array] = []
+        for _ in range(landmark_count):
+            landmark_distances: array = array('i')
+            size: int = width * height * landmark_distances.itemsize
+            landmark_distances.frombytes(data[offset:offset + size])
+            distances.append(landmark_distances)
+            offset += size
+
+        landmarks: list[tuple[int, int]] = list(zip(coordinates[::2], coordinates[1::2]))
+        return cls(width, height, landmarks, distances)
+
+    @staticmethod
+    def __breadth_first(blocked: list[bool], width: int, height: int, start: int) -> array:
+        distances: array = array('i', [UNREACHABLE]) * (width * height)
+        distances[start] = 0
+        queue: deque[int] = deque([start])
+
+        while queue:
+            index: int = queue.popleft()
+            next_distance: int = distances[index] + 1
+            x: int = index % width
+
+            for neighbour, in_bounds in ((index - width, index >= width),
+                                         (index + width, index < width * (height - 1)),
+                                         (index - 1, x > 0),
+                                         (index + 1, x < width - 1)):
+                if in_bounds and not blocked[neighbour] and distances[neighbour] == UNREACHABLE:
+                    distances[neighbour] = next_distance
+                    queue.append(neighbour)
+
+        return distances
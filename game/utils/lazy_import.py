@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_getattr(module_name: str, lazy_imports: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Returns a module ``__getattr__`` (PEP 562) that imports the given names from their modules the first time they
+    are accessed, instead of when the module itself is imported. ``lazy_imports`` maps each name to the module it
+    comes from. The value is then stored in the module's globals, so this only runs once per name.
+    ::
+        __getattr__ = lazy_getattr(__name__, {'Avatar': 'game.common.avatar'})
+    """
+    def __getattr__(name: str) -> Any:
+        source: str | None = lazy_imports.get(name)
+        if source is None:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+        value: Any = getattr(importlib.import_module(source), name)
+        setattr(importlib.import_module(module_name), name, value)
+        return value
+
+    return __getattr__
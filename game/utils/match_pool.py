@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from multiprocessing.connection import Connection, wait
+from types import ModuleType
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+# imported once by the forkserver, so every match starts with them already loaded
+DEFAULT_PRELOAD: tuple[str, ...] = (
+    'game.common.enums',
+    'game.config',
+    'game.common.game_object',
+    'game.common.avatar',
+    'game.common.player',
+    'game.common.map.game_board',
+    'game.common.map.tile',
+    'game.common.map.wall',
+    'game.common.stations.station',
+    'game.common.stations.occupiable_station',
+    'game.quarry_rush.avatar.avatar_functions',
+    'game.quarry_rush.avatar.inventory_manager',
+    'game.quarry_rush.ability.dynamite_active_ability',
+    'game.quarry_rush.ability.emp_active_ability',
+    'game.quarry_rush.ability.landmine_active_ability',
+    'game.quarry_rush.ability.trap_defusal_active_ability',
+    'game.quarry_rush.entity.ores',
+    'game.quarry_rush.entity.ancient_tech',
+    'game.quarry_rush.entity.placeable.dynamite',
+    'game.quarry_rush.entity.placeable.traps',
+    'game.quarry_rush.station.company_station',
+    'game.quarry_rush.station.ore_occupiable_station',
+    'game.quarry_rush.tech.tech',
+    'game.quarry_rush.tech.tech_tree',
+    'game.client.user_client',
+    'game.controllers.master_controller',
+    'game.utils.vector',
+)
+
+
+class MatchResult(NamedTuple):
+    index: int
+    clients: tuple[str, ...]
+    seed: int | None
+    results: dict | None
+    error: str | None
+    seconds: float
+
+
+def _load_client(path: str, index: int) -> ModuleType:
+    """
+    Imports a client file under its own name, the same way the engine does, and falls back to a numbered name when
+    both clients are copies of the same file
+    """
+    directory, filename = os.path.split(os.path.abspath(path))
+    name: str = os.path.splitext(filename)[0]
+    if name in sys.modules:
+        name = f'{name}_{index}'
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _play(run_match: Callable[[list, int | None], dict], client_paths: tuple[str, ...], seed: int | None,
+          connection: Connection) -> None:
+    """
+    Runs in the forked child: loads the clients, plays the match, and sends back (results, error)
+    """
+    try:
+        clients: list = [_load_client(path, index).Client() for index, path in enumerate(client_paths)]
+        connection.send((run_match(clients, seed), None))
+    except BaseException:
+        connection.send((None, traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+class MatchPool:
+    """
+    `MatchPool Class Notes:`
+
+        The MatchPool plays many short matches (e.g., a tournament or a seed sweep) without paying the interpreter
+        startup and the ``game`` package import before every one of them.
+
+        -----
+
+        Warm start:
+            The pool uses the ``forkserver`` start method. The forkserver is started once and imports every module
+            in ``preload`` (the game package, the enums, the tech tables, and the controllers when the launcher's
+            files are on the path); modules that can't be found are skipped. Each match is then played in a new
+            child forked from it, which only has to import the two client files.
+
+            Every match gets its own child, so nothing a client keeps in module or class variables can leak into
+            the next match.
+
+        -----
+
+        Running matches:
+            ``run_match(clients, seed)`` plays one match with the instantiated clients and returns its results
+            (e.g., what the engine writes to results.json). It is sent to the forkserver, so it has to be picklable
+            (a module-level function). Matches are given as (client paths, seed) pairs:
+            ::
+                with MatchPool(play, processes=8) as pool:
+                    for result in pool.run([(('a_client.py', 'b_client.py'), seed) for seed in range(100)]):
+                        print(result.index, result.results, result.error)
+
+            Up to ``processes`` matches run at once and results come back in the order the matches finish. A match
+            that raises, or runs longer than ``timeout`` seconds, comes back with ``error`` set instead of results.
+    """
+
+    def __init__(self, run_match: Callable[[list, int | None], dict], processes: int | None = None,
+                 preload: Iterable[str] = DEFAULT_PRELOAD, timeout: float | None = None,
+                 start_method: str = 'forkserver'):
+        processes = (os.cpu_count() or 1) if processes is None else processes
+        if not isinstance(processes, int) or processes < 1:
+            raise ValueError(f'{self.__class__.__name__}.processes must be a positive int.')
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f'{self.__class__.__name__}.timeout must be a positive number or None.')
+
+        self.run_match: Callable[[list, int | None], dict] = run_match
+        self.processes: int = processes
+        self.timeout: float | None = timeout
+        self.__context = multiprocessing.get_context(start_method)
+        if start_method == 'forkserver':
+            self.__context.set_forkserver_preload(list(preload))
+        self.__running: dict[Connection, tuple] = {}
+        self.closed: bool = False
+
+    def run(self, matches: Iterable[tuple[tuple[str, ...], int | None]]) -> Iterator[MatchResult]:
+        if self.closed:
+            raise RuntimeError(f'{self.__class__.__name__} is closed.')
+
+        pending: Iterator[tuple[int, tuple[tuple[str, ...], int | None]]] = enumerate(matches)
+        exhausted: bool = False
+        while True:
+            while not exhausted and len(self.__running) < self.processes:
+                match: tuple[int, tuple[tuple[str, ...], int | None]] | None = next(pending, None)
+                if match is None:
+                    exhausted = True
+                else:
+                    self.__start(match[0], tuple(match[1][0]), match[1][1])
+            if len(self.__running) == 0:
+                return
+
+            deadline: float | None = None if self.timeout is None else \
+                min(started for _, _, _, _, started in self.__running.values()) + self.timeout
+            remaining: float | None = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            for connection in wait(list(self.__running), remaining):
+                yield self.__finish(connection)
+            if self.timeout is not None:
+                now: float = time.perf_counter()
+                for connection in [connection for connection, (*_, started) in self.__running.items()
+                                   if now - started >= self.timeout]:
+                    yield self.__finish(connection, f'The match did not finish in {self.timeout} seconds.')
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        for connection in list(self.__running):
+            self.__finish(connection, 'The pool was closed.')
+
+    def __start(self, index: int, client_paths: tuple[str, ...], seed: int | None) -> None:
+        parent, child = self.__context.Pipe(duplex=False)
+        process = self.__context.Process(target=_play, args=(self.run_match, client_paths, seed, child), daemon=True)
+        process.start()
+        child.close()
+        self.__running[parent] = (index, client_paths, seed, process, time.perf_counter())
+
+    def __finish(self, connection: Connection, error: str | None = None) -> MatchResult:
+        index, client_paths, seed, process, started = self.__running.pop(connection)
+        seconds: float = time.perf_counter() - started
+        results: dict | None = None
+        if error is None:
+            try:
+                results, error = connection.recv()
+            except EOFError:
+                error = 'The match process exited without sending its results.'
+            process.join(timeout=1)
+        connection.close()
+        if process.is_alive():
+            process.kill()
+            process.join()
+        return MatchResult(index, client_paths, seed, results, error, seconds)
+
+    def __enter__(self) -> MatchPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
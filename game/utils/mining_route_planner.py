@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+
+from game.common.enums import ObjectType
+from game.common.game_object import GameObject
+from game.common.map.adjacency import Adjacency, NOT_WALKABLE
+from game.utils.vector import Vector
+
+UNREACHABLE: int = -1
+
+
+class MiningRoutePlanner:
+    """
+    `MiningRoutePlanner Class Notes:`
+
+        The MiningRoutePlanner plans which ores to mine and in what order, returning to the company station whenever
+        the inventory would be full. This is a capacitated vehicle routing problem, so a fast heuristic is used
+        instead of an exact search:
+
+            1. The walking distance between the base, the start, and every ore is found with one BFS per point on
+               ``GameBoard.adjacency``.
+            2. Clarke-Wright savings: every ore starts in its own trip (base -> ore -> base), and trips are joined
+               in order of how many moves joining them saves, as long as the joined trip fits in the inventory.
+            3. 2-opt: the order of the ores within each trip is improved by reversing segments while that shortens
+               the trip.
+
+        Every step checks the time budget and stops with the best plan found so far once it runs out.
+
+        -----
+
+        Capacity:
+            Each ore mined is assumed to add ``drop_rate`` items. The capacity defaults to the size of an
+            InventoryManager inventory (50 slots), and ``plan()`` takes how many slots are already in use.
+
+        -----
+
+        Result:
+            ``plan()`` returns the positions to visit in order. Each position is either an ore to mine or the base,
+            where the inventory is emptied.
+            ::
+                [ore_3, ore_1, base, ore_4, ore_2, ore_0, base]
+    """
+
+    def __init__(self, world: GameObject, base_position: Vector, capacity: int = 50, drop_rate: int = 1,
+                 movement_speed: int = 1, max_ores: int = 40):
+        if capacity is None or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError(f'{self.__class__.__name__}.capacity must be a positive int.')
+        self.world: GameObject = world
+        self.base_position: Vector = base_position
+        self.capacity: int = capacity
+        self.drop_rate: int = max(drop_rate, 1)
+        self.movement_speed: int = max(movement_speed, 1)
+        self.max_ores: int = max_ores
+
+    def plan(self, start: Vector, load: int = 0, time_budget: float = 0.05) -> list[Vector]:
+        """
+        Returns the ores and base visits in the order they should be visited, starting from the given position with
+        the given amount of inventory slots already in use. Stops improving the plan once time_budget seconds pass.
+        """
+        deadline: float = time.perf_counter() + time_budget
+        adjacency: Adjacency = self.world.adjacency
+        base_node: int = adjacency.node(self.base_position.x, self.base_position.y)
+        start_node: int = adjacency.node(start.x, start.y)
+        if base_node == NOT_WALKABLE or start_node == NOT_WALKABLE:
+            return []
+
+        base_distances: dict[int, int] = self.__distances_from(adjacency, base_node)
+        ores: list[int] = sorted((node for node in self.__ore_nodes(adjacency) if node in base_distances),
+                                 key=base_distances.__getitem__)[:self.max_ores]
+        if len(ores) == 0:
+            return [self.base_position] if load > 0 else []
+
+        # point 0 is the base; point i + 1 is ores[i]
+        points: list[int] = [base_node, *ores]
+        distances: list[list[int]] = []
+        for node in points:
+            if time.perf_counter() > deadline and len(distances) > 0:
+                points = points[:len(distances)]  # out of time; only plan with the ores that have distances
+                distances = [row[:len(points)] for row in distances]
+                break
+            from_node: dict[int, int] = base_distances if node == base_node else self.__distances_from(adjacency, node)
+            distances.append([from_node.get(other, UNREACHABLE) for other in points])
+
+        start_distances: dict[int, int] = self.__distances_from(adjacency, start_node)
+        trips: list[list[int]] = self.__savings(distances, deadline)
+        trips = [self.__two_opt(trip, distances, deadline) for trip in trips]
+
+        route: list[Vector] = []
+        free: int = self.capacity - load
+        for trip in self.__order_trips(trips, points, distances, start_distances, free):
+            if len(trip) * self.drop_rate > free:
+                route.append(self.base_position)
+                free = self.capacity
+            route.extend(Vector(*adjacency.position(points[point])) for point in trip)
+            free -= len(trip) * self.drop_rate
+        route.append(self.base_position)
+        return route
+
+    def estimated_turns(self, start: Vector, route: list[Vector]) -> int:
+        """
+        Returns roughly how many turns the route takes: the moves divided by the movement speed, plus a turn to mine
+        each ore
+        """
+        adjacency: Adjacency = self.world.adjacency
+        turns: int = 0
+        current: Vector = start
+        for position in route:
+            moves: int = self.__distances_from(adjacency, adjacency.node(current.x, current.y)).get(
+                adjacency.node(position.x, position.y), 0)
+            turns += -(-moves // self.movement_speed) + (0 if position == self.base_position else 1)
+            current = position
+        return turns
+
+    def __ore_nodes(self, adjacency: Adjacency) -> list[int]:
+        nodes: list[int] = []
+        for y, row in enumerate(self.world.game_map):
+            for x, tile in enumerate(row):
+                temp: GameObject | None = tile.occupied_by
+                while temp is not None:
+                    if temp.object_type is ObjectType.ORE_OCCUPIABLE_STATION:
+                        if getattr(temp, 'held_item', None) is not None:
+                            nodes.append(adjacency.node(x, y))
+                        break
+                    temp = getattr(temp, 'occupied_by', None)
+        return [node for node in nodes if node != NOT_WALKABLE]
+
+    @staticmethod
+    def __distances_from(adjacency: Adjacency, source: int) -> dict[int, int]:
+        distances: dict[int, int] = {source: 0}
+        queue: deque[int] = deque([source])
+        offsets = adjacency.offsets
+        neighbours = adjacency.neighbours
+        while queue:
+            current: int = queue.popleft()
+            next_distance: int = distances[current] + 1
+            for neighbour in neighbours[offsets[current]:offsets[current + 1]]:
+                if neighbour not in distances:
+                    distances[neighbour] = next_distance
+                    queue.append(neighbour)
+        return distances
+
+    def __savings(self, distances: list[list[int]], deadline: float) -> list[list[int]]:
+        point_count: int = len(distances)
+        reachable: list[int] = [point for point in range(1, point_count) if distances[0][point] != UNREACHABLE]
+        trips: dict[int, list[int]] = {point: [point] for point in reachable}  # trip id -> points
+        trip_of: dict[int, int] = {point: point for point in reachable}
+        max_points: int = max(self.capacity // self.drop_rate, 1)
+
+        savings: list[tuple[int, int, int]] = []
+        for i in reachable:
+            for j in reachable:
+                if i < j and distances[i][j] != UNREACHABLE:
+                    savings.append((distances[0][i] + distances[0][j] - distances[i][j], i, j))
+        savings.sort(reverse=True)
+
+        for saving, i, j in savings:
+            if saving <= 0 or time.perf_counter() > deadline:
+                break
+            trip_i, trip_j = trip_of[i], trip_of[j]
+            if trip_i == trip_j or len(trips[trip_i]) + len(trips[trip_j]) > max_points:
+                continue
+
+            first, second = trips[trip_i], trips[trip_j]
+            # i and j must be at the ends of their trips to be joined next to each other
+            if first[-1] != i:
+                if first[0] != i:
+                    continue
+                first.reverse()
+            if second[0] != j:
+                if second[-1] != j:
+                    continue
+                second.reverse()
+
+            first.extend(second)
+            for point in second:
+                trip_of[point] = trip_i
+            del trips[trip_j]
+
+        return list(trips.values())
+
+    @staticmethod
+    def __two_opt(trip: list[int], distances: list[list[int]], deadline: float) -> list[int]:
+        def length(points: list[int]) -> int:
+            full: list[int] = [0, *points, 0]
+            return sum(distances[a][b] for a, b in zip(full, full[1:]))
+
+        if len(trip) < 3 or any(distances[a][b] == UNREACHABLE for a, b in zip(trip, trip[1:])):
+            return trip
+
+        best: list[int] = trip
+        best_length: int = length(trip)
+        improved: bool = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for i in range(len(best) - 1):
+                for j in range(i + 2, len(best) + 1):
+                    candidate: list[int] = best[:i] + best[i:j][::-1] + best[j:]
+                    if any(distances[a][b] == UNREACHABLE for a, b in zip(candidate, candidate[1:])):
+                        continue
+                    candidate_length: int = length(candidate)
+                    if candidate_length < best_length:
+                        best, best_length, improved = candidate, candidate_length, True
+        return best
+
+    def __order_trips(self, trips: list[list[int]], points: list[int], distances: list[list[int]],
+                      start_distances: dict[int, int], free: int) -> list[list[int]]:
+        """
+        Puts first the trip that is cheapest to start from the avatar's position instead of the base, if it fits in
+        the inventory space that is left
+        """
+        def from_start(point: int) -> float:
+            # an ore the avatar can't reach from where it stands is never closer than one it can
+            return start_distances.get(points[point], math.inf)
+
+        def extra_moves(trip: list[int]) -> float:
+            return min(from_start(trip[0]), from_start(trip[-1])) - distances[0][trip[0]]
+
+        candidates: list[list[int]] = [trip for trip in trips if len(trip) * self.drop_rate <= free
+                                       and min(from_start(trip[0]), from_start(trip[-1])) != math.inf]
+        if len(candidates) == 0:
+            return trips
+
+        first: list[int] = min(candidates, key=extra_moves)
+        if from_start(first[-1]) < from_start(first[0]):
+            first.reverse()
+        return [first, *(trip for trip in trips if trip is not first)]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Iterable
+
+import numpy as np
+
+
+def perlin_gradients(seed: int, columns: int, rows: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The gradient of every lattice point, drawn the same way as the ``perlin-noise`` package: a Random seeded with
+    ``seed * hash`` per point, where the hash of (x, y) is ``max(1, abs(x + 10 * y + 1))``. Returns the x and y
+    parts as (rows, columns) arrays.
+    """
+    gradient_x: np.ndarray = np.empty((rows, columns), dtype=np.float64)
+    gradient_y: np.ndarray = np.empty((rows, columns), dtype=np.float64)
+    for y in range(rows):
+        for x in range(columns):
+            rng: random.Random = random.Random(seed * max(1, abs(x + 10 * y + 1)))
+            gradient_x[y, x] = rng.uniform(-1, 1)
+            gradient_y[y, x] = rng.uniform(-1, 1)
+    return gradient_x, gradient_y
+
+
+def _fade(distances: np.ndarray) -> np.ndarray:
+    """
+    The smoothstep weight of each distance. It only depends on the x or the y distance, so it's computed once per
+    column and row with math.pow, which rounds the same as the package (np.power doesn't always).
+    """
+    values: list[float] = [1 - abs(distance) for distance in distances.ravel().tolist()]
+    return np.array([6 * math.pow(value, 5) - 15 * math.pow(value, 4) + 10 * math.pow(value, 3) for value in values],
+                    dtype=np.float64).reshape(distances.shape)
+
+
+def perlin_grids(seeds: Iterable[int | None], width: int, height: int, octaves: float = 8) -> np.ndarray:
+    """
+    Evaluates 2D Perlin noise at ``(x / width, y / height)`` for every tile of a width x height map, for every seed,
+    in one NumPy pass. Returns an array with the shape (len(seeds), height, width), indexed ``[seed][y][x]``.
+
+    The values are bit-identical to calling ``PerlinNoise(octaves, seed)([x / width, y / height])`` from the
+    ``perlin-noise`` package for each tile: the gradients are drawn the same way and the four corners are added in
+    the same order. Like that package, a seed of None or 0 is replaced with a random one.
+    """
+    if octaves <= 0:
+        raise ValueError('octaves must be a positive number.')
+    if width < 1 or height < 1:
+        raise ValueError('width and height must be positive ints.')
+    seeds = [seed if seed else random.randint(1, 10 ** 5) for seed in seeds]
+
+    coordinates_x: np.ndarray = np.arange(width) / width * octaves
+    coordinates_y: np.ndarray = (np.arange(height) / height * octaves)[:, np.newaxis]
+    corner_x: np.ndarray = np.floor(coordinates_x).astype(np.intp)
+    corner_y: np.ndarray = np.floor(coordinates_y).astype(np.intp)
+    columns: int = int(corner_x.max()) + 2
+    rows: int = int(corner_y.max()) + 2
+
+    gradients: list[tuple[np.ndarray, np.ndarray]] = [perlin_gradients(seed, columns, rows) for seed in seeds]
+    gradient_x: np.ndarray = np.stack([gradient[0] for gradient in gradients]) if gradients \
+        else np.empty((0, rows, columns))
+    gradient_y: np.ndarray = np.stack([gradient[1] for gradient in gradients]) if gradients \
+        else np.empty((0, rows, columns))
+
+    noise: np.ndarray = np.zeros((len(seeds), height, width), dtype=np.float64)
+    # same corner order as the package: (x0, y0), (x0, y1), (x1, y0), (x1, y1)
+    for offset_x in (0, 1):
+        for offset_y in (0, 1):
+            lattice_x: np.ndarray = corner_x + offset_x
+            lattice_y: np.ndarray = corner_y + offset_y
+            distance_x: np.ndarray = coordinates_x - lattice_x
+            distance_y: np.ndarray = coordinates_y - lattice_y
+            weight: np.ndarray = _fade(distance_x) * _fade(distance_y)
+            dot: np.ndarray = gradient_x[:, lattice_y, lattice_x] * distance_x \
+                + gradient_y[:, lattice_y, lattice_x] * distance_y
+            noise += weight * dot
+    return noise
+
+
+def perlin_grid(seed: int | None, width: int, height: int, octaves: float = 8) -> np.ndarray:
+    """
+    ``perlin_grids()`` for a single seed; returns a (height, width) array
+    """
+    return perlin_grids([seed], width, height, octaves)[0]
+
+
+def normalize(weights: np.ndarray) -> np.ndarray:
+    """
+    Scales the last two axes of a weight map (or a stack of them) to the range [0..1], keeping their proportions
+    """
+    low: np.ndarray = weights.min(axis=(-2, -1), keepdims=True)
+    high: np.ndarray = weights.max(axis=(-2, -1), keepdims=True)
+    return (weights - low) / (high - low)
+
+
+def ore_layouts(noise: np.ndarray, ore_weights: np.ndarray, ore_count: int) -> np.ndarray:
+    """
+    Picks the ore tiles from noise made by ``perlin_grids()``, the same way the collectable generator does: the
+    normalized noise is multiplied by the ore weight map and normalized again, and every tile at or above the
+    ore_count-th highest value gets an ore. Returns a bool array with the same shape as ``noise``.
+    """
+    weights: np.ndarray = normalize(np.asarray(ore_weights, dtype=np.float64) * normalize(noise))
+    flat: np.ndarray = weights.reshape(*weights.shape[:-2], -1)
+    threshold: np.ndarray = np.partition(flat, -ore_count, axis=-1)[..., -ore_count]
+    return weights >= threshold[..., np.newaxis, np.newaxis]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from game.common.avatar import Avatar
+from game.common.enums import ActionType, Company, ObjectType
+from game.common.game_object import GameObject
+from game.common.map.change_set import ChangeSet
+from game.common.map.game_board import GameBoard
+from game.common.map.observation_encoder import PLANE_COUNT, ObservationEncoder
+from game.quarry_rush.station.company_station import ChurchStation, CompanyStation, TuringStation
+from game.quarry_rush.station.ore_occupiable_station import OreOccupiableStation
+from game.utils.vector import Vector
+from game.utils.vector_env import GameEnv
+
+MOVES: dict[ActionType, tuple[int, int]] = {
+    ActionType.MOVE_UP: (0, -1),
+    ActionType.MOVE_DOWN: (0, 1),
+    ActionType.MOVE_LEFT: (-1, 0),
+    ActionType.MOVE_RIGHT: (1, 0),
+}
+
+
+class QuarryRushEnv(GameEnv):
+    """
+    `QuarryRushEnv Class Notes:`
+
+        A single avatar mining on a walled map: its company station is in the top left corner and ``ore_count`` ore
+        stations are spread over the rest of the map by the seed. The observation is the avatar's
+        ObservationEncoder planes, written straight into the VectorEnv's row:
+        ::
+            env = VectorEnv(QuarryRushEnv, 8, observation_shape=QuarryRushEnv().observation_shape)
+
+        -----
+
+        Turns:
+            A turn follows the master controller's rules for one client: a list that starts with a move keeps up to
+            ``movement_speed`` moves, anything else keeps only its first action, and every turn ends with
+            INTERACT_CENTER, which cashes in the inventory on the avatar's own station. MINE mines the ore station
+            the avatar is standing on through the GameBoard's InventoryManager.
+
+        -----
+
+        Rewards:
+            The reward is the score the avatar gained in the turn. The game is done after ``max_turns`` turns. The
+            info holds the turn, the score, the science points, and the encoder's scalars.
+    """
+
+    def __init__(self, map_size: Vector = Vector(14, 14), ore_count: int = 20, company: Company = Company.CHURCH,
+                 max_turns: int = 200):
+        if (map_size.x - 2) * (map_size.y - 2) <= ore_count:
+            raise ValueError(f'{self.__class__.__name__}.map_size is too small for {ore_count} ore stations.')
+        self.map_size: Vector = map_size
+        self.ore_count: int = ore_count
+        self.company: Company = company
+        self.max_turns: int = max_turns
+        self.world: GameBoard | None = None
+        self.avatar: Avatar | None = None
+        self.turn: int = 0
+        self.__encoder: ObservationEncoder | None = None
+
+    @property
+    def observation_shape(self) -> tuple[int, int, int]:
+        return PLANE_COUNT, self.map_size.y, self.map_size.x
+
+    def reset(self, seed: int | None, observation: np.ndarray) -> None:
+        rng: random.Random = random.Random(seed)
+        base: Vector = Vector(1, 1)
+        inside: list[Vector] = [Vector(x, y) for y in range(1, self.map_size.y - 1)
+                                for x in range(1, self.map_size.x - 1) if (x, y) != (base.x, base.y)]
+        ores: tuple[Vector, ...] = tuple(rng.sample(inside, k=self.ore_count))
+
+        self.avatar = Avatar(self.company, base)
+        station: GameObject = ChurchStation() if self.company is Company.CHURCH else TuringStation()
+        self.world = GameBoard(rng.randrange(1 << 30), self.map_size, {
+            (base,): [station, self.avatar],
+            ores: [OreOccupiableStation(vector, rng.random()) for vector in ores],
+        }, walled=True)
+        self.world.generate_map()
+        self.turn = 0
+
+        self.__encoder = ObservationEncoder(self.company, self.map_size.x, self.map_size.y, planes=observation)
+        self.world.collect_changes(self.turn)
+        self.__encoder.encode(self.world, self.avatar)
+
+    def step(self, actions: list[ActionType], observation: np.ndarray) -> tuple[float, bool, dict]:
+        if self.world is None:
+            raise RuntimeError(f'{self.__class__.__name__}.step needs reset to be run first.')
+        score: int = self.avatar.score
+
+        if len(actions) > 0 and actions[0] in MOVES:
+            actions = [action for action in actions if action in MOVES][:self.avatar.movement_speed]
+        else:
+            actions = actions[:1]
+        for action in [*actions, ActionType.INTERACT_CENTER]:
+            if action in MOVES:
+                self.__move(*MOVES[action])
+            elif action is ActionType.MINE:
+                self.__mine()
+            elif action is ActionType.INTERACT_CENTER:
+                self.__cash_in()
+
+        self.world.advance_timers()
+        self.turn += 1
+        changes: ChangeSet = self.world.collect_changes(self.turn)
+        self.__encoder.encode(self.world, self.avatar, changed=None if changes.full else changes.tiles)
+        info: dict = {
+            'turn': self.turn,
+            'score': self.avatar.score,
+            'science_points': self.avatar.science_points,
+            'scalars': self.__encoder.scalars.copy(),
+        }
+        return float(self.avatar.score - score), self.turn >= self.max_turns, info
+
+    def __top(self, x: int, y: int) -> GameObject:
+        # the last object in the tile's stack that can hold another
+        temp: GameObject = self.world.game_map[y][x]
+        while hasattr(temp.occupied_by, 'occupied_by'):
+            temp = temp.occupied_by
+        return temp
+
+    def __move(self, dx: int, dy: int) -> None:
+        position: Vector = self.avatar.position
+        target: GameObject = self.__top(position.x + dx, position.y + dy)
+        if target.occupied_by is not None:
+            return  # a wall, or something else the avatar can't stand on
+
+        target.occupied_by = self.avatar
+        self.__top(position.x, position.y).occupied_by = None
+        self.avatar.position = Vector(position.x + dx, position.y + dy)
+
+    def __mine(self) -> None:
+        tile: GameObject = self.world.game_map[self.avatar.position.y][self.avatar.position.x]
+        station: GameObject | None = tile.occupied_by
+        if station is None or station.object_type is not ObjectType.ORE_OCCUPIABLE_STATION:
+            return
+        station.take_action(self.avatar, self.world.inventory_manager)
+        station.remove_from_game_board(tile)
+
+    def __cash_in(self) -> None:
+        station: GameObject | None = self.world.game_map[self.avatar.position.y][self.avatar.position.x].occupied_by
+        if isinstance(station, CompanyStation) and station.company is self.company:
+            station.take_action(self.avatar, self.world.inventory_manager)
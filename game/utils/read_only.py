@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterator, TypeVar
+
+from game.common.game_object import GameObject
+from game.common.map.sparse_game_map import SparseGameMap, SparseRow
+
+T = TypeVar('T')
+
+# view class for every GameObject class a view was made of
+_VIEW_CLASSES: dict[type, type] = {}
+
+
+def read_only_view(value: T) -> T:
+    """
+    Returns a read-only view of a GameObject (e.g., a GameBoard, Avatar, or InventoryManager), SparseGameMap, list,
+    or dict. Other values are returned as they are.
+
+    The view of a GameObject is an instance of a subclass of its class that shares the original's ``__dict__``, so it
+    is made in O(1) without copying anything, always shows the current state, and still passes isinstance checks.
+    Every write goes through ``__setattr__``, the same path as the property setters, and raises an AttributeError;
+    methods called on the view that would change the original raise as well. Anything read from a view is wrapped
+    the same way, so ``view.game_map[y][x].occupied_by`` is read-only too.
+
+    The views of lists and dicts report the original's class as their ``__class__``, so ``isinstance(view, list)``
+    (e.g., in the GameBoard.game_map setter) and ``isinstance(view, dict)`` pass as well.
+    """
+    if isinstance(value, ReadOnly):
+        return value
+    if isinstance(value, (GameObject, SparseGameMap, SparseRow)):
+        view: GameObject = object.__new__(_view_class(type(value)))
+        object.__setattr__(view, '__dict__', value.__dict__)
+        return view
+    if isinstance(value, (list, tuple)):
+        return ReadOnlySequence(value)
+    if isinstance(value, dict):
+        return ReadOnlyMapping(value)
+    return value
+
+
+class ReadOnly:
+    """
+    Marks a read-only view. Views of GameObjects also inherit from the original class.
+    """
+    __slots__ = ()
+
+
+def _reject(self, name: str, *args) -> None:
+    raise AttributeError(f'{type(self).__name__} is a read-only view; {name.split("__")[-1]} cannot be changed.')
+
+
+def _view_class(cls: type) -> type:
+    view_class: type | None = _VIEW_CLASSES.get(cls)
+    if view_class is not None:
+        return view_class
+
+    def __getattribute__(self, name: str) -> Any:
+        result: Any = cls.__getattribute__(self, name)
+        if name.startswith('__') and name.endswith('__') and name != '__dict__':
+            return result
+        return read_only_view(result)
+
+    view_class = type(f'ReadOnly{cls.__name__}', (ReadOnly, cls), {
+        '__getattribute__': __getattribute__,
+        '__setattr__': _reject,
+        '__delattr__': _reject,
+    })
+    _VIEW_CLASSES[cls] = view_class
+    return view_class
+
+
+class ReadOnlySequence(ReadOnly, Sequence):
+    """
+    A read-only view of a list; items are wrapped when they are read
+    """
+    __slots__ = ('__items',)
+
+    def __init__(self, items: list | tuple):
+        object.__setattr__(self, '_ReadOnlySequence__items', items)
+
+    @property
+    def __class__(self) -> type:
+        return type(self.__items)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return read_only_view(self.__items[index])
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator:
+        return (read_only_view(item) for item in self.__items)
+
+    def __contains__(self, item: Any) -> bool:
+        return any(item is original or item == original for original in self.__items)
+
+    def __eq__(self, other: object) -> bool:
+        return list(self.__items) == (list(other.__items) if isinstance(other, ReadOnlySequence) else other)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.__items!r})'
+
+    __setattr__ = _reject
+    __hash__ = None
+
+
+class ReadOnlyMapping(ReadOnly, Mapping):
+    """
+    A read-only view of a dict; values are wrapped when they are read
+    """
+    __slots__ = ('__items',)
+
+    def __init__(self, items: dict):
+        object.__setattr__(self, '_ReadOnlyMapping__items', items)
+
+    @property
+    def __class__(self) -> type:
+        return type(self.__items)
+
+    def __getitem__(self, key: Any) -> Any:
+        return read_only_view(self.__items[key])
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__items)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.__items!r})'
+
+    __setattr__ = _reject
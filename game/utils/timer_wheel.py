@@ -0,0 +1,90 @@
+class TimerWheel:
+    """
+    `TimerWheel Class Notes:`
+
+        The TimerWheel is a turn-indexed scheduler used to keep track of anything with a fuse (e.g., Dynamite or the
+        cooldown of an ActiveAbility). Instead of decrementing every fuse at the end of each turn, an object is
+        scheduled once with the turn it expires on, and only the objects expiring on the current turn are returned
+        when the wheel is advanced.
+
+        -----
+
+        Slots:
+            The wheel is a ring of slots (lists). An object expiring on turn ``t`` is stored in slot
+            ``t % slot_count``. If an expiry is further away than ``slot_count`` turns, the object will sit in its slot
+            for more than one lap; it is only returned on the lap that matches its expiry turn.
+
+            Example with a slot_count of 4 on turn 0:
+            ::
+                schedule(2, dynamite_0)  -->  slot 2
+                schedule(6, dynamite_1)  -->  slot 2 (second lap)
+
+                advance() x2  -->  turn 2 returns [dynamite_0]
+                advance() x4  -->  turn 6 returns [dynamite_1]
+
+        -----
+
+        Derived fuses:
+            Objects bound to a TimerWheel can compute their remaining fuse as ``expiry_turn - turn`` without being
+            touched every turn. Refer to active_ability.py and dynamite.py to see how this is used.
+    """
+
+    def __init__(self, turn: int = 0, slot_count: int = 8):
+        if slot_count is None or not isinstance(slot_count, int) or slot_count < 1:
+            raise ValueError(f'{self.__class__.__name__}.slot_count must be a positive int.')
+        self.turn: int = turn
+        self.__slots: list[list[tuple[int, object]]] = [[] for _ in range(slot_count)]
+
+    @property
+    def turn(self) -> int:
+        return self.__turn
+
+    @turn.setter
+    def turn(self, turn: int) -> None:
+        if turn is None or not isinstance(turn, int):
+            raise ValueError(f'{self.__class__.__name__}.turn must be an int.')
+        if turn < 0:
+            raise ValueError(f'{self.__class__.__name__}.turn must be a non-negative int.')
+        self.__turn: int = turn
+
+    def schedule(self, expiry_turn: int, timer: object) -> None:
+        """
+        Schedules the given object to be returned by ``advance()`` on the given turn. The expiry turn must be after
+        the current turn.
+        """
+        if expiry_turn is None or not isinstance(expiry_turn, int):
+            raise ValueError(f'{self.__class__.__name__}.schedule expiry_turn must be an int.')
+        if expiry_turn <= self.turn:
+            raise ValueError(f'{self.__class__.__name__}.schedule expiry_turn must be after the current turn.')
+        self.__slots[expiry_turn % len(self.__slots)].append((expiry_turn, timer))
+
+    def cancel(self, timer: object) -> bool:
+        """
+        Removes the given object from the wheel. Returns True if it was scheduled, False otherwise.
+        """
+        for slot in self.__slots:
+            for index, (_, scheduled) in enumerate(slot):
+                if scheduled is timer:
+                    del slot[index]
+                    return True
+        return False
+
+    def advance(self) -> list[object]:
+        """
+        Moves the wheel forward one turn and returns every object that expires on the new turn. Only the slot for
+        the new turn is looked at.
+        """
+        self.turn += 1
+        slot: list[tuple[int, object]] = self.__slots[self.turn % len(self.__slots)]
+        expired: list[object] = [timer for expiry_turn, timer in slot if expiry_turn == self.turn]
+
+        if len(expired) == len(slot):
+            slot.clear()
+        else:
+            # keep the objects that expire on a later lap of the wheel
+            slot[:] = [(expiry_turn, timer) for expiry_turn, timer in slot if expiry_turn != self.turn]
+
+        return expired
+
+    def __len__(self) -> int:
+        return sum(map(len, self.__slots))
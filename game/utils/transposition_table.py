@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from array import array
+from enum import Enum
+from typing import NamedTuple, SupportsInt
+
+from game.common.enums import ActionType
+
+EMPTY: int = 0
+MASK_64: int = (1 << 64) - 1
+
+
+class Bound(Enum):
+    EXACT = 1  # the value is the real value of the state
+    LOWER = 2  # the search failed high; the real value is at least the value
+    UPPER = 3  # the search failed low; the real value is at most the value
+
+
+class TableEntry(NamedTuple):
+    value: float
+    depth: int
+    best_action: ActionType | None
+    bound: Bound
+
+
+class TranspositionTable:
+    """
+    `TranspositionTable Class Notes:`
+
+        A search that tries MOVE_UP then MOVE_RIGHT reaches the same state as one that tries MOVE_RIGHT then MOVE_UP.
+        The TranspositionTable remembers what was found for a state, keyed by a 64-bit state hash (an int, or
+        anything with ``__int__`` like ``GameBoard.zobrist``), so the second time the state is reached its value and
+        best action can be reused.
+
+        -----
+
+        Memory:
+            Every field is kept in its own preallocated array with one slot per entry, so the table never grows
+            past the size it was created with (21 bytes per entry). The size is rounded up to a power of 2.
+
+        -----
+
+        Open addressing:
+            A key is stored in one of ``probe_length`` slots starting at ``key & (size - 1)``. When all of them are
+            taken by other keys, the replacement policy picks which one to overwrite:
+
+                1. an entry left over from an earlier search (see ``new_search()``)
+                2. otherwise, the entry searched to the lowest depth
+
+            An entry for the same key is only overwritten by a search at least as deep, or by an exact value.
+
+        -----
+
+        Example:
+            ::
+                entry = table.probe(key)
+                if entry is not None and entry.depth >= depth:
+                    ...  # use entry.value according to entry.bound
+                ...
+                table.store(key, value, depth, best_action, Bound.EXACT)
+    """
+
+    def __init__(self, size: int = 1 << 16, probe_length: int = 4):
+        if size is None or not isinstance(size, int) or size < 1:
+            raise ValueError(f'{self.__class__.__name__}.size must be a positive int.')
+        if probe_length is None or not isinstance(probe_length, int) or probe_length < 1:
+            raise ValueError(f'{self.__class__.__name__}.probe_length must be a positive int.')
+
+        self.size: int = 1 << (size - 1).bit_length()
+        self.probe_length: int = min(probe_length, self.size)
+        self.__mask: int = self.size - 1
+        self.__generation: int = 0
+
+        self.__keys: array = array('Q', [EMPTY]) * self.size
+        self.__values: array = array('d', [0.0]) * self.size
+        self.__depths: array = array('h', [0]) * self.size
+        self.__actions: array = array('B', [0]) * self.size  # ActionType.value, or 0 for None
+        self.__bounds: array = array('B', [0]) * self.size
+        self.__generations: array = array('B', [0]) * self.size
+        self.__count: int = 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(table.itemsize * self.size for table in (self.__keys, self.__values, self.__depths,
+                                                            self.__actions, self.__bounds, self.__generations))
+
+    def new_search(self) -> None:
+        """
+        Call this at the start of every turn; entries from earlier turns are kept, but are replaced first
+        """
+        self.__generation = (self.__generation + 1) & 0xFF
+
+    def clear(self) -> None:
+        for index in range(self.size):
+            self.__keys[index] = EMPTY
+        self.__count = 0
+
+    def probe(self, key: SupportsInt) -> TableEntry | None:
+        key = self.__stored_key(key)
+        keys: array = self.__keys
+        for probe in range(self.probe_length):
+            index: int = (key + probe) & self.__mask
+            if keys[index] == key:
+                action: int = self.__actions[index]
+                return TableEntry(self.__values[index], self.__depths[index],
+                                  ActionType(action) if action else None, Bound(self.__bounds[index]))
+            if keys[index] == EMPTY:
+                return None
+        return None
+
+    def best_action(self, key: SupportsInt) -> ActionType | None:
+        """
+        Returns the best action stored for the key, to be searched first
+        """
+        entry: TableEntry | None = self.probe(key)
+        return None if entry is None else entry.best_action
+
+    def store(self, key: SupportsInt, value: float, depth: int, best_action: ActionType | None, bound: Bound) -> None:
+        key = self.__stored_key(key)
+        keys: array = self.__keys
+        depths: array = self.__depths
+        generations: array = self.__generations
+        replace: int = -1
+        replace_score: int = 1 << 30
+
+        for probe in range(self.probe_length):
+            index: int = (key + probe) & self.__mask
+            if keys[index] == key:
+                if depth < depths[index] and bound is not Bound.EXACT and generations[index] == self.__generation:
+                    return  # a deeper result from this search is already stored
+                if best_action is None and self.__actions[index]:
+                    best_action = ActionType(self.__actions[index])  # keep the move ordering hint
+                replace = index
+                break
+            if keys[index] == EMPTY:
+                replace = index
+                self.__count += 1
+                break
+            # older searches are replaced first, then shallower entries
+            score: int = depths[index] + (0 if generations[index] != self.__generation else 1 << 16)
+            if score < replace_score:
+                replace, replace_score = index, score
+
+        keys[replace] = key
+        self.__values[replace] = value
+        depths[replace] = depth
+        self.__actions[replace] = 0 if best_action is None else best_action.value
+        self.__bounds[replace] = bound.value
+        generations[replace] = self.__generation
+
+    @staticmethod
+    def __stored_key(key: SupportsInt) -> int:
+        key = int(key) & MASK_64  # a ZobristHash is used by its value
+        return key if key != EMPTY else 1  # 0 marks an empty slot
@@ -118,7 +118,7 @@ class Vector(GameObject):
         ...
 
     def __str__(self) -> str:
-        ...
+        return f"Coordinates: ({self.x}, {self.y})"
 
     def __add__(self, other: 'Vector') -> 'Vector':
         return Vector(self.x + other.x, self.y + other.y)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+import numpy as np
+
+from game.common.enums import ActionType
+
+
+class GameEnv:
+    """
+    `GameEnv Class Notes:`
+
+        A GameEnv runs a single game for a VectorEnv. Subclasses set up a GameBoard, Avatars and an InventoryManager
+        in ``reset()`` and advance them by one turn in ``step()``; see QuarryRushEnv in quarry_rush_env.py.
+
+        Instead of returning an observation, both methods write it into the given array, which is the env's slice
+        of the VectorEnv's shared memory; nothing has to be copied or pickled to get it back to the trainer.
+    """
+
+    def reset(self, seed: int | None, observation: np.ndarray) -> None:
+        raise NotImplementedError("Implement this in subclass")
+
+    def step(self, actions: list[ActionType], observation: np.ndarray) -> tuple[float, bool, dict]:
+        """
+        Takes one turn with the given actions and returns (reward, done, info)
+        """
+        raise NotImplementedError("Implement this in subclass")
+
+    def close(self) -> None:
+        pass
+
+
+class VectorEnv:
+    """
+    `VectorEnv Class Notes:`
+
+        The VectorEnv runs N games at once, each in its own worker process that stays alive between calls. It uses
+        the usual ``reset(seeds)`` / ``step(actions)`` API:
+        ::
+            env = VectorEnv(MyGameEnv, 8, observation_shape=(12, 14, 14))
+            observations = env.reset(seeds=range(8))
+            observations, rewards, dones, infos = env.step([[ActionType.MINE]] * 8)
+
+        -----
+
+        Shared memory:
+            The observations of every game are one (N, *observation_shape) array in a SharedMemory block. Each
+            worker writes its game's observation straight into its row, and only the small commands, rewards and
+            done flags go through the pipes. The returned observations are a view of the block, so they are
+            overwritten by the next call; copy them to keep them.
+
+        -----
+
+        Resets:
+            A game that is done is reset by its worker in the same step (with a seed of None), so every row always
+            holds an observation of a running game. Its info gets ``'terminal': True`` and a copy of the last
+            observation of the finished game as ``'final_observation'``.
+
+        env_factory is called in the worker process, so it has to be picklable (e.g., a class or a module-level
+        function).
+    """
+
+    def __init__(self, env_factory: Callable[[], GameEnv], num_envs: int, observation_shape: tuple[int, ...],
+                 dtype: Any = np.float32, start_method: str | None = None):
+        if num_envs is None or not isinstance(num_envs, int) or num_envs < 1:
+            raise ValueError(f'{self.__class__.__name__}.num_envs must be a positive int.')
+
+        self.num_envs: int = num_envs
+        self.observation_shape: tuple[int, ...] = tuple(observation_shape)
+        self.dtype: np.dtype = np.dtype(dtype)
+
+        shape: tuple[int, ...] = (num_envs, *self.observation_shape)
+        self.__memory: SharedMemory = SharedMemory(create=True, size=max(int(np.prod(shape)) * self.dtype.itemsize, 1))
+        self.observations: np.ndarray = np.ndarray(shape, dtype=self.dtype, buffer=self.__memory.buf)
+        self.observations.fill(0)
+
+        context = multiprocessing.get_context(start_method)
+        self.__connections: list[Connection] = []
+        self.__processes: list = []
+        for index in range(num_envs):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, daemon=True,
+                                      args=(env_factory, child, self.__memory.name, index, shape, self.dtype.str))
+            process.start()
+            child.close()
+            self.__connections.append(parent)
+            self.__processes.append(process)
+        self.closed: bool = False
+
+    def reset(self, seeds: list[int | None] | None = None) -> np.ndarray:
+        seeds = [None] * self.num_envs if seeds is None else list(seeds)
+        if len(seeds) != self.num_envs:
+            raise ValueError(f'{self.__class__.__name__}.reset needs one seed per env.')
+
+        for connection, seed in zip(self.__connections, seeds):
+            connection.send(('reset', seed))
+        for connection in self.__connections:
+            self.__receive(connection)
+        return self.observations
+
+    def step(self, actions: list[list[ActionType]]) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        if len(actions) != self.num_envs:
+            raise ValueError(f'{self.__class__.__name__}.step needs one list of actions per env.')
+
+        for connection, env_actions in zip(self.__connections, actions):
+            connection.send(('step', env_actions))
+
+        rewards: np.ndarray = np.zeros(self.num_envs, dtype=np.float32)
+        dones: np.ndarray = np.zeros(self.num_envs, dtype=np.bool_)
+        infos: list[dict] = []
+        for index, connection in enumerate(self.__connections):
+            rewards[index], dones[index], info = self.__receive(connection)
+            infos.append(info)
+        return self.observations, rewards, dones, infos
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        for connection in self.__connections:
+            try:
+                connection.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.__processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        self.observations = self.observations.copy()  # the view would point at unmapped memory once it's closed
+        self.__memory.close()
+        self.__memory.unlink()
+
+    def __enter__(self) -> VectorEnv:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if not getattr(self, 'closed', True):
+            self.close()
+
+    def __receive(self, connection: Connection) -> Any:
+        try:
+            status, result = connection.recv()
+        except EOFError:
+            status, result = 'error', 'the worker process exited'
+        if status == 'error':
+            self.close()
+            raise RuntimeError(f'{self.__class__.__name__} worker failed:\n{result}')
+        return result
+
+
+def _worker(env_factory: Callable[[], GameEnv], connection: Connection, memory_name: str, index: int,
+            shape: tuple[int, ...], dtype: str) -> None:
+    import traceback
+
+    memory: SharedMemory = SharedMemory(name=memory_name)
+    observation: np.ndarray = np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf)[index]
+    env: GameEnv | None = None
+    try:
+        env = env_factory()
+        while True:
+            command, data = connection.recv()
+            try:
+                match command:
+                    case 'reset':
+                        env.reset(data, observation)
+                        connection.send(('ok', None))
+                    case 'step':
+                        reward, done, info = env.step(data, observation)
+                        if done:
+                            # the reset writes over the row, so the finished game's observation goes in the info
+                            info = {**info, 'terminal': True, 'final_observation': observation.copy()}
+                            env.reset(None, observation)
+                        connection.send(('ok', (reward, done, info)))
+                    case 'close':
+                        break
+            except Exception:
+                connection.send(('error', traceback.format_exc()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if env is not None:
+            env.close()
+        del observation
+        memory.close()